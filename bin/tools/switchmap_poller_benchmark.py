@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Switchmap-NG poller benchmark script."""
+
+# Standard libraries
+import sys
+import os
+import argparse
+import json
+
+# Try to create a working PYTHONPATH
+_SYS_DIRECTORY = os.path.dirname(os.path.realpath(__file__))
+_BIN_DIRECTORY = os.path.abspath(os.path.join(_SYS_DIRECTORY, os.pardir))
+_ROOT_DIRECTORY = os.path.abspath(os.path.join(_BIN_DIRECTORY, os.pardir))
+if (
+    _SYS_DIRECTORY.endswith("{0}switchmap-ng{0}bin{0}tools".format(os.sep))
+    is True
+):
+    sys.path.append(_ROOT_DIRECTORY)
+else:
+    print(
+        'This script is not installed in the "switchmap-ng{0}bin{0}tools" '
+        "directory. Please fix.".format(os.sep)
+    )
+    sys.exit(2)
+
+# Import app libraries
+from switchmap.poller import benchmark
+from switchmap.poller.snmp import simulator
+
+
+def main():
+    """Benchmark the poller against simulated devices.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+    # Header for the help menu of the application
+    parser = argparse.ArgumentParser(
+        description="""\
+This script polls simulated devices created from a recording of a real \
+device poll (See switchmap_poller_test.py --record). It reports the \
+number of devices polled per second, the latency percentiles of device \
+polls, and the time spent in each stage of the poll, MIB query class and \
+SNMP query.""",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+
+    # CLI arguments
+    parser.add_argument(
+        "--capture",
+        type=str,
+        required=True,
+        help="File containing the recorded poll of a device.",
+    )
+    parser.add_argument(
+        "--devices",
+        type=int,
+        default=100,
+        help="Number of simulated devices to poll. Default 100.",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed of the random values of the simulated devices.",
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0,
+        help="Seconds each simulated SNMP request takes. Default 0.",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        help="JSON file to which the results are written.",
+    )
+    args = parser.parse_args()
+
+    # Run
+    results = benchmark.run(
+        simulator.load(args.capture),
+        args.devices,
+        seed=args.seed,
+        latency=args.latency,
+    )
+
+    # Report
+    if bool(args.output) is True:
+        benchmark.write(results, args.output)
+    else:
+        print(json.dumps(results, indent=4, sort_keys=True))
+
+
+if __name__ == "__main__":
+    main()
@@ -48,14 +48,34 @@ polling data for the host will be displayed on the screen.""",
     # CLI argument for starting
     parser.add_argument(
         "--hostname",
-        required=True,
         type=str,
         help="Hostname to test for pollability.",
     )
+    parser.add_argument(
+        "--record",
+        type=str,
+        help="""\
+File to which the SNMP values returned by the device are recorded, so \
+that the poll can be replayed without the device.""",
+    )
+    parser.add_argument(
+        "--breakers",
+        action="store_true",
+        help="Show the devices that are failing to poll and are backed off.",
+    )
     args = parser.parse_args()
 
+    # Show the circuit breakers
+    if args.breakers is True:
+        poll.cli_breakers()
+
     # Poll
-    poll.cli_device(args.hostname)
+    elif bool(args.hostname) is True:
+        poll.cli_device(args.hostname, record=args.record)
+
+    else:
+        parser.print_help()
+        sys.exit(2)
 
 
 if __name__ == "__main__":
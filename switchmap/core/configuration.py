@@ -322,6 +322,26 @@ class ConfigAPIClient(ConfigCore):
                 result = None
         return result
 
+    def server_pool_size(self):
+        """Get server_pool_size.
+
+        Args:
+            None
+
+        Returns:
+            result: Maximum number of connections to the server kept open
+                by each process for reuse
+
+        """
+        # Get result
+        try:
+            result = int(self._config_api_client.get("server_pool_size", 10))
+        except:
+            result = 10
+        if result < 1:
+            result = 10
+        return result
+
     def server_username(self):
         """Get server_username.
 
@@ -0,0 +1,178 @@
+"""Functions for posting only the changes in device data between polls."""
+
+# Standard imports
+from copy import deepcopy
+import hashlib
+import json
+
+# HTTP header of the version of the data the server has for a device
+HEADER = "X-Switchmap-Version"
+
+
+def filename(hostname, zone):
+    """Get the name of the files that hold the data of a device.
+
+    Args:
+        hostname: Hostname of the device
+        zone: Zone of the device
+
+    Returns:
+        result: Filename without extension
+
+    """
+    # Return
+    result = "{}-{}".format(
+        hostname, hashlib.md5(str(zone).encode("utf-8")).hexdigest()[:5]
+    )
+    return result
+
+
+def canonical(data):
+    """Convert all the dict keys in data to strings.
+
+    Data decoded from JSON only has string keys, whereas the poller and
+    MessagePack also use integers. Data is converted to this form before
+    being compared or hashed.
+
+    Args:
+        data: Data to convert
+
+    Returns:
+        result: Converted data
+
+    """
+    # Convert
+    if isinstance(data, dict) is True:
+        result = {str(key): canonical(value) for key, value in data.items()}
+    elif isinstance(data, (list, tuple)) is True:
+        result = [canonical(value) for value in data]
+    else:
+        result = data
+    return result
+
+
+def version(data):
+    """Get the version of data.
+
+    Args:
+        data: Data in canonical form
+
+    Returns:
+        result: SHA256 hash of the data
+
+    """
+    # Return
+    result = hashlib.sha256(
+        json.dumps(data, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    ).hexdigest()
+    return result
+
+
+def diff(old, new):
+    """Get the changes between two versions of data.
+
+    Dicts are compared key by key, at any depth, so that a change to one
+    interface, MAC address or ARP entry only adds that entry to the changes.
+    Other values, including lists, are replaced as a whole.
+
+    Args:
+        old: Old data in canonical form
+        new: New data in canonical form
+
+    Returns:
+        result: Dict of changes. "set" is a list of [path, value] pairs of
+            the values to add or replace, "delete" is a list of the paths to
+            remove. Each path is a list of keys
+
+    """
+    # Initialize key variables
+    result = {"set": [], "delete": []}
+
+    # Compare
+    _diff(old, new, [], result)
+    return result
+
+
+def apply(base, changes):
+    """Apply the changes made by diff() to data.
+
+    Args:
+        base: Data in canonical form
+        changes: Changes returned by diff()
+
+    Returns:
+        result: Updated data. None if the changes don't match the data
+
+    """
+    # Initialize key variables
+    result = deepcopy(base)
+
+    try:
+        # Remove keys
+        for path in changes.get("delete", []):
+            target = _target(result, path)
+            del target[str(path[-1])]
+
+        # Add and replace values
+        for path, value in changes.get("set", []):
+            if bool(path) is False:
+                result = canonical(value)
+                continue
+            target = _target(result, path)
+            target[str(path[-1])] = canonical(value)
+
+    except (KeyError, TypeError, AttributeError):
+        result = None
+
+    # Return
+    return result
+
+
+def _diff(old, new, path, result):
+    """Add the changes between two values to the result.
+
+    Args:
+        old: Old value
+        new: New value
+        path: List of keys of the values
+        result: Dict of changes
+
+    Returns:
+        None
+
+    """
+    # Replace values that aren't both dicts
+    if isinstance(old, dict) is False or isinstance(new, dict) is False:
+        if old != new:
+            result["set"].append([path, new])
+        return
+
+    # Compare the keys
+    for key in old:
+        if key not in new:
+            result["delete"].append(path + [key])
+    for key, value in new.items():
+        if key in old:
+            _diff(old[key], value, path + [key], result)
+        else:
+            result["set"].append([path + [key], value])
+
+
+def _target(data, path):
+    """Get the dict that contains the value at the end of a path.
+
+    Args:
+        data: Data
+        path: List of keys
+
+    Returns:
+        result: Dict
+
+    """
+    # Walk the path
+    result = data
+    for key in path[:-1]:
+        result = result[str(key)]
+    if isinstance(result, dict) is False:
+        raise TypeError("Not a dict")
+    return result
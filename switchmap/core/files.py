@@ -11,6 +11,7 @@ import yaml
 # Application libraries
 from switchmap.core import log
 from switchmap.core import general
+from switchmap.core import payload
 
 
 class _Directory:
@@ -72,6 +73,34 @@ class _Directory:
         value = "{}{}snmp".format(self._system_root, os.sep)
         return value
 
+    def base(self):
+        """Define the directory of the last data posted for each host.
+
+        Args:
+            None
+
+        Returns:
+            value: base directory
+
+        """
+        # Return
+        value = "{}{}base".format(self._system_root, os.sep)
+        return value
+
+    def spool(self):
+        """Define the directory of the data waiting to be posted again.
+
+        Args:
+            None
+
+        Returns:
+            value: spool directory
+
+        """
+        # Return
+        value = "{}{}spool".format(self._system_root, os.sep)
+        return value
+
 
 class _File:
     """A class for creating the names of system files."""
@@ -151,6 +180,61 @@ class _File:
         value = "{}{}{}.snmp".format(self._directory.snmp(), os.sep, prefix)
         return value
 
+    def snmp_store(self, name, create=True):
+        """Define the file of poller data kept for each host.
+
+        Args:
+            name: Name of the data
+            create: Create the snmp directory if True
+
+        Returns:
+            value: Name of the file
+
+        """
+        # Return
+        if create is True:
+            mkdir(self._directory.snmp())
+        value = "{}{}{}.yaml".format(self._directory.snmp(), os.sep, name)
+        return value
+
+    def incremental(self, hostname, create=True):
+        """Define the file of the interface data kept for a host.
+
+        Args:
+            hostname: Hostname
+            create: Create the snmp directory if True
+
+        Returns:
+            value: Name of the file
+
+        """
+        # Return
+        if create is True:
+            mkdir(self._directory.snmp())
+        value = "{}{}{}.incremental.yaml".format(
+            self._directory.snmp(), os.sep, hostname
+        )
+        return value
+
+    def base(self, name, create=True):
+        """Define the file of the last data posted for a host.
+
+        Args:
+            name: Name of the file without extension
+            create: Create the base directory if True
+
+        Returns:
+            value: Name of the file
+
+        """
+        # Return
+        if create is True:
+            mkdir(self._directory.base())
+        value = "{}{}{}{}".format(
+            self._directory.base(), os.sep, name, payload.EXTENSION
+        )
+        return value
+
 
 def move_yaml_files(src, dst):
     """Move all yaml files from source to destination directory.
@@ -171,6 +255,63 @@ def move_yaml_files(src, dst):
             shutil.move(filepath, dst)
 
 
+def move_cache_files(src, dst):
+    """Move all poller data cache files from source to destination directory.
+
+    Args:
+        src: Source directory
+        dst: Destination directory
+
+    Returns:
+        None
+
+    """
+    # Copy files
+    src_files = os.listdir(src)
+    for filename in src_files:
+        filepath = os.path.join(src, filename)
+        if os.path.isfile(filepath) and filepath.lower().endswith(
+            (".yaml", payload.EXTENSION)
+        ):
+            shutil.move(filepath, dst)
+
+
+def read_cache_file(filepath, die=True):
+    """Read the contents of a poller data cache file.
+
+    Args:
+        filepath: Path to file to be read
+        die: Die if there is an error
+
+    Returns:
+        result: Dict of data read
+
+    """
+    # Read YAML files written by older versions
+    if filepath.endswith(payload.EXTENSION) is False:
+        result = read_yaml_file(filepath, die=die)
+        return result
+
+    # Read file
+    try:
+        result = payload.load(filepath)
+    except:
+        log_message = (
+            "Error reading file {}. Check permissions, "
+            "existence and file syntax."
+            "".format(filepath)
+        )
+        if bool(die) is True:
+            log.log2die_safe(1095, log_message)
+        else:
+            log.log2debug(1100, log_message)
+            return {}
+
+    # Convert all dict keys to int
+    result = general.consistent_keys(result)
+    return result
+
+
 def read_yaml_files(directories):
     """Read the contents of all yaml files in a directory.
 
@@ -392,6 +533,73 @@ def snmp_file(hostname, config):
     return result
 
 
+def snmp_store_file(name, config):
+    """Get the file of poller data kept for each host between polls.
+
+    Args:
+        name: Name of the data
+        config: Config object
+
+    Returns:
+        result: Name of the file
+
+    """
+    # Return
+    f_obj = _File(config)
+    result = f_obj.snmp_store(name)
+    return result
+
+
+def incremental_file(hostname, config):
+    """Get the file of the interface data kept for a host between polls.
+
+    Args:
+        hostname: Hostname
+        config: Config object
+
+    Returns:
+        result: Name of the file
+
+    """
+    # Return
+    f_obj = _File(config)
+    result = f_obj.incremental(hostname)
+    return result
+
+
+def base_file(name, config):
+    """Get the file of the last data posted for a host.
+
+    Args:
+        name: Name of the file without extension
+        config: Config object
+
+    Returns:
+        result: Name of the file
+
+    """
+    # Return
+    f_obj = _File(config)
+    result = f_obj.base(name)
+    return result
+
+
+def spool_directory(config):
+    """Get the directory of the poller data waiting to be posted again.
+
+    Args:
+        config: Config object
+
+    Returns:
+        result: Name of the directory
+
+    """
+    # Return
+    result = _Directory(config).spool()
+    mkdir(result)
+    return result
+
+
 def execute(command, die=True):
     """Run the command UNIX CLI command and record output.
 
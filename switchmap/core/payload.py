@@ -0,0 +1,276 @@
+"""Functions for encoding the data posted by pollers and cached by servers.
+
+Data is serialized with MessagePack and compressed with Zstandard when the
+msgpack and zstandard packages are installed. JSON and gzip are used
+otherwise.
+
+"""
+
+# Standard imports
+import gzip
+import json
+import os
+import zlib
+
+# PIP3 imports
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Content types
+JSON = "application/json"
+MSGPACK = "application/msgpack"
+
+# Content encodings
+GZIP = "gzip"
+ZSTD = "zstd"
+
+# Extension of the files written by dump()
+EXTENSION = ".payload"
+
+# Magic numbers at the start of compressed data
+_MAGIC = {GZIP: b"\x1f\x8b", ZSTD: b"\x28\xb5\x2f\xfd"}
+
+# Maximum number of bytes of decoded posts, compressed or not
+MAX_SIZE = 512 * 1024 * 1024
+
+
+class PayloadTooLarge(ValueError):
+    """Raised when posted data is larger than allowed once decompressed."""
+
+
+def encode(data):
+    """Encode data for posting.
+
+    Args:
+        data: Data to encode
+
+    Returns:
+        result: Tuple of the encoded bytes and a dict of the HTTP headers
+            that describe them
+
+    """
+    # Serialize
+    if msgpack is None:
+        content_type = JSON
+    else:
+        content_type = MSGPACK
+    content_encoding = ZSTD if zstandard is not None else GZIP
+    body = _compress(_serialize(data, content_type), content_encoding)
+
+    # Return
+    headers = {
+        "Content-Type": content_type,
+        "Content-Encoding": content_encoding,
+    }
+    result = (body, headers)
+    return result
+
+
+def decode(body, content_type=JSON, content_encoding=None, max_size=MAX_SIZE):
+    """Decode posted data.
+
+    PayloadTooLarge is raised if the data is larger than max_size once
+    decompressed, without decompressing more than that.
+
+    Args:
+        body: Bytes to decode
+        content_type: HTTP Content-Type of the bytes
+        content_encoding: HTTP Content-Encoding of the bytes
+        max_size: Maximum number of bytes once decompressed
+
+    Returns:
+        result: Decoded data
+
+    """
+    # Return
+    result = _deserialize(
+        _decompress(body, content_encoding, max_size=max_size), content_type
+    )
+    return result
+
+
+def supported(content_type=JSON, content_encoding=None):
+    """Determine whether posted data can be decoded.
+
+    Args:
+        content_type: HTTP Content-Type of the data
+        content_encoding: HTTP Content-Encoding of the data
+
+    Returns:
+        result: True if supported
+
+    """
+    # Check the content type
+    if content_type == MSGPACK:
+        result = msgpack is not None
+    else:
+        result = content_type == JSON
+
+    # Check the content encoding
+    if content_encoding == ZSTD:
+        result = result and zstandard is not None
+    elif bool(content_encoding) is True:
+        result = result and content_encoding in [GZIP, "identity"]
+    return result
+
+
+def dump(data, filepath):
+    """Write data to a file.
+
+    The file is first written under a temporary name, so that it is never
+    read while incomplete.
+
+    Args:
+        data: Data to write
+        filepath: Path of the file
+
+    Returns:
+        None
+
+    """
+    # Encode
+    body, _ = encode(data)
+
+    # Write
+    temporary = "{}.tmp".format(filepath)
+    with open(temporary, "wb") as f_handle:
+        f_handle.write(body)
+    os.replace(temporary, filepath)
+
+
+def load(filepath):
+    """Read data written by dump().
+
+    The format is detected from the contents of the file, so files written
+    with or without the optional packages can be read.
+
+    Args:
+        filepath: Path of the file
+
+    Returns:
+        result: Data read
+
+    """
+    # Read
+    with open(filepath, "rb") as f_handle:
+        body = f_handle.read()
+
+    # Detect the compression
+    content_encoding = None
+    for encoding, magic in _MAGIC.items():
+        if body.startswith(magic) is True:
+            content_encoding = encoding
+    body = _decompress(body, content_encoding)
+
+    # Detect the serialization. JSON objects always start with "{"
+    content_type = JSON if body.lstrip()[:1] == b"{" else MSGPACK
+    result = _deserialize(body, content_type)
+    return result
+
+
+def _serialize(data, content_type):
+    """Serialize data.
+
+    Args:
+        data: Data to serialize
+        content_type: HTTP Content-Type to use
+
+    Returns:
+        result: Bytes
+
+    """
+    # Serialize
+    if content_type == MSGPACK:
+        result = msgpack.packb(data, use_bin_type=True)
+    else:
+        result = json.dumps(data, separators=(",", ":")).encode("utf-8")
+    return result
+
+
+def _deserialize(body, content_type):
+    """Deserialize data.
+
+    Args:
+        body: Bytes to deserialize
+        content_type: HTTP Content-Type of the bytes
+
+    Returns:
+        result: Data
+
+    """
+    # Deserialize
+    if content_type == MSGPACK:
+        result = msgpack.unpackb(body, raw=False, strict_map_key=False)
+    else:
+        result = json.loads(body)
+    return result
+
+
+def _compress(body, content_encoding):
+    """Compress bytes.
+
+    Args:
+        body: Bytes to compress
+        content_encoding: HTTP Content-Encoding to use
+
+    Returns:
+        result: Compressed bytes
+
+    """
+    # Compress
+    if content_encoding == ZSTD:
+        result = zstandard.ZstdCompressor(level=3).compress(body)
+    elif content_encoding == GZIP:
+        result = gzip.compress(body, compresslevel=6)
+    else:
+        result = body
+    return result
+
+
+def _decompress(body, content_encoding, max_size=None):
+    """Decompress bytes.
+
+    Args:
+        body: Bytes to decompress
+        content_encoding: HTTP Content-Encoding of the bytes
+        max_size: Maximum number of bytes once decompressed. No limit if None
+
+    Returns:
+        result: Decompressed bytes
+
+    """
+    # Decompress without a limit
+    if max_size is None:
+        if content_encoding == ZSTD:
+            result = zstandard.ZstdDecompressor().decompress(body)
+        elif content_encoding == GZIP:
+            result = gzip.decompress(body)
+        else:
+            result = body
+        return result
+
+    # Decompress no more than the limit. The decompressor only applies
+    # max_output_size to frames without a content size in their header, and
+    # fails if they are larger
+    if content_encoding == ZSTD:
+        if zstandard.frame_content_size(body) > max_size:
+            raise PayloadTooLarge("Decompressed size exceeds the limit")
+        result = zstandard.ZstdDecompressor().decompress(
+            body, max_output_size=max_size
+        )
+    elif content_encoding == GZIP:
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        result = decompressor.decompress(body, max_size + 1)
+        if len(result) <= max_size and decompressor.eof is False:
+            raise zlib.error("Incomplete gzip data")
+    else:
+        result = body
+    if len(result) > max_size:
+        raise PayloadTooLarge("Size exceeds the limit")
+    return result
@@ -1,18 +1,29 @@
 """Functions for creating URIs."""
 
 # Standard imports
+import os
 import sys
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 from collections import namedtuple
 
 # Import repository libraries
 # from switchmap.poller.configuration import ConfigAPIClient
 from switchmap.core import log
+from switchmap.core import payload
 from switchmap import API_PREFIX
 from switchmap.core.log import ExceptionWrapper
 
+# URLs of servers that don't accept compressed binary posts
+_JSON_ONLY = set()
 
-def post(uri, data, config, server=True):
+# Session reused by all the requests of a process, keyed by process ID
+_SESSIONS = {}
+_LOCK = threading.Lock()
+
+
+def post(uri, data, config, server=True, binary=False):
     """Create URI for datacenter RRD and oid_id data.
 
     Args:
@@ -20,6 +31,8 @@ def post(uri, data, config, server=True):
         data: Data to post
         config: ConfitAPIClient object
         server: Posting to a server if True, API if False
+        binary: Post compressed binary data if True. JSON is posted if the
+            server doesn't support it
 
     Returns:
         data: Post named tuple
@@ -46,34 +59,41 @@ def post(uri, data, config, server=True):
     log_message = "Attempting to post data to {}.".format(url)
     log.log2info(1583, log_message)
 
-    # Post data save to cache if this fails
-    with requests.Session() as session:
-
-        # if bool(username) is False or bool(password) is False:
-        #     result = session.post(url, json=data)
-        # else:
-        #     result = session.post(url, json=data, auth=(username, password))
-        # response = True
-
-        try:
-            with requests.Session() as session:
-                if bool(username) is False or bool(password) is False:
-                    result = session.post(url, json=data)
-                else:
-                    result = session.post(
-                        url, json=data, auth=(username, password)
-                    )
-                response = True
-        except Exception as error:
-            log_message = "Error posting to {}".format(url)
-            log.log2warning(1537, log_message)
-            log.log2exception(1641, sys.exc_info())
-            return ExceptionWrapper(error)
-        except:
-            log_message = "Failed to post data to API server URL {}.".format(
-                url
+    # Post data
+    try:
+        session = _session(config)
+        if bool(username) is False or bool(password) is False:
+            auth = None
+        else:
+            auth = (username, password)
+
+        # Post binary data if the server accepts it. Servers that
+        # accept it list the content type in the Accept-Post header
+        # of their response, others are sent JSON from now on.
+        result = None
+        if bool(binary) is True and url not in _JSON_ONLY:
+            body, headers = payload.encode(data)
+            result = session.post(url, data=body, headers=headers, auth=auth)
+            accepted = headers["Content-Type"] in result.headers.get(
+                "Accept-Post", ""
             )
-            log.log2info(1038, log_message)
+            if result.status_code == 415 or (
+                result.status_code == 200 and accepted is False
+            ):
+                _JSON_ONLY.add(url)
+                result = None
+
+        if result is None:
+            result = session.post(url, json=data, auth=auth)
+        response = True
+    except Exception as error:
+        log_message = "Error posting to {}".format(url)
+        log.log2warning(1537, log_message)
+        log.log2exception(1641, sys.exc_info())
+        return ExceptionWrapper(error)
+    except:
+        log_message = "Failed to post data to API server URL {}.".format(url)
+        log.log2info(1038, log_message)
 
     # Define success
     if response is True:
@@ -210,19 +230,19 @@ def _get(url, config, die=True, query=None, stream=False):
 
     # Post data save to cache if this fails
     try:
-        with requests.Session() as session:
-            if bool(query) is False:
-                response = session.get(
-                    url, stream=stream, auth=(username, password)
-                )
-            else:
-                response = session.get(
-                    url,
-                    stream=stream,
-                    auth=(username, password),
-                    params={"query": query},
-                )
-            success = True
+        session = _session(config)
+        if bool(query) is False:
+            response = session.get(
+                url, stream=stream, auth=(username, password)
+            )
+        else:
+            response = session.get(
+                url,
+                stream=stream,
+                auth=(username, password),
+                params={"query": query},
+            )
+        success = True
     except Exception as exception_error:
         log_message = (
             "Failed to connect to server API URL {}. Error: {}"
@@ -238,6 +258,41 @@ def _get(url, config, die=True, query=None, stream=False):
     return response
 
 
+def _session(config):
+    """Get the session used for all the requests of the current process.
+
+    Connections to the server are kept alive and reused by later requests
+    instead of being opened for each one. Processes forked from the owner
+    of a session create their own.
+
+    Args:
+        config: ConfigAPIClient object
+
+    Returns:
+        result: requests.Session object
+
+    """
+    # Initialize key variables
+    pid = os.getpid()
+
+    with _LOCK:
+        result = _SESSIONS.get(pid)
+        if result is None:
+            # Sessions inherited from a parent process can't be shared
+            _SESSIONS.clear()
+
+            # Create the session
+            size = config.server_pool_size()
+            adapter = HTTPAdapter(pool_connections=size, pool_maxsize=size)
+            result = requests.Session()
+            result.mount("http://", adapter)
+            result.mount("https://", adapter)
+            _SESSIONS[pid] = result
+
+    # Return
+    return result
+
+
 def _clean_url(url):
     """Remove excess / from url.
 
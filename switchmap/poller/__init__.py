@@ -24,4 +24,4 @@ POLL = namedtuple(
     "hostname authorization",
 )
 
-ZONE = namedtuple("ZONE", "name hostnames")
+ZONE = namedtuple("ZONE", "name hostnames polling_interval hostname_intervals")
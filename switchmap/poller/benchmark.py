@@ -0,0 +1,548 @@
+"""Module to measure the throughput of the poller with simulated devices."""
+
+# Standard imports
+import json
+import math
+import tempfile
+import time
+
+# Switchmap imports
+from switchmap.poller.snmp import QUERIES
+from switchmap.poller.snmp import poller
+from switchmap.poller.snmp import simulator
+from switchmap.poller.snmp import snmp_manager
+from switchmap.poller.update import device as udevice
+from switchmap.poller.configuration import ConfigPoller
+from switchmap.poller import poll
+from switchmap.poller import store
+from switchmap.core import payload
+
+# Stages of the poll of a device
+STAGES = ("credentials", "query", "process", "serialize")
+
+# Percentiles of the per device latency that are reported
+PERCENTILES = (50, 95, 99)
+
+# Methods of the MIB query classes that are timed
+_METHODS = ("supported", "system", "layer1", "layer2", "layer3")
+
+
+class Timings:
+    """Number of calls and time spent per key.
+
+    The time of a call excludes that of the timed calls made during it, so
+    that the time of a walk that falls back to other walks isn't counted
+    twice.
+
+    """
+
+    def __init__(self):
+        """Initialize the class.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._totals = {}
+        self._children = []
+
+    def start(self):
+        """Start timing a call.
+
+        Args:
+            None
+
+        Returns:
+            result: Time the call started
+
+        """
+        # Track the time of the calls made during this one
+        self._children.append(0)
+        result = time.perf_counter()
+        return result
+
+    def stop(self, key, started):
+        """Stop timing a call.
+
+        Args:
+            key: Key to which the time is added
+            started: Time returned by start()
+
+        Returns:
+            None
+
+        """
+        # Get the time of the call, less that of its timed calls
+        duration = time.perf_counter() - started
+        children = self._children.pop()
+        if bool(self._children) is True:
+            self._children[-1] += duration
+
+        # Update the totals
+        total = self._totals.setdefault(key, [0, 0])
+        total[0] += 1
+        total[1] += duration - children
+
+    def summary(self):
+        """Get the totals.
+
+        Args:
+            None
+
+        Returns:
+            result: Dict of the calls and seconds keyed by key, sorted by
+                the time spent
+
+        """
+        # Return
+        result = {
+            key: {"calls": calls, "seconds": seconds}
+            for key, (calls, seconds) in sorted(
+                self._totals.items(), key=lambda _: (-_[1][1], _[0])
+            )
+        }
+        return result
+
+
+class _Patches:
+    """Timing wrappers of the poller, and the directory of its saved data.
+
+    The data the poller saves between polls, such as the credentials and
+    capabilities of the devices, is kept in a separate directory so that
+    the simulated devices don't replace that of the real ones.
+
+    """
+
+    def __init__(self, stages, queries, oids, directory):
+        """Initialize the class.
+
+        Args:
+            stages: Timings of the stages of the polls
+            queries: Timings of the MIB query class methods
+            oids: Timings of the SNMP queries per OID
+            directory: Directory of the data saved between polls
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._stages = stages
+        self._queries = queries
+        self._oids = oids
+        self._directory = directory
+        self._originals = []
+
+    def start(self):
+        """Start timing.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Keep the data saved between polls in the directory
+        self._patch(store, "_STORES", {})
+        self._patch(ConfigPoller, "system_directory", self._system_directory())
+
+        # Time the stages of the polls
+        self._patch(poller.Poll, "__init__", self._credentials(poller.Poll))
+        self._patch(
+            poller.Poll,
+            "query",
+            self._method(self._stages, "query", poller.Poll, "query"),
+        )
+        self._patch(
+            udevice.Device,
+            "process",
+            self._method(self._stages, "process", udevice.Device, "process"),
+        )
+
+        # Time the methods of the MIB query classes
+        for query in QUERIES:
+            for method in _METHODS:
+                if hasattr(query, method) is False:
+                    continue
+                self._patch(
+                    query,
+                    method,
+                    self._method(self._queries, query.__name__, query, method),
+                )
+
+        # Time the SNMP queries
+        self._patch(
+            snmp_manager.Interact, "query", self._oid(snmp_manager.Interact)
+        )
+        self._patch(
+            snmp_manager.Interact, "table", self._table(snmp_manager.Interact)
+        )
+
+    def stop(self):
+        """Stop timing.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Restore the original methods
+        while bool(self._originals) is True:
+            item, name, original = self._originals.pop()
+            if original is None:
+                delattr(item, name)
+            else:
+                setattr(item, name, original)
+
+    def _patch(self, item, name, wrapper):
+        """Replace a method of a class.
+
+        Args:
+            item: Class
+            name: Name of the method
+            wrapper: Replacement
+
+        Returns:
+            None
+
+        """
+        # Methods inherited from parent classes are deleted when restored
+        self._originals.append((item, name, item.__dict__.get(name)))
+        setattr(item, name, wrapper)
+
+    def _system_directory(self):
+        """Create the replacement of ConfigPoller.system_directory.
+
+        Args:
+            None
+
+        Returns:
+            wrapper: Wrapper
+
+        """
+        # Initialize key variables
+        directory = self._directory
+
+        def wrapper(config):
+            """Get the directory of the data saved between polls.
+
+            Args:
+                config: ConfigPoller object
+
+            Returns:
+                result: Directory
+
+            """
+            # Return
+            result = directory
+            return result
+
+        return wrapper
+
+    def _credentials(self, item):
+        """Create the timing wrapper of Poll.__init__.
+
+        Args:
+            item: Poll class
+
+        Returns:
+            wrapper: Wrapper
+
+        """
+        # Initialize key variables
+        method = item.__init__
+        timings = self._stages
+
+        def wrapper(_poll, hostname):
+            """Time the validation of the credentials of the device.
+
+            Args:
+                _poll: Poll object
+                hostname: Hostname
+
+            Returns:
+                None
+
+            """
+            started = timings.start()
+            try:
+                method(_poll, hostname)
+            finally:
+                timings.stop("credentials", started)
+
+        return wrapper
+
+    def _method(self, timings, key, item, name):
+        """Create the timing wrapper of a method without arguments.
+
+        Args:
+            timings: Timings to which the time is added
+            key: Key of the time
+            item: Class
+            name: Name of the method
+
+        Returns:
+            wrapper: Wrapper
+
+        """
+        # Initialize key variables
+        method = getattr(item, name)
+
+        def wrapper(instance):
+            """Time the method.
+
+            Args:
+                instance: Object of the class
+
+            Returns:
+                result: Result of the method
+
+            """
+            started = timings.start()
+            try:
+                result = method(instance)
+            finally:
+                timings.stop(key, started)
+            return result
+
+        return wrapper
+
+    def _oid(self, item):
+        """Create the timing wrapper of Interact.query.
+
+        Args:
+            item: Interact class
+
+        Returns:
+            wrapper: Wrapper
+
+        """
+        # Initialize key variables
+        method = item.query
+        timings = self._oids
+
+        def wrapper(
+            interact,
+            oid_to_get,
+            get=False,
+            check_reachability=False,
+            check_existence=False,
+            normalized=False,
+            context_name="",
+            safe=False,
+        ):
+            """Time the method.
+
+            Args:
+                interact: Interact object
+                oid_to_get: OID to walk
+                get: Flag determining whether to do a GET or WALK
+                check_reachability: Ignore some session errors if True
+                check_existence: Set if checking for the existence of the OID
+                normalized: Return results keyed by the last node if True
+                context_name: SNMPv3 context name
+                safe: Return blank values on exceptions if True
+
+            Returns:
+                result: Result of the method
+
+            """
+            started = timings.start()
+            try:
+                result = method(
+                    interact,
+                    oid_to_get,
+                    get=get,
+                    check_reachability=check_reachability,
+                    check_existence=check_existence,
+                    normalized=normalized,
+                    context_name=context_name,
+                    safe=safe,
+                )
+            finally:
+                timings.stop(oid_to_get, started)
+            return result
+
+        return wrapper
+
+    def _table(self, item):
+        """Create the timing wrapper of Interact.table.
+
+        Args:
+            item: Interact class
+
+        Returns:
+            wrapper: Wrapper
+
+        """
+        # Initialize key variables
+        method = item.table
+        timings = self._oids
+
+        def wrapper(interact, oids_to_get, context_name=""):
+            """Time the method.
+
+            Args:
+                interact: Interact object
+                oids_to_get: List of column OIDs
+                context_name: SNMPv3 context name
+
+            Returns:
+                result: Result of the method
+
+            """
+            started = timings.start()
+            try:
+                result = method(
+                    interact, oids_to_get, context_name=context_name
+                )
+            finally:
+                timings.stop(",".join(oids_to_get), started)
+            return result
+
+        return wrapper
+
+
+def run(capture, count, seed=0, latency=0):
+    """Poll simulated devices and measure the time spent.
+
+    Each device is polled in turn along the same path as poll.device():
+    validating its credentials, querying the MIBs, processing the data and
+    serializing it for posting. Nothing is posted, and the data the poller
+    saves between polls is kept in a temporary directory.
+
+    Args:
+        capture: Capture of a device created by simulator.Recording
+        count: Number of simulated devices
+        seed: Seed of the random values of the simulated devices
+        latency: Seconds each SNMP request takes
+
+    Returns:
+        result: Dict of the results
+
+    """
+    # Initialize key variables
+    config = ConfigPoller()
+    captures = simulator.fleet(capture, count, seed=seed)
+    replay = simulator.Replay(captures, latency=latency)
+    stages = Timings()
+    queries = Timings()
+    oids = Timings()
+    durations = []
+    polled = 0
+
+    # Poll the devices
+    with tempfile.TemporaryDirectory() as directory:
+        patches = _Patches(stages, queries, oids, directory)
+        replay.start()
+        patches.start()
+        started = time.perf_counter()
+        try:
+            for item in captures:
+                duration, result = _device(
+                    poll._META(
+                        zone="benchmark",
+                        hostname=item["hostname"],
+                        config=config,
+                    ),
+                    stages,
+                )
+                durations.append(duration)
+                if bool(result) is True:
+                    polled += 1
+        finally:
+            seconds = time.perf_counter() - started
+            patches.stop()
+            replay.stop()
+    totals = stages.summary()
+
+    # Return
+    result = {
+        "devices": count,
+        "polled": polled,
+        "seconds": seconds,
+        "devices_per_second": count / seconds if bool(seconds) else 0,
+        "requests": replay.requests(),
+        "latency": {
+            "p{}".format(_): percentile(durations, _) for _ in PERCENTILES
+        },
+        "stages": {_: totals.get(_, {}).get("seconds", 0) for _ in STAGES},
+        "queries": queries.summary(),
+        "oids": oids.summary(),
+    }
+    return result
+
+
+def _device(meta, stages):
+    """Poll a single device.
+
+    The device is polled by poll._query(), like poll.device() does.
+    poll.device() isn't used as it prints the data when not posting it.
+
+    Args:
+        meta: poll._META object
+        stages: Timings of the stages of the polls
+
+    Returns:
+        result: Tuple of the seconds the poll took and True if the device
+            returned data
+
+    """
+    # Poll the device
+    started = time.perf_counter()
+    polled, data = poll._query(meta)
+
+    # Serialize the data
+    if data is not None:
+        checkpoint = stages.start()
+        payload.encode(data)
+        stages.stop("serialize", checkpoint)
+
+    # Return
+    result = (time.perf_counter() - started, bool(polled))
+    return result
+
+
+def percentile(values, rank):
+    """Get a percentile of values using the nearest rank method.
+
+    Args:
+        values: List of values
+        rank: Percentile
+
+    Returns:
+        result: Value. None if there are no values
+
+    """
+    # Initialize key variables
+    result = None
+
+    # Get the value
+    if bool(values) is True:
+        ordered = sorted(values)
+        position = max(1, math.ceil(rank / 100 * len(ordered)))
+        result = ordered[position - 1]
+    return result
+
+
+def write(results, filepath):
+    """Write results to a JSON file.
+
+    Args:
+        results: Dict of results returned by run()
+        filepath: Path of the file
+
+    Returns:
+        None
+
+    """
+    # Write
+    with open(filepath, "w") as f_handle:
+        json.dump(results, f_handle, indent=4, sort_keys=True)
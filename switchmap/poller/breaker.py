@@ -0,0 +1,132 @@
+"""Module to back off polling devices that repeatedly fail."""
+
+import time
+
+from switchmap.poller import store
+from switchmap.core import log
+
+# Maximum number of seconds between polls of a failing device
+_MAX_BACKOFF = 86400
+
+
+class Breaker:
+    """Circuit breaker of the polls of each device.
+
+    The consecutive failed polls of each device are counted. Once they reach
+    the threshold the device isn't polled again until a backoff period has
+    elapsed. The period doubles with each further failure. The state is
+    saved in the poller's breaker store so that it survives restarts and
+    can be displayed by the CLI.
+
+    """
+
+    def __init__(self, threshold=3, backoff=300):
+        """Initialize the class.
+
+        Args:
+            threshold: Number of consecutive failures after which polling
+                is backed off. Polling is never backed off if zero
+            backoff: Seconds of the first backoff period
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._threshold = threshold
+        self._backoff = backoff
+        self._store = store.store("breaker")
+
+    def wait(self, hostname, now=None):
+        """Get the number of seconds before a device may be polled again.
+
+        Args:
+            hostname: Hostname of the device
+            now: Current timestamp
+
+        Returns:
+            result: Seconds. Zero if the device can be polled
+
+        """
+        # Initialize key variables
+        now = time.time() if now is None else now
+        state = self._store.get(hostname)
+        result = 0
+
+        # Get the remaining backoff period
+        if isinstance(state, dict) is True:
+            result = max(state.get("until", 0) - now, 0)
+        return result
+
+    def success(self, hostname):
+        """Record a successful poll of a device.
+
+        Args:
+            hostname: Hostname of the device
+
+        Returns:
+            None
+
+        """
+        # Forget the failures
+        if self._store.get(hostname) is not None:
+            self._store.update(hostname, None)
+
+    def failure(self, hostname, now=None):
+        """Record a failed poll of a device.
+
+        Args:
+            hostname: Hostname of the device
+            now: Current timestamp
+
+        Returns:
+            result: Seconds before the device may be polled again
+
+        """
+        # Initialize key variables
+        now = time.time() if now is None else now
+        state = self._store.get(hostname)
+        failures = 1
+        result = 0
+
+        # Count the consecutive failures
+        if isinstance(state, dict) is True:
+            failures += int(state.get("failures", 0))
+
+        # Back off once the threshold is reached
+        if bool(self._threshold) is True and failures >= self._threshold:
+            result = min(
+                self._backoff * 2 ** min(failures - self._threshold, 32),
+                _MAX_BACKOFF,
+            )
+            log_message = """\
+Host {} failed {} consecutive polls. Not polling it for {}s""".format(
+                hostname, failures, result
+            )
+            log.log2warning(2018, log_message)
+
+        # Save the state
+        self._store.update(
+            hostname,
+            {
+                "failures": failures,
+                "last": int(now),
+                "until": int(now + result),
+            },
+        )
+        return result
+
+
+def status():
+    """Get the breaker state of all failing devices.
+
+    Args:
+        None
+
+    Returns:
+        result: Dict of breaker states keyed by hostname
+
+    """
+    # Return
+    result = store.store("breaker").data()
+    return result
@@ -72,6 +72,239 @@ class ConfigPoller(ConfigAPIClient):
         result = self._config_poller.get("polling_interval", 86400)
         return result
 
+    def ingest_interval(self):
+        """Get the ingest_interval of the server sharing the configuration.
+
+        Args:
+            None
+
+        Returns:
+            result: ingest_interval. None if the configuration has no
+                server section, as when the server runs on another host
+
+        """
+        # Initialize key variables
+        result = None
+        server = self._config_complete.get("server")
+
+        # Get result
+        if isinstance(server, dict) is True:
+            result = server.get("ingest_interval", 86400)
+        return result
+
+    def polling_jitter(self):
+        """Get polling_jitter.
+
+        Args:
+            None
+
+        Returns:
+            result: Fraction of the polling interval by which the polls of
+                each device are randomly spread
+
+        """
+        # Get result
+        try:
+            result = float(self._config_poller.get("polling_jitter", 0.1))
+        except:
+            result = 0.1
+        result = min(max(result, 0), 0.5)
+        return result
+
+    def polling_timeout(self):
+        """Get polling_timeout.
+
+        Args:
+            None
+
+        Returns:
+            result: Maximum number of seconds a device poll may take. Zero
+                if unlimited
+
+        """
+        # Get result
+        result = _non_negative_integer(
+            self._config_poller.get("polling_timeout"), 900
+        )
+        return result
+
+    def polling_engine(self):
+        """Get polling_engine.
+
+        Args:
+            None
+
+        Returns:
+            result: Name of the engine used to poll devices concurrently
+
+        """
+        # Initialize key variables
+        engines = ["multiprocessing", "asyncio"]
+
+        # Get result
+        result = str(
+            self._config_poller.get("polling_engine", engines[0])
+        ).lower()
+        if result not in engines:
+            log_message = """\
+Invalid polling_engine "{}" in configuration. Valid options are {}. \
+Using "{}".""".format(
+                result, engines, engines[0]
+            )
+            log.log2warning(2007, log_message)
+            result = engines[0]
+        return result
+
+    def polling_concurrency(self):
+        """Get polling_concurrency.
+
+        Args:
+            None
+
+        Returns:
+            result: Maximum number of devices polled at the same time
+
+        """
+        # Get result
+        result = _positive_integer(
+            self._config_poller.get("polling_concurrency"), 100
+        )
+        return result
+
+    def zone_concurrency(self):
+        """Get zone_concurrency.
+
+        Args:
+            None
+
+        Returns:
+            result: Maximum number of devices polled at the same time per zone
+
+        """
+        # Get result
+        result = _positive_integer(
+            self._config_poller.get("zone_concurrency"),
+            self.polling_concurrency(),
+        )
+        return min(result, self.polling_concurrency())
+
+    def breaker_threshold(self):
+        """Get breaker_threshold.
+
+        Args:
+            None
+
+        Returns:
+            result: Number of consecutive failed polls after which polling a
+                device is backed off. Zero if never backed off
+
+        """
+        # Get result
+        result = _non_negative_integer(
+            self._config_poller.get("breaker_threshold"), 3
+        )
+        return result
+
+    def breaker_backoff(self):
+        """Get breaker_backoff.
+
+        Args:
+            None
+
+        Returns:
+            result: Seconds before a device is polled again after reaching
+                the breaker_threshold. Doubled for each further failure
+
+        """
+        # Get result
+        result = _positive_integer(
+            self._config_poller.get("breaker_backoff"), 300
+        )
+        return result
+
+    def server_batch_size(self):
+        """Get server_batch_size.
+
+        Args:
+            None
+
+        Returns:
+            result: Maximum number of devices whose data is posted to the
+                server in a single request. Data isn't batched if one
+
+        """
+        # Get result
+        result = _positive_integer(
+            self._config_poller.get("server_batch_size"), 1
+        )
+        return result
+
+    def server_batch_interval(self):
+        """Get server_batch_interval.
+
+        Args:
+            None
+
+        Returns:
+            result: Maximum number of seconds data waits in a batch before
+                being posted
+
+        """
+        # Get result
+        result = _positive_integer(
+            self._config_poller.get("server_batch_interval"), 10
+        )
+        return result
+
+    def spool_concurrency(self):
+        """Get spool_concurrency.
+
+        Args:
+            None
+
+        Returns:
+            result: Maximum number of spooled posts replayed at the same time
+
+        """
+        # Get result
+        result = _positive_integer(
+            self._config_poller.get("spool_concurrency"), 4
+        )
+        return result
+
+    def spool_interval(self):
+        """Get spool_interval.
+
+        Args:
+            None
+
+        Returns:
+            result: Seconds between attempts to replay spooled posts
+
+        """
+        # Get result
+        result = _positive_integer(
+            self._config_poller.get("spool_interval"), 60
+        )
+        return result
+
+    def spool_size(self):
+        """Get spool_size.
+
+        Args:
+            None
+
+        Returns:
+            result: Maximum size of the spooled posts in megabytes. Posts
+                aren't spooled if zero
+
+        """
+        # Get result
+        result = _non_negative_integer(
+            self._config_poller.get("spool_size"), 1024
+        )
+        return result
+
     def snmp_auth(self):
         """Get list of dicts of SNMP information in configuration file.
 
@@ -118,6 +351,104 @@ class ConfigPoller(ConfigAPIClient):
         # Return
         return result
 
+    def snmp_adaptive_repetitions(self):
+        """Get snmp_adaptive_repetitions.
+
+        Args:
+            None
+
+        Returns:
+            result: True if the GETBULK max-repetitions value is tuned for
+                each device
+
+        """
+        # Get result
+        result = bool(self._config_poller.get("snmp_adaptive_repetitions"))
+        return result
+
+    def snmp_capabilities_interval(self):
+        """Get snmp_capabilities_interval.
+
+        Args:
+            None
+
+        Returns:
+            result: Seconds for which the MIBs supported by a device are
+                remembered. Zero if they are checked at every poll
+
+        """
+        # Get result
+        result = _non_negative_integer(
+            self._config_poller.get("snmp_capabilities_interval"), 86400
+        )
+        return result
+
+    def snmp_incremental_cycles(self):
+        """Get snmp_incremental_cycles.
+
+        Args:
+            None
+
+        Returns:
+            result: Number of polls of a device between full walks of its
+                interface tables. Zero if they are fully walked at every poll
+
+        """
+        # Get result
+        result = _non_negative_integer(
+            self._config_poller.get("snmp_incremental_cycles"), 0
+        )
+        return result
+
+    def snmp_context_concurrency(self):
+        """Get snmp_context_concurrency.
+
+        Args:
+            None
+
+        Returns:
+            result: Maximum number of SNMP contexts walked at the same time
+                on a device
+
+        """
+        # Get result
+        result = _positive_integer(
+            self._config_poller.get("snmp_context_concurrency"), 4
+        )
+        return result
+
+    def snmp_max_repetitions(self):
+        """Get snmp_max_repetitions.
+
+        Args:
+            None
+
+        Returns:
+            result: GETBULK max-repetitions value used for SNMP walks
+
+        """
+        # Get result
+        result = _positive_integer(
+            self._config_poller.get("snmp_max_repetitions"), 25
+        )
+        return result
+
+    def snmp_max_sessions(self):
+        """Get snmp_max_sessions.
+
+        Args:
+            None
+
+        Returns:
+            result: Maximum number of SNMP sessions kept open per device
+
+        """
+        # Get result
+        result = _positive_integer(
+            self._config_poller.get("snmp_max_sessions"), 16
+        )
+        return result
+
     def username(self):
         """Get username.
 
@@ -159,17 +490,78 @@ class ConfigPoller(ConfigAPIClient):
             if isinstance(_zone, dict) is False:
                 continue
 
+            # Hostnames are either strings or dicts with their own
+            # polling_interval
+            hostnames = None
+            hostname_intervals = {}
+            if isinstance(_zone.get("hostnames"), list) is True:
+                hostnames = []
+                for item in _zone.get("hostnames"):
+                    if isinstance(item, dict) is True:
+                        hostname = item.get("hostname")
+                        interval = _positive_integer(
+                            item.get("polling_interval"), 0
+                        )
+                        if bool(interval) is True:
+                            hostname_intervals[hostname] = interval
+                    else:
+                        hostname = item
+                    hostnames.append(hostname)
+
             # Assign good data
             result.append(
                 ZONE(
                     name=_zone.get("zone"),
-                    hostnames=(
-                        _zone.get("hostnames")
-                        if isinstance(_zone.get("hostnames"), list)
-                        else None
+                    hostnames=hostnames,
+                    polling_interval=(
+                        _positive_integer(_zone.get("polling_interval"), 0)
+                        or None
                     ),
+                    hostname_intervals=hostname_intervals,
                 )
             )
 
         # Return
         return result
+
+
+def _positive_integer(value, default):
+    """Convert a configuration value to a positive integer.
+
+    Args:
+        value: Value to convert
+        default: Value to return if the conversion fails
+
+    Returns:
+        result: Positive integer
+
+    """
+    # Get result
+    try:
+        result = int(value)
+    except:
+        result = default
+    if result < 1:
+        result = default
+    return result
+
+
+def _non_negative_integer(value, default):
+    """Convert a configuration value to an integer that isn't negative.
+
+    Args:
+        value: Value to convert
+        default: Value to return if the conversion fails
+
+    Returns:
+        result: Integer greater than or equal to zero
+
+    """
+    # Get result
+    try:
+        result = int(value)
+    except:
+        result = default
+    if result < 0:
+        result = default
+    return result
@@ -5,22 +5,41 @@ Updates the database with device SNMP data.
 """
 
 # Standard libraries
+from concurrent.futures import ThreadPoolExecutor
 from multiprocessing import Pool
-from collections import namedtuple
+from collections import namedtuple, deque
+from functools import partial
 from pprint import pprint
+import asyncio
+import datetime
+import queue
+import threading
+import time
 import os
 
 # Import app libraries
 from switchmap import API_POLLER_POST_URI
+from switchmap import API_POLLER_BATCH_URI
 from switchmap.poller.snmp import poller
+from switchmap.poller.snmp import simulator
 from switchmap.poller.update import device as udevice
 from switchmap.poller.configuration import ConfigPoller
+from switchmap.poller.scheduler import Scheduler
+from switchmap.poller import breaker
+from switchmap.poller import spool
 from switchmap.core import log
 from switchmap.core import rest
 from switchmap.core import files
+from switchmap.core import delta
+from switchmap.core import payload
 from switchmap import AGENT_POLLER
 
 _META = namedtuple("_META", "zone hostname config")
+_UPLOAD = namedtuple("_UPLOAD", "name data version filepath body")
+
+# Device data waiting to be posted in a batch by the current process
+_BATCH = None
+_LOCK = threading.Lock()
 
 
 def devices(multiprocessing=False):
@@ -57,12 +76,547 @@ def devices(multiprocessing=False):
         for argument in arguments:
             device(argument)
 
+    elif config.polling_engine() == "asyncio":
+        # Poll all devices concurrently from a single process
+        asyncio.run(
+            _devices_asyncio(
+                arguments,
+                device,
+                concurrency=config.polling_concurrency(),
+                zone_concurrency=config.zone_concurrency(),
+            )
+        )
+
+    elif config.server_batch_size() > 1:
+        # Post the data polled by the sub processes in batches
+        with Pool(processes=pool_size) as pool:
+            for value in pool.imap_unordered(_query, arguments):
+                _sent(value, config)
+
     else:
         # Create a multiprocessing pool of sub process resources
         with Pool(processes=pool_size) as pool:
             # Create sub processes from the pool
             pool.map(device, arguments)
 
+    # Post the data left in the batch
+    _flush()
+
+
+async def _devices_asyncio(
+    arguments, function, concurrency=100, zone_concurrency=100
+):
+    """Poll devices concurrently using asyncio.
+
+    The SNMP library blocks, so each poll is run in a thread of a bounded
+    executor. Semaphores limit the number of simultaneous polls globally
+    and per zone.
+
+    Args:
+        arguments: List of _META objects
+        function: Function to run with each _META object as its argument
+        concurrency: Maximum number of simultaneous polls
+        zone_concurrency: Maximum number of simultaneous polls per zone
+
+    Returns:
+        None
+
+    """
+    # Initialize key variables
+    loop = asyncio.get_running_loop()
+    fleet = asyncio.Semaphore(concurrency)
+    zones = {}
+
+    # Create a semaphore per zone
+    for argument in arguments:
+        if argument.zone not in zones:
+            zones[argument.zone] = asyncio.Semaphore(zone_concurrency)
+
+    async def _poll(argument):
+        """Poll a single device once the concurrency limits allow it.
+
+        Args:
+            argument: _META object
+
+        Returns:
+            None
+
+        """
+        async with zones[argument.zone]:
+            async with fleet:
+                try:
+                    await loop.run_in_executor(executor, function, argument)
+                except Exception as error:
+                    log_message = """\
+Polling of device {} in zone "{}" failed: {}""".format(
+                        argument.hostname, argument.zone, error
+                    )
+                    log.log2warning(2008, log_message)
+
+    # Poll the devices
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        await asyncio.gather(*[_poll(_) for _ in arguments])
+
+
+class _Control:
+    """Decide when to stop polling and refresh the devices to poll."""
+
+    def __init__(self, scheduler, breaker=None):
+        """Initialize the class.
+
+        Args:
+            scheduler: Scheduler object
+            breaker: Breaker object. Failing devices aren't backed off if
+                None
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self.scheduler = scheduler
+        self._breaker = breaker
+        self._config = None
+        self._refresh = 0
+
+    def running(self):
+        """Determine whether polling should continue.
+
+        The devices to poll are read from the configuration again every
+        polling_interval seconds.
+
+        Args:
+            None
+
+        Returns:
+            result: False if the daemon is shutting down
+
+        """
+        # Refresh the devices to poll
+        now = time.time()
+        if now >= self._refresh:
+            self._config = ConfigPoller()
+            self.scheduler.update(_tasks(self._config), now=now)
+            self._refresh = now + self._config.polling_interval()
+
+        # Post the device data waiting in a batch for too long
+        _flush(force=False)
+
+        # Stop if the skip file exists
+        skip_file = files.skip_file(AGENT_POLLER, self._config)
+        result = os.path.isfile(skip_file) is False
+        return result
+
+    def pop(self):
+        """Get the next device that is due and isn't backed off.
+
+        Args:
+            None
+
+        Returns:
+            result: _META object, None if no device is due
+
+        """
+        while True:
+            result = self.scheduler.pop()
+            if result is None or self._breaker is None:
+                return result
+
+            # Skip the device until the end of its backoff period
+            wait = self._breaker.wait(result.hostname)
+            if bool(wait) is False:
+                return result
+            self.scheduler.done((result.zone, result.hostname), delay=wait)
+
+    def done(self, argument, result=None, error=None):
+        """Schedule the next poll of a device once polled.
+
+        Args:
+            argument: _META object
+            result: True if the device was polled, False if the poll
+                failed, None if the device wasn't polled
+            error: Exception raised by the poll
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        delay = 0
+
+        # Log failures
+        if error is not None:
+            result = False
+            log_message = """\
+Polling of device {} in zone "{}" failed: {}""".format(
+                argument.hostname, argument.zone, error
+            )
+            log.log2warning(2016, log_message)
+
+        # Back off devices that keep failing
+        if self._breaker is not None:
+            if result is True:
+                self._breaker.success(argument.hostname)
+            elif result is False:
+                delay = self._breaker.failure(argument.hostname)
+
+        # Schedule the next poll
+        self.scheduler.done((argument.zone, argument.hostname), delay=delay)
+
+
+def schedule(multiprocessing=False):
+    """Poll devices continuously as they become due.
+
+    Each device is polled again once its polling interval has elapsed since
+    the start of its previous poll. Polling stops when the daemon's skip
+    file is created.
+
+    Args:
+        multiprocessing: Run multiprocessing when True
+
+    Returns:
+        None
+
+    """
+    # Get configuration
+    config = ConfigPoller()
+    control = _Control(
+        Scheduler(jitter=config.polling_jitter()),
+        breaker=breaker.Breaker(
+            threshold=config.breaker_threshold(),
+            backoff=config.breaker_backoff(),
+        ),
+    )
+
+    # Post the data spooled while the server was unavailable. The thread is
+    # started after the pool of sub processes is forked
+    drainer = spool.Drainer(
+        spool.Spool(config),
+        partial(_repost, config),
+        interval=config.spool_interval(),
+    )
+
+    # Process the data
+    if bool(multiprocessing) is False:
+        drainer.start()
+        _schedule(control, partial(_serial, device), 1)
+
+    elif config.polling_engine() == "asyncio":
+        # Poll devices concurrently from a single process
+        drainer.start()
+        asyncio.run(
+            _schedule_asyncio(
+                control,
+                device,
+                concurrency=config.polling_concurrency(),
+                zone_concurrency=config.zone_concurrency(),
+            )
+        )
+
+    else:
+        # Create a multiprocessing pool of sub process resources
+        with Pool(processes=config.agent_subprocesses()) as pool:
+            drainer.start()
+
+            def _submit(argument, done):
+                """Poll a device in a sub process.
+
+                Args:
+                    argument: _META object
+                    done: Function to call once polled
+
+                Returns:
+                    None
+
+                """
+                if config.server_batch_size() > 1:
+                    # Post the data in batches from this process
+                    pool.apply_async(
+                        _query,
+                        (argument,),
+                        callback=partial(_callback, argument, done),
+                        error_callback=lambda error: done(
+                            argument, error=error
+                        ),
+                    )
+                else:
+                    pool.apply_async(
+                        device,
+                        (argument,),
+                        callback=lambda result: done(argument, result),
+                        error_callback=lambda error: done(
+                            argument, error=error
+                        ),
+                    )
+
+            _schedule(control, _submit, config.agent_subprocesses())
+
+    # Post the data left in the batch
+    _flush()
+    drainer.stop()
+
+
+def _callback(argument, done, value):
+    """Post the data polled by a sub process.
+
+    Args:
+        argument: _META object
+        done: Function to call once posted
+        value: Tuple returned by _query()
+
+    Returns:
+        None
+
+    """
+    # Exceptions would stop the pool from returning further results
+    try:
+        result = _sent(value, argument.config)
+    except Exception as error:
+        done(argument, error=error)
+    else:
+        done(argument, result)
+
+
+def _tasks(config):
+    """Get the devices to poll and their polling intervals.
+
+    Args:
+        config: ConfigPoller object
+
+    Returns:
+        result: Dict of (_META, interval) tuples keyed by (zone, hostname)
+
+    """
+    # Initialize key variables
+    result = {}
+    default = config.polling_interval()
+
+    # Get the interval of each device
+    for zone in config.zones():
+        for hostname in zone.hostnames or []:
+            interval = zone.hostname_intervals.get(
+                hostname, zone.polling_interval or default
+            )
+            result[(zone.name, hostname)] = (
+                _META(zone=zone.name, hostname=hostname, config=config),
+                interval,
+            )
+
+    # Devices polled less often than the server ingests data are missing
+    # from the events created while they aren't polled
+    ingest_interval = config.ingest_interval()
+    if bool(ingest_interval) is True and bool(result) is True:
+        (zone, hostname), (_, interval) = max(
+            result.items(), key=lambda _: _[1][1]
+        )
+        if interval > ingest_interval:
+            log_message = (
+                'Device {} in zone "{}" is polled every {}s, less often than '
+                "the {}s ingest_interval of the server. Devices must be "
+                "polled at least once per ingest_interval to appear in every "
+                "event".format(hostname, zone, interval, ingest_interval)
+            )
+            log.log2warning(2048, log_message)
+
+    # Return
+    return result
+
+
+def _serial(function, argument, done):
+    """Poll a device in the current process.
+
+    Args:
+        function: Function to run with the _META object as its argument
+        argument: _META object
+        done: Function to call once polled
+
+    Returns:
+        None
+
+    """
+    # Poll
+    try:
+        result = function(argument)
+    except Exception as error:
+        done(argument, error=error)
+    else:
+        done(argument, result)
+
+
+def _schedule(control, submit, capacity):
+    """Start polling devices as they become due.
+
+    Args:
+        control: _Control object
+        submit: Function that starts polling a _META object. Its second
+            argument is a function to call with the _META object, the
+            result of the poll and the exception raised if any, once polled
+        capacity: Maximum number of simultaneous polls
+
+    Returns:
+        None
+
+    """
+    # Initialize key variables
+    finished = queue.Queue()
+    active = 0
+
+    def _done(argument, result=None, error=None):
+        """Report the end of a poll.
+
+        Args:
+            argument: _META object
+            result: Value returned by the poll
+            error: Exception raised by the poll
+
+        Returns:
+            None
+
+        """
+        finished.put((argument, result, error))
+
+    while True:
+        running = control.running()
+
+        # Start polling the devices that are due
+        while running is True and active < capacity:
+            argument = control.pop()
+            if argument is None:
+                break
+            submit(argument, _done)
+            active += 1
+
+        # Stop once the polls in progress are complete
+        if running is False and active == 0:
+            break
+
+        # Wait for a poll to complete or the next device to be due
+        timeout = control.scheduler.wait()
+        if timeout is None or active >= capacity:
+            timeout = 1
+        try:
+            argument, result, error = finished.get(timeout=min(timeout, 1))
+        except queue.Empty:
+            continue
+
+        # Schedule the next poll of the device
+        active -= 1
+        control.done(argument, result=result, error=error)
+
+
+async def _schedule_asyncio(
+    control, function, concurrency=100, zone_concurrency=100
+):
+    """Start polling devices as they become due using asyncio.
+
+    Devices due in zones that already have zone_concurrency polls in
+    progress wait without holding one of the concurrency slots, so that they
+    don't hold up the polling of other zones.
+
+    Args:
+        control: _Control object
+        function: Function to run with each _META object as its argument
+        concurrency: Maximum number of simultaneous polls
+        zone_concurrency: Maximum number of simultaneous polls per zone
+
+    Returns:
+        None
+
+    """
+    # Initialize key variables
+    loop = asyncio.get_running_loop()
+    fleet = asyncio.Semaphore(concurrency)
+    changed = asyncio.Event()
+    zones = {}
+    waiting = {}
+    tasks = set()
+
+    async def _poll(argument):
+        """Poll a single device.
+
+        Args:
+            argument: _META object
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        result = None
+        error = None
+
+        # Poll
+        try:
+            result = await loop.run_in_executor(executor, function, argument)
+        except Exception as _error:
+            error = _error
+
+        # Schedule the next poll of the device
+        control.done(argument, result=result, error=error)
+        zones[argument.zone] -= 1
+        fleet.release()
+        changed.set()
+
+    def _next():
+        """Get the next device whose zone has capacity for another poll.
+
+        Args:
+            None
+
+        Returns:
+            result: _META object, None if no device can be polled
+
+        """
+        # Devices that waited for their zone go first
+        for zone, pending in waiting.items():
+            if bool(pending) is True and zones[zone] < zone_concurrency:
+                return pending.popleft()
+
+        # Set aside the devices due in zones without capacity
+        while True:
+            result = control.pop()
+            if result is None:
+                return result
+            zones.setdefault(result.zone, 0)
+            if zones[result.zone] < zone_concurrency:
+                return result
+            waiting.setdefault(result.zone, deque()).append(result)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        # Don't block the loop with the configuration refreshes and the
+        # posts of batches of data
+        while await loop.run_in_executor(None, control.running) is True:
+            # Wait for a free worker
+            await fleet.acquire()
+
+            # Wait for the next device to be due
+            changed.clear()
+            argument = _next()
+            if argument is None:
+                fleet.release()
+                timeout = control.scheduler.wait()
+                timeout = 1 if timeout is None else min(timeout, 1)
+                try:
+                    await asyncio.wait_for(changed.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            # Poll the device
+            zones[argument.zone] += 1
+            task = asyncio.ensure_future(_poll(argument))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        # Wait for the polls in progress
+        if bool(tasks) is True:
+            await asyncio.gather(*tasks)
+
+        # Schedule the devices that didn't get to be polled
+        for pending in waiting.values():
+            for argument in pending:
+                control.done(argument)
+
 
 def device(poll, post=True):
     """Poll single device for data and create YAML files.
@@ -72,13 +626,41 @@ def device(poll, post=True):
         post: Post the data if True, else just print it.
 
     Returns:
-        None
+        result: True if the device was polled, False if it returned no
+            data, None if it wasn't polled
+
+    """
+    # Poll
+    result, data = _query(poll)
+
+    # Update the database tables with polled data
+    if data is not None:
+        if bool(post) is True:
+            _send(data, poll.config)
+        else:
+            pprint(data)
+
+    # Return
+    return result
+
+
+def _query(poll):
+    """Poll single device for data.
+
+    Args:
+        poll: _META object
+
+    Returns:
+        result: Tuple of the result of device() and the data polled. The
+            data is None if the device wasn't polled
 
     """
     # Initialize key variables
     hostname = poll.hostname
     zone = poll.zone
     config = poll.config
+    result = None
+    data = None
 
     # Do nothing if the skip file exists
     skip_file = files.skip_file(AGENT_POLLER, config)
@@ -89,7 +671,7 @@ shutdown request was probably requested""".format(
             skip_file, hostname, zone
         )
         log.log2debug(1041, log_message)
-        return
+        return (result, data)
 
     # Poll data for obviously valid hostnames (eg. "None" used in installation)
     if bool(hostname) is True:
@@ -104,12 +686,7 @@ shutdown request was probably requested""".format(
                     _device = udevice.Device(snmp_data)
                     data = _device.process()
                     data["misc"]["zone"] = zone
-
-                    if bool(post) is True:
-                        # Update the database tables with polled data
-                        rest.post(API_POLLER_POST_URI, data, config)
-                    else:
-                        pprint(data)
+                    result = True
                 else:
                     log_message = """\
 Device {} returns no data. Check your connectivity and/or SNMP configuration\
@@ -117,13 +694,395 @@ Device {} returns no data. Check your connectivity and/or SNMP configuration\
                         hostname
                     )
                     log.log2debug(1025, log_message)
+                    result = False
+
+    # Return
+    return (result, data)
+
+
+def _sent(value, config):
+    """Send the data returned by _query() from a sub process.
+
+    Args:
+        value: Tuple returned by _query()
+        config: ConfigPoller object
+
+    Returns:
+        result: Result of device()
+
+    """
+    # Send
+    result, data = value
+    if data is not None:
+        _send(data, config)
+    return result
+
+
+def _send(data, config):
+    """Post device data to the server, in batches if configured.
+
+    Args:
+        data: Device data
+        config: ConfigPoller object
+
+    Returns:
+        None
+
+    """
+    # Post
+    if config.server_batch_size() > 1:
+        _batch(config).add(data)
+    else:
+        _post(data, config)
+
+
+class _Batch:
+    """Device data waiting to be posted to the server in a single request.
+
+    The data is posted once the batch has server_batch_size devices, or
+    when flushed after server_batch_interval seconds.
+
+    """
+
+    def __init__(self, config):
+        """Initialize the class.
+
+        Args:
+            config: ConfigPoller object
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._config = config
+        self._size = config.server_batch_size()
+        self._interval = config.server_batch_interval()
+        self._lock = threading.Lock()
+        self._uploads = []
+        self._start = 0
+        self._supported = True
+
+    def add(self, data):
+        """Add device data to the batch.
+
+        Args:
+            data: Device data
+
+        Returns:
+            None
+
+        """
+        # Add the data
+        upload = _upload(data, self._config)
+        with self._lock:
+            if bool(self._uploads) is False:
+                self._start = time.time()
+            self._uploads.append(upload)
+            full = len(self._uploads) >= self._size
+
+        # Post the batch if full
+        if full is True:
+            self.flush()
+
+    def flush(self, force=True):
+        """Post the data in the batch.
 
+        Args:
+            force: Post the data even if the batch isn't older than
+                server_batch_interval if True
+
+        Returns:
+            None
+
+        """
+        # Get the data to post
+        with self._lock:
+            if bool(self._uploads) is False:
+                return
+            if force is False and time.time() - self._start < self._interval:
+                return
+            uploads = self._uploads
+            self._uploads = []
+
+        # Servers without the batch URI are sent each device's data
+        if self._supported is True:
+            result = rest.post(
+                API_POLLER_BATCH_URI,
+                {"batch": [_.body for _ in uploads]},
+                self._config,
+                binary=True,
+            )
+            if _status(result) in [404, 405]:
+                self._supported = False
+                log_message = """\
+Server doesn't accept batches of device data. Posting each device's data \
+separately"""
+                log.log2info(2021, log_message)
+        if self._supported is False:
+            for upload in uploads:
+                _post(upload.data, self._config)
+            return
+
+        # Check the result for each device
+        status = _status(result)
+        if bool(getattr(result, "success", False)) is True:
+            status = None
+        results = _results(result, len(uploads))
+        for upload, item in zip(uploads, results):
+            _complete(
+                upload,
+                item.get("status", status),
+                item.get("version"),
+                self._config,
+            )
+
+
+def _batch(config):
+    """Get the batch of device data of the current process.
+
+    Args:
+        config: ConfigPoller object
+
+    Returns:
+        result: _Batch object
+
+    """
+    # Create the batch
+    global _BATCH
+    with _LOCK:
+        if _BATCH is None:
+            _BATCH = _Batch(config)
+        result = _BATCH
+    return result
+
+
+def _flush(force=True):
+    """Post the batch of device data of the current process.
+
+    Args:
+        force: Post the data even if the batch isn't older than
+            server_batch_interval if True
+
+    Returns:
+        None
+
+    """
+    # Post
+    if _BATCH is not None:
+        _BATCH.flush(force=force)
+
+
+def _upload(data, config):
+    """Prepare device data for posting.
+
+    Only the changes since the last post are sent if the server confirmed
+    that it has the data of that post.
+
+    Args:
+        data: Device data
+        config: ConfigPoller object
+
+    Returns:
+        result: _UPLOAD object
+
+    """
+    # Initialize key variables
+    data = delta.canonical(data)
+    version = delta.version(data)
+    hostname = data["misc"]["host"]
+    zone = data["misc"]["zone"]
+    name = delta.filename(hostname, zone)
+    filepath = files.base_file(name, config)
+    base = None
+    body = data
+
+    # Read the data the server last confirmed
+    if os.path.isfile(filepath) is True:
+        try:
+            base = payload.load(filepath)
+        except Exception:
+            base = None
+
+    # Post only the changes
+    if isinstance(base, dict) is True and "data" in base:
+        body = {
+            "delta": {
+                "host": hostname,
+                "zone": zone,
+                "base": base.get("version"),
+                "version": version,
+                "changes": delta.diff(base["data"], data),
+            }
+        }
+
+    # Return
+    result = _UPLOAD(
+        name=name, data=data, version=version, filepath=filepath, body=body
+    )
+    return result
+
+
+def _post(data, config):
+    """Post device data to the server.
+
+    Only the changes since the last post are sent if the server confirmed
+    that it has the data of that post. The full data is sent otherwise, or
+    when the server can't apply the changes.
+
+    Args:
+        data: Device data
+        config: ConfigPoller object
+
+    Returns:
+        result: Post named tuple of the last post
 
-def cli_device(hostname):
+    """
+    # Post
+    upload = _upload(data, config)
+    result = rest.post(API_POLLER_POST_URI, upload.body, config, binary=True)
+
+    # Return
+    result = (
+        _complete(upload, _status(result), _version(result), config) or result
+    )
+    return result
+
+
+def _complete(upload, status, version, config):
+    """Complete the post of device data.
+
+    Data is spooled, and posted again later, if the server can't be
+    reached or fails to save it.
+
+    Args:
+        upload: _UPLOAD object
+        status: HTTP status of the post, None if the server wasn't reached
+        version: Version of the data the server has after the post
+        config: ConfigPoller object
+
+    Returns:
+        result: Post named tuple if all the data had to be posted again,
+            else None
+
+    """
+    # Initialize key variables
+    result = None
+
+    # Post all the data if the server didn't apply the changes
+    if status is not None and upload.body is not upload.data:
+        if version != upload.version:
+            result = rest.post(
+                API_POLLER_POST_URI, upload.data, config, binary=True
+            )
+            status = _status(result)
+            version = _version(result)
+
+    # Keep the data as the base of the next post if the server has it
+    if version == upload.version:
+        payload.dump(
+            {"version": upload.version, "data": upload.data}, upload.filepath
+        )
+    elif os.path.isfile(upload.filepath) is True:
+        os.remove(upload.filepath)
+
+    # Keep the data until the server is available again. The spooled data
+    # of the device is older than data the server accepted
+    if status is None or status >= 500:
+        spool.Spool(config).put(upload.data, upload.name)
+    elif status < 400:
+        spool.Spool(config).remove(upload.name)
+
+    # Return
+    return result
+
+
+def _repost(config, data):
+    """Post spooled device data to the server.
+
+    Args:
+        config: ConfigPoller object
+        data: Device data
+
+    Returns:
+        result: Post named tuple
+
+    """
+    # Return
+    result = rest.post(API_POLLER_POST_URI, data, config, binary=True)
+    return result
+
+
+def _version(result):
+    """Get the version of the data the server has after a post.
+
+    Args:
+        result: Post named tuple
+
+    Returns:
+        version: Version, None if unknown
+
+    """
+    # Initialize key variables
+    response = getattr(result, "response", None)
+    headers = getattr(response, "headers", None)
+    version = None
+
+    # Servers that don't support changes don't return the version
+    if bool(getattr(result, "success", False)) is True and bool(headers):
+        version = headers.get(delta.HEADER)
+    return version
+
+
+def _status(result):
+    """Get the HTTP status of a post.
+
+    Args:
+        result: Post named tuple
+
+    Returns:
+        status: HTTP status, None if the post failed
+
+    """
+    # Return
+    status = getattr(getattr(result, "response", None), "status_code", None)
+    return status
+
+
+def _results(result, count):
+    """Get the result of posting the data of each device in a batch.
+
+    Args:
+        result: Post named tuple of the batch
+        count: Number of devices in the batch
+
+    Returns:
+        results: List of dicts of the status and version of each device
+
+    """
+    # Initialize key variables
+    results = []
+
+    # Get the results
+    if bool(getattr(result, "success", False)) is True:
+        try:
+            results = list(result.response.json()["results"])
+        except Exception:
+            results = []
+
+    # Devices without a valid result weren't posted
+    if len(results) != count:
+        results = [{}] * count
+    return results
+
+
+def cli_device(hostname, record=None):
     """Poll single device for data and create YAML files.
 
     Args:
         hostname: Host to poll
+        record: File to which the SNMP values of the poll are recorded.
+            Not recorded if None
 
     Returns:
         None
@@ -131,6 +1090,7 @@ def cli_device(hostname):
     """
     # Initialize key variables
     arguments = []
+    recording = simulator.Recording()
 
     # Get configuration
     config = ConfigPoller()
@@ -147,8 +1107,77 @@ def cli_device(hostname):
                 )
 
     if bool(arguments) is True:
-        for argument in arguments:
-            device(argument, post=False)
+        # Record the SNMP values returned by the device
+        if bool(record) is True:
+            recording.start()
+        try:
+            for argument in arguments:
+                device(argument, post=False)
+        finally:
+            recording.stop()
+
+        # Save the recording
+        capture = recording.captures().get(hostname)
+        if bool(record) is True and capture is not None:
+            simulator.save(capture, record)
+            log_message = "Recorded the poll of host {} to {}".format(
+                hostname, record
+            )
+            log.log2see(2028, log_message)
     else:
         log_message = "No hostname {} found in configuration".format(hostname)
         log.log2see(1036, log_message)
+
+
+def cli_breakers():
+    """Print the circuit breaker state of devices whose polls are failing.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+    # Initialize key variables
+    states = breaker.status()
+    now = time.time()
+
+    # Nothing to do if no devices are failing
+    if bool(states) is False:
+        print("No devices are failing to poll.")
+        return
+
+    # Print the state of each device
+    print(
+        "{:<40} {:>8}  {:<19}  {}".format(
+            "Hostname", "Failures", "Last failure", "Backed off until"
+        )
+    )
+    for hostname, state in sorted(states.items()):
+        until = state.get("until", 0)
+        print(
+            "{:<40} {:>8}  {:<19}  {}".format(
+                hostname,
+                state.get("failures", 0),
+                _timestamp(state.get("last", 0)),
+                _timestamp(until) if until > now else "",
+            )
+        )
+
+
+def _timestamp(value):
+    """Convert a timestamp to a readable date and time.
+
+    Args:
+        value: Timestamp
+
+    Returns:
+        result: Date and time string
+
+    """
+    # Return
+    result = datetime.datetime.fromtimestamp(value).strftime(
+        "%Y-%m-%d %H:%M:%S"
+    )
+    return result
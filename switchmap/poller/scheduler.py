@@ -0,0 +1,187 @@
+"""Module to decide when devices are next polled."""
+
+from collections import namedtuple
+import heapq
+import itertools
+import random
+import threading
+import time
+
+_TASK = namedtuple("_TASK", "argument interval")
+
+
+class Scheduler:
+    """Min-heap of the times at which devices are next due for polling.
+
+    Devices are removed from the heap while they are polled, and added back
+    with their next due time once the poll is complete. A slow device is
+    therefore never polled twice at the same time, and it never delays the
+    polling of the other devices.
+
+    """
+
+    def __init__(self, jitter=0.1):
+        """Initialize the class.
+
+        Args:
+            jitter: Fraction of the polling interval by which polls are
+                randomly spread
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._jitter = jitter
+        self._lock = threading.Lock()
+        self._heap = []
+        self._tasks = {}
+        self._sequences = {}
+        self._started = {}
+        self._counter = itertools.count()
+
+    def update(self, tasks, now=None):
+        """Set the devices to poll.
+
+        New devices are first polled at random times within the jitter of
+        their interval. Devices that are no longer listed aren't polled
+        again.
+
+        Args:
+            tasks: Dict of (argument, interval) tuples keyed by a unique
+                device key. The argument is passed to the polling function
+            now: Current timestamp
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        now = time.time() if now is None else now
+
+        with self._lock:
+            # Forget the devices that are no longer polled
+            for key in set(self._tasks) - set(tasks):
+                self._tasks.pop(key)
+                self._sequences.pop(key, None)
+
+            # Add the new devices and update the others
+            for key, (argument, interval) in tasks.items():
+                new = key not in self._tasks
+                self._tasks[key] = _TASK(argument=argument, interval=interval)
+                if new is True and key not in self._started:
+                    self._push(
+                        key, now + random.uniform(0, interval * self._jitter)
+                    )
+
+    def pop(self, now=None):
+        """Get the next device that is due for polling.
+
+        Args:
+            now: Current timestamp
+
+        Returns:
+            result: Argument of the device, None if no device is due
+
+        """
+        # Initialize key variables
+        now = time.time() if now is None else now
+        result = None
+
+        with self._lock:
+            while bool(self._heap) is True:
+                due, sequence, key = self._heap[0]
+
+                # Discard the entries of devices that were removed
+                if self._sequences.get(key) != sequence:
+                    heapq.heappop(self._heap)
+                    continue
+
+                # Nothing to do if the device isn't due
+                if due > now:
+                    break
+
+                # Remove the device while it is polled
+                heapq.heappop(self._heap)
+                self._sequences.pop(key)
+                self._started[key] = now
+                result = self._tasks[key].argument
+                break
+
+        # Return
+        return result
+
+    def done(self, key, now=None, delay=0):
+        """Schedule the next poll of a device once polled.
+
+        Args:
+            key: Key of the device
+            now: Current timestamp
+            delay: Minimum number of seconds before the next poll
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        now = time.time() if now is None else now
+
+        with self._lock:
+            started = self._started.pop(key, now)
+
+            # Nothing to do if the device is no longer polled
+            if key not in self._tasks:
+                return
+
+            # The next poll is due an interval after the start of this one.
+            # It is due now if the poll took longer than the interval.
+            interval = self._tasks[key].interval
+            due = started + interval * (
+                1 + random.uniform(-self._jitter, self._jitter)
+            )
+            self._push(key, max(due, now + delay))
+
+    def wait(self, now=None):
+        """Get the number of seconds until the next device is due.
+
+        Args:
+            now: Current timestamp
+
+        Returns:
+            result: Seconds, None if there are no devices to poll
+
+        """
+        # Initialize key variables
+        now = time.time() if now is None else now
+        result = None
+
+        # Get the time of the first valid entry
+        with self._lock:
+            while bool(self._heap) is True:
+                due, sequence, key = self._heap[0]
+                if self._sequences.get(key) != sequence:
+                    heapq.heappop(self._heap)
+                    continue
+                result = max(due - now, 0)
+                break
+
+        # Return
+        return result
+
+    def _push(self, key, due):
+        """Add a device to the heap.
+
+        Args:
+            key: Key of the device
+            due: Timestamp at which the device is due
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        sequence = next(self._counter)
+
+        # Add the entry
+        self._sequences[key] = sequence
+        heapq.heappush(self._heap, (due, sequence, key))
@@ -63,3 +63,39 @@ class Query:
 
         # Return
         return validity
+
+    def walk_table(self, oids):
+        """Walk several columns of a table ahead of their use.
+
+        The SNMP object keeps the results of each column, so the later
+        walks of the columns don't query the device.
+
+        Args:
+            oids: List of column OIDs sharing the same table index
+
+        Returns:
+            None
+
+        """
+        # Walk the columns
+        self.snmp_object.table(oids)
+
+    def swalk_contexts(self, oid, context_names, normalized=False):
+        """Walk an OID in several SNMP contexts.
+
+        Args:
+            oid: OID to walk
+            context_names: List of SNMPv3 context names to walk
+            normalized: If True, then return results as a dict keyed by
+                only the last node of an OID, otherwise return results
+                keyed by the entire OID string
+
+        Returns:
+            results: List of walk results, in the order of context_names
+
+        """
+        # Walk the contexts
+        results = self.snmp_object.swalk_contexts(
+            oid, context_names, normalized=normalized
+        )
+        return results
@@ -0,0 +1,204 @@
+"""Module to remember the MIBs supported by devices between polls."""
+
+import hashlib
+import time
+
+from switchmap.poller import store
+from switchmap.core import log
+
+# Seconds by which sysUpTime may lag behind the system clock
+_UPTIME_TOLERANCE = 600
+
+
+class Capabilities:
+    """MIB query classes supported by a device.
+
+    The supported() result of each MIB query class is saved in a profile
+    that is reused by later polls instead of probing the device again. The
+    profile is discarded when the device's sysObjectID or sysDescr change,
+    when sysUpTime goes backwards, or when it is older than the
+    revalidation interval. Probes to which the device didn't respond aren't
+    saved, so the next poll probes the MIB again.
+
+    """
+
+    def __init__(self, snmp_object, interval=86400):
+        """Initialize the class.
+
+        Args:
+            snmp_object: SNMP Interact class object from snmp_manager.py
+            interval: Seconds after which the profile is revalidated
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._snmp_object = snmp_object
+        self._hostname = snmp_object.hostname()
+        self._store = store.store("capabilities")
+        now = int(time.time())
+
+        # Get the identity of the device
+        sysdescr = _value(
+            snmp_object.get(".1.3.6.1.2.1.1.1.0", check_reachability=True)
+        )
+        self._identity = {
+            "sysobjectid": snmp_object.sysobjectid(),
+            "sysdescr": hashlib.md5(str(sysdescr).encode()).hexdigest(),
+            "sysuptime": _value(
+                snmp_object.get(".1.3.6.1.2.1.1.3.0", check_reachability=True)
+            ),
+            "timestamp": now,
+        }
+
+        # Use the saved profile if still valid
+        profile = self._store.get(self._hostname)
+        self._valid = _valid(profile, self._identity, interval, now)
+        self._changed = False
+        if self._valid is True:
+            self._profile = dict(profile)
+            self._profile["supported"] = dict(profile["supported"])
+        else:
+            self._profile = dict(self._identity)
+            self._profile["supported"] = {}
+
+    def valid(self):
+        """Determine whether the saved profile is used.
+
+        Args:
+            None
+
+        Returns:
+            result: True if the saved profile is used
+
+        """
+        # Return
+        result = self._valid
+        return result
+
+    def query(self, query_class):
+        """Get a MIB query object if the device supports the MIB.
+
+        Args:
+            query_class: MIB query class
+
+        Returns:
+            result: Query object, or None if the MIB isn't supported
+
+        """
+        # Initialize key variables
+        name = query_class.__name__
+        supported = self._profile["supported"]
+
+        # Don't even create the object if the MIB is known not to be supported
+        if name in supported and bool(supported[name]) is False:
+            return None
+
+        # Probe the device if the MIB hasn't been checked
+        result = query_class(self._snmp_object)
+        if name not in supported:
+            unreachable = self._snmp_object.unreachable()
+            probe = bool(result.supported())
+
+            # Only remember the result if the device responded to the probe
+            if probe is True or (
+                self._snmp_object.unreachable() == unreachable
+            ):
+                supported[name] = probe
+                self._changed = True
+            if probe is False:
+                result = None
+        return result
+
+    def save(self):
+        """Save the profile for the next polls.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Only save new or updated profiles
+        if self._changed is False:
+            return
+        self._store.update(self._hostname, self._profile)
+
+        # Log
+        log_message = """\
+Saved MIB capabilities of host {}. Supported: {}""".format(
+            self._hostname,
+            sorted(
+                name
+                for name, value in self._profile["supported"].items()
+                if bool(value) is True
+            ),
+        )
+        log.log2debug(2015, log_message)
+
+
+def _valid(profile, identity, interval, now):
+    """Determine whether a saved profile is still valid.
+
+    Args:
+        profile: Saved profile
+        identity: Dict of the device's current identity
+        interval: Seconds after which the profile is revalidated
+        now: Current timestamp
+
+    Returns:
+        result: True if valid
+
+    """
+    # Initialize key variables
+    result = False
+
+    # Check the profile
+    if isinstance(profile, dict) is False:
+        return result
+    if isinstance(profile.get("supported"), dict) is False:
+        return result
+    if now - int(profile.get("timestamp", 0)) >= interval:
+        return result
+    for key in ["sysobjectid", "sysdescr"]:
+        if profile.get(key) != identity[key]:
+            return result
+
+    # The device has restarted if sysUpTime, in hundredths of a second, has
+    # increased less than the time since the profile was created.
+    if identity["sysuptime"] is None or profile.get("sysuptime") is None:
+        return result
+    elapsed = now - int(profile["timestamp"]) - _UPTIME_TOLERANCE
+    if int(identity["sysuptime"]) < int(profile["sysuptime"]) + elapsed * 100:
+        return result
+
+    # Return
+    result = True
+    return result
+
+
+def _value(results):
+    """Get the value of an SNMP get.
+
+    Args:
+        results: Dict of results keyed by OID
+
+    Returns:
+        result: Value
+
+    """
+    # Initialize key variables
+    result = None
+
+    # Get the value
+    if isinstance(results, dict) is True:
+        for value in results.values():
+            result = value
+            break
+
+    # Bytes can't be compared with the saved YAML values
+    if isinstance(result, bytes) is True:
+        result = result.decode("utf-8", errors="replace")
+    return result
@@ -0,0 +1,273 @@
+"""Module to reuse the interface data of devices between polls."""
+
+from math import ceil
+
+from switchmap.poller.configuration import ConfigPoller
+from switchmap.poller.snmp import snmp_manager
+from switchmap.poller import store
+from switchmap.core import files
+from switchmap.core import log
+
+# OIDs of sysUpTime and IF-MIB::ifLastChange
+SYSUPTIME = ".1.3.6.1.2.1.1.3.0"
+IFLASTCHANGE = ".1.3.6.1.2.1.2.2.1.9"
+
+# Interface table columns, indexed by ifIndex, whose values only change
+# when ifLastChange does. Counters, ifAlias and ifAdminStatus are not
+# included as they change without it.
+COLUMNS = (
+    # IF-MIB::ifIndex
+    ".1.3.6.1.2.1.2.2.1.1",
+    # IF-MIB::ifDescr
+    ".1.3.6.1.2.1.2.2.1.2",
+    # IF-MIB::ifType
+    ".1.3.6.1.2.1.2.2.1.3",
+    # IF-MIB::ifSpeed
+    ".1.3.6.1.2.1.2.2.1.5",
+    # IF-MIB::ifPhysAddress
+    ".1.3.6.1.2.1.2.2.1.6",
+    # IF-MIB::ifOperStatus
+    ".1.3.6.1.2.1.2.2.1.8",
+    # IF-MIB::ifName
+    ".1.3.6.1.2.1.31.1.1.1.1",
+    # IF-MIB::ifHighSpeed
+    ".1.3.6.1.2.1.31.1.1.1.15",
+    # EtherLike-MIB::dot3StatsDuplexStatus
+    ".1.3.6.1.2.1.10.7.2.1.19",
+)
+
+# Number of interfaces whose COLUMNS values are requested together, so that
+# GET requests carry as many values as the GETBULK requests of table walks
+_INTERFACES = max(1, snmp_manager.TABLE_VARBINDS // len(COLUMNS))
+
+
+class Incremental:
+    """Interface data of a device reused by later polls.
+
+    ifLastChange is walked at the start of each poll. The values of COLUMNS
+    saved by the previous poll are provided to the SNMP object for the
+    interfaces whose ifLastChange hasn't changed, so that only the other
+    interfaces are queried. The columns are fully walked when there is no
+    saved data, when the device has restarted, when querying the changed
+    interfaces takes as many requests as walking the columns, or after the
+    configured number of polls.
+
+    """
+
+    def __init__(self, snmp_object, cycles):
+        """Initialize the class.
+
+        Args:
+            snmp_object: SNMP Interact class object from snmp_manager.py
+            cycles: Number of polls between full walks
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._snmp_object = snmp_object
+        self._hostname = snmp_object.hostname()
+        self._store = store.Store(
+            files.incremental_file(self._hostname, ConfigPoller())
+        )
+        self._changed = None
+
+        # Get the state of the device. ifLastChange is provided to the SNMP
+        # object so that the IF-MIB table walk doesn't walk it again
+        lastchange = snmp_object.swalk(IFLASTCHANGE)
+        if bool(lastchange) is True:
+            snmp_object.preload(IFLASTCHANGE, lastchange)
+        self._state = {
+            "sysuptime": _uptime(
+                snmp_object.get(SYSUPTIME, check_reachability=True)
+            ),
+            "lastchange": {
+                oid.split(".")[-1]: value for oid, value in lastchange.items()
+            },
+            "polls": 0,
+            "columns": {},
+        }
+
+        # Reuse the saved data if still valid and cheaper than a walk
+        saved = self._store.get("poll")
+        if _valid(saved, self._state, cycles) is True:
+            changed = sorted(
+                index
+                for index, value in self._state["lastchange"].items()
+                if saved["lastchange"].get(index) != value
+            )
+            if _requests(len(changed)) < _requests(
+                len(self._state["lastchange"])
+            ):
+                self._changed = changed
+        if self._changed is not None:
+            if self._preload(saved["columns"]) is True:
+                self._state["polls"] = int(saved["polls"]) + 1
+            else:
+                self._changed = None
+
+    def incremental(self):
+        """Determine whether the saved data is reused.
+
+        Args:
+            None
+
+        Returns:
+            result: True if the saved data is reused
+
+        """
+        # Return
+        result = self._changed is not None
+        return result
+
+    def save(self):
+        """Save the interface data polled for the next polls.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Get the values of the columns
+        for column in COLUMNS:
+            values = self._snmp_object.cached(column, normalized=True)
+            if values is not None:
+                self._state["columns"][column] = values
+
+        # Save
+        self._store.update("poll", self._state)
+
+    def _preload(self, columns):
+        """Provide the saved values of the columns to the SNMP object.
+
+        Args:
+            columns: Dict of the saved values of each column
+
+        Returns:
+            result: True if the values of the changed interfaces were
+                queried
+
+        """
+        # Initialize key variables
+        result = False
+        current = self._state["lastchange"]
+        changed = set(self._changed)
+        preloads = {}
+
+        # Reuse the values of the interfaces that haven't changed. The
+        # device may have stopped reporting some columns
+        for column, saved in columns.items():
+            if column in COLUMNS and isinstance(saved, dict) is True:
+                preloads[column] = {
+                    "{}.{}".format(column, index): value
+                    for index, value in saved.items()
+                    if index in current and index not in changed
+                }
+
+        # Query the interfaces that have, several interfaces per request
+        for start in range(0, len(self._changed), _INTERFACES):
+            oids = [
+                "{}.{}".format(column, index)
+                for index in self._changed[start : start + _INTERFACES]
+                for column in preloads
+            ]
+            if bool(oids) is False:
+                break
+            results = self._snmp_object.sget(oids)
+            if isinstance(results, dict) is False:
+                return result
+            for oid, value in results.items():
+                if value is not None:
+                    preloads[oid.rsplit(".", 1)[0]][oid] = value
+
+        # Provide the values
+        for column, values in preloads.items():
+            self._snmp_object.preload(column, values)
+
+        # Log
+        log_message = """\
+Polling host {} incrementally. Interfaces changed: {} of {}""".format(
+            self._hostname, len(self._changed), len(current)
+        )
+        log.log2debug(2027, log_message)
+
+        # Return
+        result = True
+        return result
+
+
+def _valid(saved, state, cycles):
+    """Determine whether saved interface data can be reused.
+
+    Args:
+        saved: Saved data
+        state: Dict of the device's current state
+        cycles: Number of polls between full walks
+
+    Returns:
+        result: True if valid
+
+    """
+    # Initialize key variables
+    result = False
+
+    # Check the data
+    if isinstance(saved, dict) is False:
+        return result
+    for key in ["lastchange", "columns"]:
+        if isinstance(saved.get(key), dict) is False:
+            return result
+    if bool(state["lastchange"]) is False:
+        return result
+    if int(saved.get("polls", 0)) + 1 >= cycles:
+        return result
+
+    # The device has restarted if sysUpTime has gone backwards
+    if state["sysuptime"] is None or saved.get("sysuptime") is None:
+        return result
+    if int(state["sysuptime"]) < int(saved["sysuptime"]):
+        return result
+
+    # Return
+    result = True
+    return result
+
+
+def _requests(interfaces):
+    """Estimate the number of requests for the COLUMNS values of interfaces.
+
+    Args:
+        interfaces: Number of interfaces
+
+    Returns:
+        result: Number of requests
+
+    """
+    # Return
+    result = ceil(interfaces / _INTERFACES)
+    return result
+
+
+def _uptime(results):
+    """Get the value of an SNMP get of sysUpTime.
+
+    Args:
+        results: Dict of results keyed by OID
+
+    Returns:
+        result: sysUpTime, None if unknown
+
+    """
+    # Initialize key variables
+    result = None
+
+    # Get the value
+    if isinstance(results, dict) is True:
+        for value in results.values():
+            if isinstance(value, int) is True:
+                result = value
+            break
+    return result
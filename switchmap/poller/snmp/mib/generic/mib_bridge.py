@@ -263,10 +263,7 @@ class BridgeQuery(Query):
 
         # Process values
         oid = ".1.3.6.1.2.1.17.4.3.1.2"
-        for context_name in context_names:
-            results = self._snmp_object.swalk(
-                oid, normalized=False, context_name=context_name
-            )
+        for results in self.swalk_contexts(oid, context_names):
             for key, value in results.items():
                 new_key = key[len(oid) :]
                 data_dict[new_key] = value
@@ -332,10 +329,7 @@ class BridgeQuery(Query):
 
         # Process values
         oid = ".1.3.6.1.2.1.17.4.3.1.1"
-        for context_name in context_names:
-            results = self._snmp_object.swalk(
-                oid, normalized=False, context_name=context_name
-            )
+        for results in self.swalk_contexts(oid, context_names):
             for key, mac_value in results.items():
                 # Assign the mac address to the dictionary
                 new_key = key[len(oid) :]
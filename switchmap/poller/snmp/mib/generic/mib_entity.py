@@ -88,6 +88,20 @@ class EntityQuery(Query):
         data_dict = defaultdict(lambda: defaultdict(dict))
         final = {}
 
+        # Walk the entPhysicalTable columns together
+        self.walk_table(
+            [
+                ".1.3.6.1.2.1.47.1.1.1.1.2",
+                ".1.3.6.1.2.1.47.1.1.1.1.5",
+                ".1.3.6.1.2.1.47.1.1.1.1.7",
+                ".1.3.6.1.2.1.47.1.1.1.1.8",
+                ".1.3.6.1.2.1.47.1.1.1.1.9",
+                ".1.3.6.1.2.1.47.1.1.1.1.10",
+                ".1.3.6.1.2.1.47.1.1.1.1.11",
+                ".1.3.6.1.2.1.47.1.1.1.1.13",
+            ],
+        )
+
         # Get data
         hw_rev = self.entphysicalhardwarerev()
         fw_rev = self.entphysicalfirmwarerev()
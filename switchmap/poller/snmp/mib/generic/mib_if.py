@@ -98,6 +98,28 @@ class IfQuery(Query):
         # Initialize key variables
         final = defaultdict(lambda: defaultdict(dict))
 
+        # Walk the ifTable and ifXTable columns together
+        self.walk_table(
+            [
+                self.ifdescr(oidonly=True),
+                self.ifalias(oidonly=True),
+                self.ifspeed(oidonly=True),
+                self.ifoperstatus(oidonly=True),
+                self.ifadminstatus(oidonly=True),
+                self.iftype(oidonly=True),
+                self.ifname(oidonly=True),
+                self.ifindex(oidonly=True),
+                self.ifphysaddress(oidonly=True),
+                self.ifinoctets(oidonly=True),
+                self.ifoutoctets(oidonly=True),
+                self.ifinbroadcastpkts(oidonly=True),
+                self.ifoutbroadcastpkts(oidonly=True),
+                self.ifinmulticastpkts(oidonly=True),
+                self.ifoutmulticastpkts(oidonly=True),
+                self.iflastchange(oidonly=True),
+            ],
+        )
+
         # Get interface ifDescr data
         _get_data("ifDescr", self.ifdescr, final)
 
@@ -99,6 +99,21 @@ class If64Query(Query):
         # Initialize key variables
         final = defaultdict(lambda: defaultdict(dict))
 
+        # Walk the ifXTable columns together
+        self.walk_table(
+            [
+                self.ifhcoutbroadcastpkts(oidonly=True),
+                self.ifhcoutmulticastpkts(oidonly=True),
+                self.ifhcoutucastpkts(oidonly=True),
+                self.ifhcoutoctets(oidonly=True),
+                self.ifhcinbroadcastpkts(oidonly=True),
+                self.ifhcinmulticastpkts(oidonly=True),
+                self.ifhcinucastpkts(oidonly=True),
+                self.ifhcinoctets(oidonly=True),
+                self.ifhighspeed(oidonly=True),
+            ],
+        )
+
         # Get interface ifHCOutBroadcastPkts data
         _get_data("ifHCOutBroadcastPkts", self.ifhcoutbroadcastpkts, final)
 
@@ -95,6 +95,16 @@ class LldpQuery(Query):
         # Initialize key variables
         final = defaultdict(lambda: defaultdict(dict))
 
+        # Walk the lldpRemTable columns together
+        self.walk_table(
+            [
+                self.lldpremsysname(oidonly=True),
+                self.lldpremsysdesc(oidonly=True),
+                self.lldpremportdesc(oidonly=True),
+                self.lldpremsyscapenabled(oidonly=True),
+            ],
+        )
+
         # Get interface lldpRemSysName data
         values = self.lldpremsysname()
         for key, value in values.items():
@@ -141,7 +151,7 @@ class LldpQuery(Query):
             return oid
 
         # Process results
-        results = self._snmp_object.swalk(oid, normalized=False)
+        results = self.snmp_object.swalk(oid, normalized=False)
         for key, value in results.items():
             # Check if this OID is indexed using iFindex or dot1dBasePort
             ifindex = self._ifindex(key)
@@ -177,7 +187,7 @@ class LldpQuery(Query):
             return oid
 
         # Process results
-        results = self._snmp_object.swalk(oid, normalized=False)
+        results = self.snmp_object.swalk(oid, normalized=False)
         for key, value in results.items():
             # Check if this OID is indexed using iFindex or dot1dBasePort
             ifindex = self._ifindex(key)
@@ -218,7 +228,7 @@ class LldpQuery(Query):
             return oid
 
         # Process results
-        results = self._snmp_object.swalk(oid, normalized=False)
+        results = self.snmp_object.swalk(oid, normalized=False)
         for key, value in results.items():
             # Check if this OID is indexed using iFindex or dot1dBasePort
             ifindex = self._ifindex(key)
@@ -254,7 +264,7 @@ class LldpQuery(Query):
             return oid
 
         # Process results
-        results = self._snmp_object.swalk(oid, normalized=False)
+        results = self.snmp_object.swalk(oid, normalized=False)
         for key, value in results.items():
             # Check if this OID is indexed using iFindex or dot1dBasePort
             ifindex = self._ifindex(key)
@@ -1,9 +1,14 @@
 """SNMP Poller module."""
 
+import time
+
 # Switchmap imports
 from switchmap.poller.configuration import ConfigPoller
 from switchmap.poller import POLLING_OPTIONS, SNMP, POLL
+from switchmap.poller import store
 from . import snmp_info
+from . import capabilities
+from . import incremental
 from . import snmp_manager
 from switchmap.core import log
 
@@ -37,24 +42,53 @@ class Poll:
         self._server_config = ConfigPoller()
         self._hostname = hostname
         self._snmp_object = None
+        self._deadline = None
+
+        # The poll is abandoned if it takes longer than polling_timeout
+        timeout = self._server_config.polling_timeout()
+        if bool(timeout) is True:
+            self._deadline = time.time() + timeout
+        self._adaptive = self._server_config.snmp_adaptive_repetitions()
+
+        # Use the max-repetitions value learned in previous polls if adaptive
+        max_repetitions = self._server_config.snmp_max_repetitions()
+        if self._adaptive is True:
+            max_repetitions = store.store("repetitions").get(
+                hostname, max_repetitions
+            )
+
+        # Options for the SNMP object
+        options = {
+            "max_sessions": self._server_config.snmp_max_sessions(),
+            "context_concurrency": (
+                self._server_config.snmp_context_concurrency()
+            ),
+            "max_repetitions": max_repetitions,
+            "adaptive": self._adaptive,
+        }
 
         # Get snmp configuration information from Switchmap-NG
         validate = snmp_manager.Validate(
             POLLING_OPTIONS(
                 hostname=hostname,
                 authorizations=self._server_config.snmp_auth(),
-            )
+            ),
+            **options,
         )
         authorization = validate.credentials()
 
-        # Create an SNMP object for querying
+        # Create an SNMP object for querying. Reuse the one that validated
+        # the credentials, as it has already queried the device.
         if _do_poll(authorization) is True:
-            self._snmp_object = snmp_manager.Interact(
-                POLL(
-                    hostname=hostname,
-                    authorization=authorization,
+            self._snmp_object = validate.interact()
+            if bool(self._snmp_object) is False:
+                self._snmp_object = snmp_manager.Interact(
+                    POLL(
+                        hostname=hostname,
+                        authorization=authorization,
+                    ),
+                    **options,
                 )
-            )
         else:
             log_message = (
                 "Uncontactable or disabled host {}, or no valid SNMP "
@@ -86,9 +120,55 @@ Querying topology data from host {}.""".format(
         )
         log.log2info(1078, log_message)
 
+        # Use the MIBs known to be supported by the device
+        _capabilities = None
+        interval = self._server_config.snmp_capabilities_interval()
+        if bool(interval) is True:
+            _capabilities = capabilities.Capabilities(
+                self._snmp_object, interval=interval
+            )
+
+        # Reuse the interface data of previous polls
+        _incremental = None
+        cycles = self._server_config.snmp_incremental_cycles()
+        if bool(cycles) is True:
+            _incremental = incremental.Incremental(
+                self._snmp_object, cycles=cycles
+            )
+
         # Return the data polled from the device
-        status = snmp_info.Query(self._snmp_object)
+        status = snmp_info.Query(
+            self._snmp_object,
+            capabilities=_capabilities,
+            incremental=_incremental,
+            deadline=self._deadline,
+        )
         _data = status.everything()
+
+        # Release the SNMP sessions and log their usage
+        self._snmp_object.close()
+        sessions = self._snmp_object.session_statistics()
+        log_message = """\
+Polled host {}. SNMP sessions created: {}, reused: {}""".format(
+            self._hostname, sessions["created"], sessions["reused"]
+        )
+        log.log2info(2009, log_message)
+
+        # Report the SNMP queries that were answered from the cache
+        cache = self._snmp_object.cache_statistics()
+        log_message = """\
+Polled host {}. SNMP query cache hits: {}, misses: {}, hits by OID: {}\
+""".format(
+            self._hostname, cache["hits"], cache["misses"], cache["oids"]
+        )
+        log.log2debug(2012, log_message)
+
+        # Remember the max-repetitions value learned for the device
+        if self._adaptive is True:
+            store.store("repetitions").update(
+                self._hostname, self._snmp_object.max_repetitions()
+            )
+
         return _data
 
 
@@ -0,0 +1,140 @@
+"""Compact records of the data polled from devices."""
+
+
+class Interface:
+    """Layer 1 data of an interface polled from all the MIBs.
+
+    The values are stored in slots instead of a dict per interface, and
+    merged from the layer1() results of each MIB query. Keys that aren't
+    known fields are kept in a dict. dict() converts the record to the
+    schema of the poller's layer1 data.
+
+    """
+
+    # Keys of the layer1() results of the MIB query classes
+    FIELDS = (
+        # IF-MIB
+        "ifDescr",
+        "ifAlias",
+        "ifSpeed",
+        "ifOperStatus",
+        "ifAdminStatus",
+        "ifType",
+        "ifName",
+        "ifIndex",
+        "ifPhysAddress",
+        "ifInOctets",
+        "ifOutOctets",
+        "ifInBroadcastPkts",
+        "ifOutBroadcastPkts",
+        "ifInMulticastPkts",
+        "ifOutMulticastPkts",
+        "ifLastChange",
+        # IF-MIB 64 bit counters
+        "ifHighSpeed",
+        "ifHCInOctets",
+        "ifHCOutOctets",
+        "ifHCInUcastPkts",
+        "ifHCOutUcastPkts",
+        "ifHCInBroadcastPkts",
+        "ifHCOutBroadcastPkts",
+        "ifHCInMulticastPkts",
+        "ifHCOutMulticastPkts",
+        # BRIDGE-MIB
+        "l1_macs",
+        # EtherLike-MIB, ESS-SWITCH-MIB and CISCO-STACK-MIB
+        "dot3StatsDuplexStatus",
+        "swPortDuplexStatus",
+        "portDuplex",
+        # CISCO-C2900-MIB
+        "c2900PortLinkbeatStatus",
+        "c2900PortDuplexStatus",
+        # CISCO-CDP-MIB
+        "cdpCacheDeviceId",
+        "cdpCachePlatform",
+        "cdpCacheDevicePort",
+        # LLDP-MIB
+        "lldpRemSysName",
+        "lldpRemSysDesc",
+        "lldpRemPortDesc",
+        "lldpRemSysCapEnabled",
+        # Q-BRIDGE-MIB
+        "dot1qPvid",
+        # CISCO-VLAN-MEMBERSHIP-MIB
+        "vmVlan",
+        "vmPortStatus",
+        # CISCO-VLAN-IFTABLE-RELATIONSHIP-MIB
+        "cviRoutedVlanIfIndex",
+        # CISCO-VTP-MIB
+        "vlanTrunkPortDynamicState",
+        "vlanTrunkPortDynamicStatus",
+        "vlanTrunkPortNativeVlan",
+        "vlanTrunkPortEncapsulationType",
+        "vlanTrunkPortVlansEnabled",
+        # JUNIPER-VLAN-MIB
+        "jnxExVlanTag",
+        "jnxExVlanPortAccessMode",
+    )
+
+    __slots__ = FIELDS + ("_extra",)
+
+    def __init__(self):
+        """Initialize the class.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._extra = None
+
+    def update(self, values):
+        """Add values to the record.
+
+        Args:
+            values: Dict of values keyed by layer1 key
+
+        Returns:
+            None
+
+        """
+        # Add the values
+        for key, value in values.items():
+            if key in _FIELDS:
+                setattr(self, key, value)
+            else:
+                if self._extra is None:
+                    self._extra = {}
+                self._extra[key] = value
+
+    def dict(self):
+        """Convert the record to a dict.
+
+        Args:
+            None
+
+        Returns:
+            result: Dict of the values keyed by layer1 key
+
+        """
+        # Initialize key variables
+        result = {}
+
+        # Get the values that were set
+        for field in self.FIELDS:
+            value = getattr(self, field, _UNSET)
+            if value is not _UNSET:
+                result[field] = value
+        if self._extra is not None:
+            result.update(self._extra)
+        return result
+
+
+# Set of the fields for fast lookups
+_FIELDS = frozenset(Interface.FIELDS)
+
+# Default of the fields that weren't set
+_UNSET = object()
@@ -0,0 +1,734 @@
+"""Module to record SNMP polls and replay them without devices.
+
+A capture holds every value returned by a device during a poll, for each
+SNMP context. Recording replaces the SNMP sessions of snmp_manager with
+sessions that keep the values returned by devices. Replaying replaces them
+with sessions that answer from captures, so the poller and the MIB classes
+can be benchmarked without a network. fleet() creates captures of many
+simulated devices from a single one.
+
+"""
+
+from bisect import bisect_right
+from collections import namedtuple
+import random
+import threading
+import time
+
+from switchmap.core import payload
+from . import snmp_manager
+
+# SNMP variable returned by sessions. Same attributes as easysnmp's
+Variable = namedtuple("Variable", "oid oid_index value snmp_type")
+
+# Types of the values that are not recorded
+_MISSING = ["NOSUCHOBJECT", "NOSUCHINSTANCE", "ENDOFMIBVIEW"]
+
+# Tables indexed by MAC address: BRIDGE-MIB::dot1dTpFdbTable and
+# Q-BRIDGE-MIB::dot1qTpFdbTable
+_MAC_TABLES = [".1.3.6.1.2.1.17.4.3.1.", ".1.3.6.1.2.1.17.7.1.2.2.1."]
+
+# Columns of MAC addresses: IF-MIB::ifPhysAddress,
+# IP-MIB::ipNetToMediaPhysAddress and BRIDGE-MIB::dot1dTpFdbAddress
+_MAC_COLUMNS = [
+    ".1.3.6.1.2.1.2.2.1.6.",
+    ".1.3.6.1.2.1.4.22.1.2.",
+    ".1.3.6.1.2.1.17.4.3.1.1.",
+]
+
+# Table indexed by IP address: IP-MIB::ipNetToMediaTable
+_ARP_TABLE = ".1.3.6.1.2.1.4.22.1."
+
+
+class Agent:
+    """Simulated SNMP session that answers from the values of a capture."""
+
+    def __init__(self, values, latency=0):
+        """Initialize the class.
+
+        Args:
+            values: Dict of [value, snmp_type] lists keyed by OID
+            latency: Seconds each request takes
+
+        Returns:
+            None
+
+        """
+        # Sort the OIDs in lexicographic order
+        self._values = values
+        self._oids = sorted(values, key=_key)
+        self._keys = [_key(_) for _ in self._oids]
+        self._latency = latency
+        self.requests = 0
+
+    def get(self, oid):
+        """Simulate an SNMP get.
+
+        Args:
+            oid: OID, or list of OIDs got in a single request
+
+        Returns:
+            result: Variable, or list of Variables in request order
+
+        """
+        # Get several OIDs
+        if isinstance(oid, list) is True:
+            self._request()
+            result = [self._variable(_) for _ in oid]
+            return result
+
+        # Return
+        self._request()
+        result = self._variable(oid)
+        return result
+
+    def walk(self, oid):
+        """Simulate an SNMP walk.
+
+        Args:
+            oid: OID
+
+        Returns:
+            result: List of Variables
+
+        """
+        # Return
+        self._request()
+        result = []
+        prefix = _key(oid)
+        position = bisect_right(self._keys, prefix)
+        if oid in self._values:
+            result.append(_variable(oid, *self._values[oid]))
+        for key, _oid in zip(self._keys[position:], self._oids[position:]):
+            if key[: len(prefix)] != prefix:
+                break
+            result.append(_variable(_oid, *self._values[_oid]))
+        return result
+
+    def bulkwalk(self, oid, non_repeaters=0, max_repetitions=10):
+        """Simulate an SNMP walk with GETBULK requests.
+
+        Args:
+            oid: OID
+            non_repeaters: Unused
+            max_repetitions: Number of values returned by each request
+
+        Returns:
+            result: List of Variables
+
+        """
+        # Count the requests that would be made
+        result = self.walk(oid)
+        self.requests += len(result) // max(1, max_repetitions)
+        return result
+
+    def get_bulk(self, oids, non_repeaters=0, max_repetitions=10):
+        """Simulate an SNMP GETBULK request.
+
+        Args:
+            oids: List of OIDs
+            non_repeaters: Unused
+            max_repetitions: Number of values returned for each OID
+
+        Returns:
+            result: List of Variables, in request order for each repetition
+
+        """
+        # Initialize key variables
+        self._request()
+        result = []
+        positions = [bisect_right(self._keys, _key(_)) for _ in oids]
+
+        # Return the next values of each OID
+        for _ in range(max_repetitions):
+            for index, position in enumerate(positions):
+                if position >= len(self._oids):
+                    result.append(
+                        _variable(oids[index], "ENDOFMIBVIEW", "ENDOFMIBVIEW")
+                    )
+                    continue
+                oid = self._oids[position]
+                result.append(_variable(oid, *self._values[oid]))
+                positions[index] = position + 1
+        return result
+
+    def _variable(self, oid):
+        """Get the Variable of an OID.
+
+        Args:
+            oid: OID
+
+        Returns:
+            result: Variable
+
+        """
+        # Return
+        if oid in self._values:
+            result = _variable(oid, *self._values[oid])
+        else:
+            result = _variable(oid, "NOSUCHINSTANCE", "NOSUCHINSTANCE")
+        return result
+
+    def _request(self):
+        """Count a request and wait for the simulated response.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Wait
+        self.requests += 1
+        if bool(self._latency) is True:
+            time.sleep(self._latency)
+
+
+class Recorder:
+    """SNMP session that records the values returned by another session."""
+
+    def __init__(self, session, values, lock):
+        """Initialize the class.
+
+        Args:
+            session: easysnmp session
+            values: Dict to which values are added, keyed by OID
+            lock: Lock shared by the recorders of the values
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._session = session
+        self._values = values
+        self._lock = lock
+
+    def get(self, oid):
+        """Do an SNMP get.
+
+        Args:
+            oid: OID, or list of OIDs got in a single request
+
+        Returns:
+            result: SNMP variable, or list of SNMP variables
+
+        """
+        # Return
+        result = self._session.get(oid)
+        if isinstance(result, list) is True:
+            self._record(result)
+        else:
+            self._record([result])
+        return result
+
+    def walk(self, oid):
+        """Do an SNMP walk.
+
+        Args:
+            oid: OID
+
+        Returns:
+            result: List of SNMP variables
+
+        """
+        # Return
+        result = self._session.walk(oid)
+        self._record(result)
+        return result
+
+    def bulkwalk(self, oid, non_repeaters=0, max_repetitions=10):
+        """Do an SNMP walk with GETBULK requests.
+
+        Args:
+            oid: OID
+            non_repeaters: Number of non-repeating OIDs
+            max_repetitions: Number of values returned by each request
+
+        Returns:
+            result: List of SNMP variables
+
+        """
+        # Return
+        result = self._session.bulkwalk(
+            oid, non_repeaters=non_repeaters, max_repetitions=max_repetitions
+        )
+        self._record(result)
+        return result
+
+    def get_bulk(self, oids, non_repeaters=0, max_repetitions=10):
+        """Do an SNMP GETBULK request.
+
+        Args:
+            oids: List of OIDs
+            non_repeaters: Number of non-repeating OIDs
+            max_repetitions: Number of values returned for each OID
+
+        Returns:
+            result: List of SNMP variables
+
+        """
+        # Return
+        result = self._session.get_bulk(
+            oids, non_repeaters=non_repeaters, max_repetitions=max_repetitions
+        )
+        self._record(result)
+        return result
+
+    def _record(self, variables):
+        """Add the values of SNMP variables.
+
+        Args:
+            variables: List of SNMP variables
+
+        Returns:
+            None
+
+        """
+        with self._lock:
+            for variable in variables:
+                if str(variable.snmp_type).upper() in _MISSING:
+                    continue
+                oid = variable.oid
+                if bool(variable.oid_index) is True:
+                    oid = "{}.{}".format(oid, variable.oid_index)
+                if oid.startswith(".") is False:
+                    oid = ".{}".format(oid)
+                self._values[oid] = [variable.value, variable.snmp_type]
+
+
+class _Simulation:
+    """Replaces the SNMP sessions of snmp_manager until stopped."""
+
+    def __init__(self):
+        """Initialize the class.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._session = None
+
+    def start(self):
+        """Start using the sessions of the simulation.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Replace the sessions
+        if self._session is None:
+            self._session = snmp_manager._Session
+            snmp_manager._Session = self._create
+
+    def stop(self):
+        """Stop using the sessions of the simulation.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Restore the sessions
+        if self._session is not None:
+            snmp_manager._Session = self._session
+            self._session = None
+
+    def _create(self, _poll, context_name=""):
+        """Create an SNMP session.
+
+        The session is that of the device. Subclasses replace or wrap it.
+
+        Args:
+            _poll: POLL object of the device
+            context_name: SNMPv3 context name
+
+        Returns:
+            result: Object with the SNMP session as its session attribute
+
+        """
+        # Create the session
+        result = self._session(_poll, context_name=context_name)
+        return result
+
+
+class Recording(_Simulation):
+    """Records the values returned by devices while polling them."""
+
+    def __init__(self):
+        """Initialize the class.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        _Simulation.__init__(self)
+        self._captures = {}
+        self._lock = threading.Lock()
+
+    def captures(self):
+        """Get the captures of the devices polled.
+
+        Args:
+            None
+
+        Returns:
+            result: Dict of captures keyed by hostname
+
+        """
+        # Return
+        with self._lock:
+            result = dict(self._captures)
+        return result
+
+    def _create(self, _poll, context_name=""):
+        """Create an SNMP session that records the values of the device.
+
+        Args:
+            _poll: POLL object of the device
+            context_name: SNMPv3 context name
+
+        Returns:
+            result: Object with the SNMP session as its session attribute
+
+        """
+        # Create the session
+        result = _Simulation._create(self, _poll, context_name=context_name)
+
+        # Record its values
+        with self._lock:
+            capture = self._captures.setdefault(
+                _poll.hostname, {"hostname": _poll.hostname, "contexts": {}}
+            )
+            values = capture["contexts"].setdefault(context_name, {})
+        result.session = Recorder(result.session, values, self._lock)
+        return result
+
+
+class Replay(_Simulation):
+    """Answers the SNMP queries of the poller from captures."""
+
+    def __init__(self, captures, latency=0):
+        """Initialize the class.
+
+        Args:
+            captures: List of captures
+            latency: Seconds each SNMP request takes
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        _Simulation.__init__(self)
+        self._captures = {_["hostname"]: _ for _ in captures}
+        self._latency = latency
+        self._agents = []
+        self._lock = threading.Lock()
+
+    def requests(self):
+        """Get the number of SNMP requests answered.
+
+        Args:
+            None
+
+        Returns:
+            result: Number of requests
+
+        """
+        # Return
+        with self._lock:
+            result = sum(_.requests for _ in self._agents)
+        return result
+
+    def _create(self, _poll, context_name=""):
+        """Create an SNMP session that answers from the device's capture.
+
+        Args:
+            _poll: POLL object of the device
+            context_name: SNMPv3 context name
+
+        Returns:
+            result: Object with the SNMP session as its session attribute
+
+        """
+        # Devices without a capture don't respond
+        capture = self._captures.get(_poll.hostname)
+        if capture is None:
+            result = _Session(_Unreachable())
+            return result
+
+        # Create the session
+        result = _Session(
+            Agent(
+                capture["contexts"].get(context_name, {}),
+                latency=self._latency,
+            )
+        )
+        with self._lock:
+            self._agents.append(result.session)
+        return result
+
+
+class _Unreachable:
+    """Simulated SNMP session of a device that doesn't respond."""
+
+    def get(self, oid, non_repeaters=0, max_repetitions=10):
+        """Simulate a request that times out.
+
+        Args:
+            oid: Unused
+            non_repeaters: Unused
+            max_repetitions: Unused
+
+        Returns:
+            None
+
+        """
+        # Fail
+        raise snmp_manager.exceptions.EasySNMPTimeoutError("Timed out")
+
+    walk = get
+    bulkwalk = get
+    get_bulk = get
+
+
+class _Session:
+    """Holder of a simulated SNMP session, like snmp_manager._Session."""
+
+    def __init__(self, session):
+        """Initialize the class.
+
+        Args:
+            session: Simulated SNMP session
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self.session = session
+
+
+def save(capture, filepath):
+    """Write a capture to a file.
+
+    Args:
+        capture: Capture
+        filepath: Path of the file
+
+    Returns:
+        None
+
+    """
+    # Write
+    payload.dump(capture, filepath)
+
+
+def load(filepath):
+    """Read a capture from a file.
+
+    Args:
+        filepath: Path of the file
+
+    Returns:
+        result: Capture
+
+    """
+    # Return
+    result = payload.load(filepath)
+    return result
+
+
+def fleet(capture, count, seed=0):
+    """Create the captures of simulated devices from the capture of one.
+
+    Each device has its own hostname, MAC addresses and ARP table IP
+    addresses. The interfaces are those of the original, as the ifIndex
+    values are also used by the tables of other MIBs such as the
+    ifStackTable, BRIDGE-MIB, CDP, LLDP and VLAN tables.
+
+    Args:
+        capture: Capture
+        count: Number of devices
+        seed: Seed of the random values, so that fleets can be recreated
+
+    Returns:
+        result: List of captures
+
+    """
+    # Initialize key variables
+    result = []
+
+    for number in range(count):
+        # Create the random values of the device
+        generator = random.Random("{}-{}".format(seed, number))
+        device = _Device(generator)
+
+        # Create the capture
+        result.append(
+            {
+                "hostname": "{}-{}".format(capture["hostname"], number + 1),
+                "contexts": {
+                    context: device.values(values)
+                    for context, values in capture["contexts"].items()
+                },
+            }
+        )
+    return result
+
+
+class _Device:
+    """Random values of a simulated device."""
+
+    def __init__(self, generator):
+        """Initialize the class.
+
+        Args:
+            generator: random.Random object
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._generator = generator
+        self._macs = {}
+        self._ips = {}
+
+    def values(self, values):
+        """Create the values of a context of the device.
+
+        Args:
+            values: Dict of [value, snmp_type] lists keyed by OID
+
+        Returns:
+            result: Dict of [value, snmp_type] lists keyed by OID
+
+        """
+        # Initialize key variables
+        result = {}
+
+        for oid, (value, snmp_type) in values.items():
+            # Change the MAC and IP addresses in the OIDs
+            nodes = oid.split(".")
+            if _table(oid, _MAC_TABLES) is True and len(nodes) > 6:
+                nodes[-6:] = [str(_) for _ in self._mac(nodes[-6:], int)]
+            elif _table(oid, [_ARP_TABLE]) is True and len(nodes) > 4:
+                nodes[-4:] = self._ip(".".join(nodes[-4:])).split(".")
+            oid = ".".join(nodes)
+
+            # Change the MAC and IP addresses in the values
+            if _table(oid, _MAC_COLUMNS) is True and len(str(value)) == 6:
+                value = "".join(chr(_) for _ in self._mac(value, ord))
+            elif snmp_type == "IPADDR" and _table(oid, [_ARP_TABLE]) is True:
+                value = self._ip(value)
+            result[oid] = [value, snmp_type]
+        return result
+
+    def _mac(self, mac, convert):
+        """Get the random MAC address that replaces a MAC address.
+
+        Args:
+            mac: Iterable of the six parts of the MAC address
+            convert: Function converting each part to an integer
+
+        Returns:
+            result: Tuple of six integers
+
+        """
+        # Create a locally administered unicast address
+        original = tuple(convert(_) for _ in mac)
+        if original not in self._macs:
+            self._macs[original] = tuple(
+                [(self._generator.randrange(256) & 0xFC) | 0x02]
+                + [self._generator.randrange(256) for _ in range(5)]
+            )
+        result = self._macs[original]
+        return result
+
+    def _ip(self, address):
+        """Get the random IP address that replaces an IP address.
+
+        The network part, the first two bytes, is kept.
+
+        Args:
+            address: IPv4 address
+
+        Returns:
+            result: IPv4 address
+
+        """
+        # Create an address
+        if address not in self._ips:
+            parts = str(address).split(".")
+            self._ips[address] = ".".join(
+                parts[:2]
+                + [str(self._generator.randrange(256))]
+                + [str(self._generator.randrange(1, 255))]
+            )
+        result = self._ips[address]
+        return result
+
+
+def _table(oid, tables):
+    """Determine whether an OID is in one of several tables.
+
+    Args:
+        oid: OID
+        tables: List of the OID prefixes of the tables
+
+    Returns:
+        result: True if it is
+
+    """
+    # Return
+    result = any(oid.startswith(_) for _ in tables)
+    return result
+
+
+def _key(oid):
+    """Get the key used to sort OIDs in lexicographic order.
+
+    Args:
+        oid: OID
+
+    Returns:
+        result: Tuple of the nodes of the OID
+
+    """
+    # Return
+    result = tuple(int(_) for _ in oid.strip(".").split(".") if bool(_))
+    return result
+
+
+def _variable(oid, value, snmp_type):
+    """Create an SNMP variable.
+
+    Args:
+        oid: OID of the value
+        value: Value
+        snmp_type: SNMP type of the value
+
+    Returns:
+        result: Variable split like those of numeric easysnmp sessions
+
+    """
+    # Return
+    nodes = oid.split(".")
+    result = Variable(".".join(nodes[:-1]), nodes[-1], value, snmp_type)
+    return result
@@ -5,6 +5,8 @@ from collections import defaultdict
 
 from . import iana_enterprise
 from . import get_queries
+from .records import Interface
+from switchmap.core import log
 
 
 class Query:
@@ -18,11 +20,19 @@ class Query:
 
     """
 
-    def __init__(self, snmp_object):
+    def __init__(
+        self, snmp_object, capabilities=None, incremental=None, deadline=None
+    ):
         """Instantiate the class.
 
         Args:
             snmp_object: SNMP Interact class object from snmp_manager.py
+            capabilities: Capabilities object of the MIBs the device is
+                known to support. The support of each MIB is probed if None
+            incremental: Incremental object of the interface data reused
+                from previous polls. Saved when the poll succeeds
+            deadline: Timestamp after which no more MIBs are queried. The
+                poll is abandoned if reached
 
         Returns:
             None
@@ -30,6 +40,9 @@ class Query:
         """
         # Define query object
         self.snmp_object = snmp_object
+        self._capabilities = capabilities
+        self._incremental = incremental
+        self._deadline = deadline
 
     def everything(self):
         """Get all information from device.
@@ -46,11 +59,31 @@ class Query:
 
         # Append data
         data["misc"] = self.misc()
-        data["layer1"] = self.layer1()
+        data["layer1"] = self._layer1()
         data["layer2"] = self.layer2()
         data["layer3"] = self.layer3()
         data["system"] = self.system()
 
+        # Partial data must not replace the data of previous polls
+        if self._expired() is True:
+            log_message = """\
+Abandoned polling host {}. It took too long to respond""".format(
+                self.snmp_object.hostname()
+            )
+            log.log2warning(2017, log_message)
+            return None
+
+        # Remember the MIBs supported by the device
+        if self._capabilities is not None:
+            self._capabilities.save()
+
+        # Remember the interface data for the next polls
+        if self._incremental is not None:
+            self._incremental.save()
+
+        # Layer1 data is kept in Interface objects until the poll is done
+        data["layer1"] = _layer1(data["layer1"])
+
         # Return
         return data
 
@@ -93,12 +126,11 @@ class Query:
 
         # Get system information from SNMPv2-MIB, ENTITY-MIB, IF-MIB
         # Instantiate a query object for each system query
-        for item in [
-            Query(self.snmp_object) for Query in get_queries("system")
-        ]:
-            if item.supported():
-                processed = True
-                data = _add_system(item, data)
+        for item in self._supported("system"):
+            if self._expired() is True:
+                break
+            processed = True
+            data = _add_system(item, data)
 
         # Return
         if processed is True:
@@ -115,19 +147,31 @@ class Query:
         Returns:
             data: Aggregated data
 
+        """
+        # Return
+        data = _layer1(self._layer1())
+        return data
+
+    def _layer1(self):
+        """Get all layer1 information from device as Interface objects.
+
+        Args:
+            None
+
+        Returns:
+            data: Dict of Interface objects keyed by ifIndex
+
         """
         # Initialize key values
-        data = defaultdict(lambda: defaultdict(dict))
+        data = {}
         processed = False
 
         # Get information layer1 queries
-
-        for item in [
-            Query(self.snmp_object) for Query in get_queries("layer1")
-        ]:
-            if item.supported():
-                processed = True
-                data = _add_layer1(item, data)
+        for item in self._supported("layer1"):
+            if self._expired() is True:
+                break
+            processed = True
+            data = _add_layer1(item, data)
 
         # Return
         if processed is True:
@@ -149,12 +193,11 @@ class Query:
         data = defaultdict(lambda: defaultdict(dict))
         processed = False
 
-        for item in [
-            Query(self.snmp_object) for Query in get_queries("layer2")
-        ]:
-            if item.supported():
-                processed = True
-                data = _add_layer2(item, data)
+        for item in self._supported("layer2"):
+            if self._expired() is True:
+                break
+            processed = True
+            data = _add_layer2(item, data)
 
         # Return
         if processed is True:
@@ -176,12 +219,11 @@ class Query:
         data = defaultdict(lambda: defaultdict(dict))
         processed = False
 
-        for item in [
-            Query(self.snmp_object) for Query in get_queries("layer3")
-        ]:
-            if item.supported():
-                processed = True
-                data = _add_layer3(item, data)
+        for item in self._supported("layer3"):
+            if self._expired() is True:
+                break
+            processed = True
+            data = _add_layer3(item, data)
 
         # Return
         if processed is True:
@@ -189,6 +231,49 @@ class Query:
         else:
             return None
 
+    def _supported(self, layer):
+        """Get the query objects of the MIBs supported for a layer.
+
+        Args:
+            layer: The layer of queries needed
+
+        Returns:
+            result: List of query objects
+
+        """
+        # Initialize key variables
+        result = []
+
+        # Get the supported queries
+        for query in get_queries(layer):
+            if self._expired() is True:
+                break
+            if self._capabilities is None:
+                item = query(self.snmp_object)
+                if bool(item.supported()) is False:
+                    item = None
+            else:
+                item = self._capabilities.query(query)
+            if item is not None:
+                result.append(item)
+
+        # Return
+        return result
+
+    def _expired(self):
+        """Determine whether the deadline of the poll has passed.
+
+        Args:
+            None
+
+        Returns:
+            result: True if passed
+
+        """
+        # Return
+        result = bool(self._deadline) and time.time() > self._deadline
+        return result
+
 
 def _add_data(source, target):
     """Add data from source to target dict. Both dicts must have two keys.
@@ -210,12 +295,29 @@ def _add_data(source, target):
     return target
 
 
+def _layer1(data):
+    """Convert layer1 Interface objects to dicts.
+
+    Args:
+        data: Dict of Interface objects keyed by ifIndex
+
+    Returns:
+        result: Two keyed dict of data. None if data is None
+
+    """
+    # Convert
+    if data is None:
+        return None
+    result = {ifindex: record.dict() for ifindex, record in data.items()}
+    return result
+
+
 def _add_layer1(query, original_data):
     """Add data from successful layer1 MIB query to original data provided.
 
     Args:
         query: MIB query object
-        original_data: Two keyed dict of data
+        original_data: Dict of Interface objects keyed by ifIndex
 
     Returns:
         new_data: Aggregated data
@@ -223,7 +325,13 @@ def _add_layer1(query, original_data):
     """
     # Process query
     result = query.layer1()
-    new_data = _add_data(result, original_data)
+    new_data = original_data
+    for ifindex, values in result.items():
+        record = new_data.get(ifindex)
+        if record is None:
+            record = Interface()
+            new_data[ifindex] = record
+        record.update(values)
 
     # Return
     return new_data
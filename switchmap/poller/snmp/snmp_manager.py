@@ -1,33 +1,81 @@
 """SNMP manager class."""
 
-import os
+from collections import OrderedDict, Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import sys
+import threading
+import time
 
 import easysnmp
 from easysnmp import exceptions
 
 # Import project libraries
-from switchmap.poller.configuration import ConfigPoller
 from switchmap.poller import POLL
+from switchmap.poller import store
 from switchmap.core import log
-from switchmap.core import files
 from . import iana_enterprise
 
 
+# Maximum number of values requested in each GETBULK table request and in
+# each GET request of several OIDs
+TABLE_VARBINDS = 100
+
+# GETBULK max-repetitions default and limits for walks
+_REPETITIONS = 25
+_MIN_REPETITIONS = 5
+_MAX_REPETITIONS = 200
+
+# Limits for increasing max-repetitions: the duration of a response in
+# seconds, and the estimated size of a response in bytes including the
+# encoding overhead of each value
+_FAST_RESPONSE = 0.5
+_MAX_PDU_BYTES = 8192
+_VARBIND_BYTES = 12
+
+# Errors about the OIDs being queried. They leave the SNMP session usable
+_OID_ERRORS = (
+    exceptions.EasySNMPUnknownObjectIDError,
+    exceptions.EasySNMPNoSuchNameError,
+    exceptions.EasySNMPNoSuchObjectError,
+    exceptions.EasySNMPNoSuchInstanceError,
+    exceptions.EasySNMPUndeterminedTypeError,
+)
+
+
 class Validate:
     """Class Verify SNMP data."""
 
-    def __init__(self, options):
+    def __init__(self, options, **kwargs):
         """Initialize the Validate class.
 
         Args:
             options: POLLING_OPTIONS object containing SNMP configuration
+            **kwargs: Keyword arguments used to create the Interact objects
+                that validate the credentials
 
         Returns:
             None
         """
         # Initialize key variables
         self._options = options
+        self._kwargs = kwargs
+        self._interact = None
+
+    def interact(self):
+        """Get the Interact object that validated the credentials.
+
+        Reusing it for the poll reuses its SNMP session and query results.
+
+        Args:
+            None
+
+        Returns:
+            result: Interact object, or None if no credentials were valid
+
+        """
+        # Return
+        result = self._interact
+        return result
 
     def credentials(self):
         """Determine valid SNMP credentials for a host.
@@ -39,29 +87,15 @@ class Validate:
             authentication: SNMP authorization object containing valid
                 credentials, or None if no valid credentials found
         """
-        # Initialize key variables
-        cache_exists = False
+        # Read credentials from the cache
+        credentials = store.store("credentials")
+        group = credentials.get(self._options.hostname)
 
-        # Create cache directory / file if not yet created
-        filename = files.snmp_file(self._options.hostname, ConfigPoller())
-        if os.path.exists(filename) is True:
-            cache_exists = True
-
-        # Create file if necessary
-        if cache_exists is False:
+        if group is None:
             # Get credentials
             authentication = self.validation()
 
-            # Save credentials if successful
-            if bool(authentication):
-                _update_cache(filename, authentication.group)
-
         else:
-            # Read credentials from cache
-            if os.path.isfile(filename):
-                with open(filename) as f_handle:
-                    group = f_handle.readline()
-
             # Get credentials
             authentication = self.validation(group)
 
@@ -69,9 +103,9 @@ class Validate:
             if bool(authentication) is False:
                 authentication = self.validation()
 
-            # Update cache if found
-            if bool(authentication):
-                _update_cache(filename, authentication.group)
+        # Update cache if found
+        if bool(authentication):
+            credentials.update(self._options.hostname, authentication.group)
 
         # Return
         return authentication
@@ -89,6 +123,8 @@ class Validate:
         """
         # Initialize key variables
         result = None
+        self._interact = None
+        candidates = {}
 
         # Probe device with all SNMP options
         for authorization in self._options.authorizations:
@@ -96,25 +132,37 @@ class Validate:
             if bool(authorization.enabled) is False:
                 continue
 
+            # Only process the requested group
+            if group is not None and authorization.group != group:
+                continue
+
             # Setup contact with the remote device
             device = Interact(
                 POLL(
                     hostname=self._options.hostname,
                     authorization=authorization,
-                )
+                ),
+                **self._kwargs,
             )
-
-            # Try successive groups
-            if group is None:
-                # Verify connectivity
-                if device.contactable() is True:
-                    result = authorization
-                    break
-            else:
-                if authorization.group == group:
+            candidates[device] = authorization
+
+        # Try all the groups at the same time and use the first to respond
+        if bool(candidates) is True:
+            executor = ThreadPoolExecutor(max_workers=len(candidates))
+            futures = {
+                executor.submit(device.contactable): device
+                for device in candidates
+            }
+            try:
+                for future in as_completed(futures):
                     # Verify connectivity
-                    if device.contactable() is True:
-                        result = authorization
+                    if future.result() is True:
+                        self._interact = futures[future]
+                        result = candidates[self._interact]
+                        break
+            finally:
+                # Don't wait for the remaining probes
+                executor.shutdown(wait=False, cancel_futures=True)
 
         # Return
         return result
@@ -123,17 +171,48 @@ class Validate:
 class Interact:
     """Class Gets SNMP data."""
 
-    def __init__(self, _poll):
+    def __init__(
+        self,
+        _poll,
+        max_sessions=16,
+        context_concurrency=4,
+        max_repetitions=_REPETITIONS,
+        adaptive=False,
+    ):
         """Initialize the Interact class.
 
         Args:
             _poll: POLL object containing SNMP configuration and target info
+            max_sessions: Maximum number of SNMP sessions, one per context
+                name, kept open for reuse
+            context_concurrency: Maximum number of contexts walked at the
+                same time by swalk_contexts()
+            max_repetitions: GETBULK max-repetitions value used for walks
+            adaptive: Tune max_repetitions to the device's responses if True
 
         Returns:
             None
         """
         # Initialize key variables
         self._poll = _poll
+        self._lock = threading.RLock()
+        self._context_concurrency = max(1, int(context_concurrency))
+        self._max_repetitions = min(
+            max(_MIN_REPETITIONS, int(max_repetitions)), _MAX_REPETITIONS
+        )
+        self._adaptive = bool(adaptive)
+        self._sessions = OrderedDict()
+        self._max_sessions = max(1, int(max_sessions))
+        self._sessions_created = 0
+        self._sessions_reused = 0
+
+        # Results of queries already made during the poll
+        self._cache = {}
+        self._cache_hits = Counter()
+        self._cache_misses = 0
+
+        # Number of queries to which the device didn't respond
+        self._unreachable = 0
 
         # Fail if there is no authentication
         if bool(self._poll.authorization) is False:
@@ -142,6 +221,215 @@ class Interact:
             )
             log.log2die(1045, log_message)
 
+    def close(self):
+        """Close all cached SNMP sessions.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        # easysnmp frees the session when there are no more references to it
+        with self._lock:
+            self._sessions.clear()
+            self._cache.clear()
+
+    def session_statistics(self):
+        """Get the number of SNMP sessions created and reused.
+
+        Args:
+            None
+
+        Returns:
+            result: Dict of session counts keyed by "created" and "reused"
+        """
+        # Return
+        result = {
+            "created": self._sessions_created,
+            "reused": self._sessions_reused,
+        }
+        return result
+
+    def cache_statistics(self):
+        """Get the number of queries answered from the query cache.
+
+        Args:
+            None
+
+        Returns:
+            result: Dict of "hits" and "misses" counts, and a dict of "oids"
+                with the number of hits for each OID
+
+        """
+        # Return
+        result = {
+            "hits": sum(self._cache_hits.values()),
+            "misses": self._cache_misses,
+            "oids": dict(self._cache_hits),
+        }
+        return result
+
+    def unreachable(self):
+        """Get the number of queries to which the device didn't respond.
+
+        Args:
+            None
+
+        Returns:
+            result: Number of queries
+
+        """
+        # Return
+        with self._lock:
+            result = self._unreachable
+        return result
+
+    def _session(self, context_name=""):
+        """Get a cached SNMP session for the context, creating it if needed.
+
+        Args:
+            context_name: Set the contextName used for SNMPv3 messages.
+                The default contextName is the empty string "".  Overrides the
+                defContext token in the snmp.conf file.
+
+        Returns:
+            session: SNMP session
+
+        """
+        # Reuse the session if it exists
+        with self._lock:
+            session = self._sessions.get(context_name)
+            if session is not None:
+                self._sessions.move_to_end(context_name)
+                self._sessions_reused += 1
+                return session
+
+        # Create SNMP session
+        session = _Session(self._poll, context_name=context_name).session
+
+        with self._lock:
+            self._sessions_created += 1
+            self._sessions[context_name] = session
+
+            # Evict the least recently used sessions
+            while len(self._sessions) > self._max_sessions:
+                self._sessions.popitem(last=False)
+
+        # Return
+        return session
+
+    def max_repetitions(self):
+        """Get the GETBULK max-repetitions value used for walks.
+
+        Args:
+            None
+
+        Returns:
+            result: max-repetitions value
+
+        """
+        # Return
+        with self._lock:
+            result = self._max_repetitions
+        return result
+
+    def _bulkwalk(self, session, oid_to_get):
+        """Do a bulkwalk, tuning max-repetitions to the device if adaptive.
+
+        The value grows while responses are fast and small enough, and
+        shrinks when the device times out or the response is too big. The
+        walk is retried with the smaller value.
+
+        Args:
+            session: SNMP session
+            oid_to_get: OID to walk
+
+        Returns:
+            results: List of SNMP variables
+
+        """
+        while True:
+            repetitions = self.max_repetitions()
+            ts_start = time.time()
+            try:
+                results = session.bulkwalk(
+                    oid_to_get, non_repeaters=0, max_repetitions=repetitions
+                )
+            except exceptions.EasySNMPError as exception_error:
+                # Retry with a smaller value if this may be the cause
+                if (
+                    self._adaptive is False
+                    or _repetitions_error(exception_error) is False
+                    or repetitions <= _MIN_REPETITIONS
+                ):
+                    raise
+                with self._lock:
+                    self._max_repetitions = max(
+                        _MIN_REPETITIONS, repetitions // 2
+                    )
+                log_message = """\
+Reducing SNMP max-repetitions for host {} to {} after error: {}""".format(
+                    self._poll.hostname,
+                    self._max_repetitions,
+                    exception_error,
+                )
+                log.log2debug(2014, log_message)
+                continue
+
+            # Grow the value if the device keeps up with it
+            if self._adaptive is True:
+                self._tune(repetitions, results, time.time() - ts_start)
+            return results
+
+    def _tune(self, repetitions, results, duration):
+        """Increase max-repetitions if the responses are fast and small.
+
+        Args:
+            repetitions: max-repetitions value used for the walk
+            results: List of SNMP variables returned by the walk
+            duration: Duration of the walk in seconds
+
+        Returns:
+            None
+
+        """
+        # Only tune walks that needed more than one response
+        responses = len(results) // repetitions
+        if responses < 1:
+            return
+
+        # Responses must be fast
+        if duration / (responses + 1) > _FAST_RESPONSE:
+            return
+
+        # Responses must stay small enough at the new value
+        size = sum(
+            len(_.oid) + len(_.oid_index) + len(str(_.value)) + _VARBIND_BYTES
+            for _ in results
+        )
+        new_repetitions = min(_MAX_REPETITIONS, repetitions * 2)
+        if size / len(results) * new_repetitions > _MAX_PDU_BYTES:
+            return
+
+        with self._lock:
+            if self._max_repetitions == repetitions:
+                self._max_repetitions = new_repetitions
+
+    def _drop_session(self, context_name=""):
+        """Stop reusing the SNMP session of a context.
+
+        Args:
+            context_name: SNMPv3 context name of the session
+
+        Returns:
+            None
+
+        """
+        # Remove the session
+        with self._lock:
+            self._sessions.pop(context_name, None)
+
     def enterprise_number(self):
         """Get SNMP enterprise number for the device.
 
@@ -362,6 +650,261 @@ class Interact:
         # Return
         return results
 
+    def sget(self, oids_to_get, context_name=""):
+        """Perform a safe SNMPget of several OIDs in a single request.
+
+        Args:
+            oids_to_get: List of OIDs to get
+            context_name: Set the contextName used for SNMPv3 messages.
+                The default contextName is the empty string "".  Overrides the
+                defContext token in the snmp.conf file.
+
+        Returns:
+            results: Dict of values keyed by OID, None for the OIDs that
+                don't exist. None if the request failed
+
+        """
+        # Check if the OIDs are valid
+        for oid_to_get in oids_to_get:
+            if _oid_valid_format(oid_to_get) is False:
+                log_message = "OID {} has an invalid format".format(oid_to_get)
+                log.log2die(2046, log_message)
+
+        # Get the values
+        try:
+            session = self._session(context_name=context_name)
+            variables = session.get(list(oids_to_get))
+        except:
+            # Don't reuse a session that may be in a bad state
+            if isinstance(sys.exc_info()[1], _OID_ERRORS) is False:
+                self._drop_session(context_name)
+                with self._lock:
+                    self._unreachable += 1
+
+            log_message = _exception_message(
+                self._poll.hostname,
+                ", ".join(oids_to_get),
+                context_name,
+                sys.exc_info(),
+            )
+            log.log2debug(2047, log_message)
+            return None
+
+        # Values are returned in request order
+        results = {
+            oid_to_get: _convert(variable)
+            for oid_to_get, variable in zip(oids_to_get, variables)
+        }
+        return results
+
+    def table(self, oids_to_get, context_name=""):
+        """Walk several columns of a table using interleaved GETBULK requests.
+
+        Each GETBULK request asks for the next rows of all the columns that
+        haven't been completely walked, so a table with many columns is
+        retrieved with far fewer requests than walking each column.
+
+        Args:
+            oids_to_get: List of column OIDs sharing the same table index
+            context_name: Set the contextName used for SNMPv3 messages.
+                The default contextName is the empty string "".  Overrides the
+                defContext token in the snmp.conf file.
+
+        Returns:
+            rows: Dict of rows keyed by the OID index following the column
+                OID. Each row is a dict of values keyed by column OID
+
+        """
+        # Initialize key variables
+        rows = {}
+        columns = []
+        cursors = {}
+
+        # Check if the OIDs are valid
+        for oid_to_get in oids_to_get:
+            if _oid_valid_format(oid_to_get) is False:
+                log_message = "OID {} has an invalid format".format(oid_to_get)
+                log.log2die(2010, log_message)
+            if oid_to_get not in cursors:
+                columns.append(oid_to_get)
+                cursors[oid_to_get] = oid_to_get
+
+        # Use the columns already walked during the poll
+        for column in list(columns):
+            values = self.cached(column, context_name=context_name)
+            if values is None:
+                continue
+            _add_column(column, values, rows)
+            columns.remove(column)
+        walked = list(columns)
+
+        # Bulk requests are not supported in SNMPv1
+        if self._poll.authorization.version == 1:
+            _table_walk(self, columns, rows, context_name)
+            return rows
+
+        while bool(columns) is True:
+            # Keep the number of values per response close to that of
+            # bulkwalk queries for the same number of columns
+            repetitions = max(1, TABLE_VARBINDS // len(columns))
+
+            # Get the next rows of the remaining columns
+            try:
+                session = self._session(context_name=context_name)
+                results = session.get_bulk(
+                    [cursors[_] for _ in columns],
+                    non_repeaters=0,
+                    max_repetitions=repetitions,
+                )
+            except:
+                # Don't reuse a session that may be in a bad state
+                if isinstance(sys.exc_info()[1], _OID_ERRORS) is False:
+                    self._drop_session(context_name)
+
+                # Walk the remaining columns one by one instead
+                log_message = _exception_message(
+                    self._poll.hostname,
+                    ", ".join(columns),
+                    context_name,
+                    sys.exc_info(),
+                )
+                log.log2debug(2011, log_message)
+                _table_walk(self, columns, rows, context_name)
+                break
+
+            # Values are returned in request order for each repetition
+            advanced = set()
+            completed = set()
+            for position, result in enumerate(results):
+                column = columns[position % len(columns)]
+                if column in completed:
+                    continue
+
+                # Stop at the end of the column
+                oid = "{}.{}".format(result.oid, result.oid_index)
+                if (
+                    result.snmp_type.upper() == "ENDOFMIBVIEW"
+                    or oid.startswith("{}.".format(column)) is False
+                    or oid == cursors[column]
+                ):
+                    completed.add(column)
+                    continue
+
+                # Update the row
+                index = oid[len(column) + 1 :]
+                rows.setdefault(index, {})[column] = _convert(result)
+                cursors[column] = oid
+                advanced.add(column)
+
+            # Stop if the device returned no new values
+            if bool(advanced) is False:
+                break
+
+            # Only request columns that haven't been completely walked
+            columns = [_ for _ in columns if _ not in completed]
+
+        # Keep the results for later walks of the columns
+        for column in walked:
+            values = {
+                "{}.{}".format(column, index): row[column]
+                for index, row in rows.items()
+                if column in row
+            }
+            self.preload(column, values, context_name=context_name)
+
+        # Return
+        return rows
+
+    def cached(self, oid_to_get, normalized=False, context_name=""):
+        """Get the results of a walk already made during the poll.
+
+        Args:
+            oid_to_get: OID walked
+            normalized: If True, then return results as a dict keyed by
+                only the last node of an OID, otherwise return results
+                keyed by the entire OID string
+            context_name: SNMPv3 context name
+
+        Returns:
+            result: Results of the walk, None if not walked
+
+        """
+        # Return
+        key = (oid_to_get, context_name, False, bool(normalized))
+        with self._lock:
+            result = self._cache.get(key)
+        if result is not None:
+            result = dict(result)
+        return result
+
+    def preload(self, oid_to_get, values, context_name=""):
+        """Provide the results of a walk made by other means.
+
+        Later walks of the OID during the poll return these results instead
+        of querying the device.
+
+        Args:
+            oid_to_get: OID
+            values: Results of the walk keyed by the entire OID string
+            context_name: SNMPv3 context name
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        normalized = {
+            oid.split(".")[-1]: value for oid, value in values.items()
+        }
+
+        # Add the results to the cache
+        with self._lock:
+            self._cache[(oid_to_get, context_name, False, False)] = dict(values)
+            self._cache[(oid_to_get, context_name, False, True)] = normalized
+
+    def swalk_contexts(self, oid_to_get, context_names, normalized=False):
+        """Do safe SNMPwalks of an OID in several contexts at the same time.
+
+        Args:
+            oid_to_get: OID to get
+            context_names: List of SNMPv3 context names to walk
+            normalized: If True, then return results as a dict keyed by
+                only the last node of an OID, otherwise return results
+                keyed by the entire OID string
+
+        Returns:
+            results: List of swalk() results, in the order of context_names
+
+        """
+        # Initialize key variables
+        workers = min(self._context_concurrency, len(context_names))
+
+        def _swalk(context_name):
+            """Walk the OID in a context.
+
+            Args:
+                context_name: SNMPv3 context name
+
+            Returns:
+                result: Results of swalk()
+
+            """
+            # Return
+            result = self.swalk(
+                oid_to_get, normalized=normalized, context_name=context_name
+            )
+            return result
+
+        # Walk the contexts one at a time if there is no concurrency
+        if workers <= 1:
+            results = [_swalk(_) for _ in context_names]
+            return results
+
+        # Walk the contexts
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_swalk, context_names))
+        return results
+
     def walk(
         self,
         oid_to_get,
@@ -490,8 +1033,18 @@ class Interact:
             log_message = "OID {} has an invalid format".format(oid_to_get)
             log.log2die(1057, log_message)
 
-        # Create SNMP session
-        session = _Session(self._poll, context_name=context_name).session
+        # Return the results of the same query made earlier in the poll
+        key = (oid_to_get, context_name, bool(get), bool(normalized))
+        with self._lock:
+            if key in self._cache:
+                self._cache_hits[oid_to_get] += 1
+                return_value = (_contactable, exists, dict(self._cache[key]))
+                return return_value
+            self._cache_misses += 1
+        cacheable = True
+
+        # Get SNMP session
+        session = self._session(context_name=context_name)
 
         # Fill the results object by getting OID data
         try:
@@ -502,9 +1055,7 @@ class Interact:
             else:
                 if self._poll.authorization.version != 1:
                     # Bulkwalk for SNMPv2 and SNMPv3
-                    results = session.bulkwalk(
-                        oid_to_get, non_repeaters=0, max_repetitions=25
-                    )
+                    results = self._bulkwalk(session, oid_to_get)
                 else:
                     # Bulkwalk not supported in SNMPv1
                     results = session.walk(oid_to_get)
@@ -520,6 +1071,12 @@ class Interact:
             exceptions.EasySNMPNoSuchInstanceError,
             exceptions.EasySNMPUndeterminedTypeError,
         ) as exception_error:
+            # Don't reuse a session that may be in a bad state after
+            # connection errors and timeouts
+            if isinstance(exception_error, _OID_ERRORS) is False:
+                self._drop_session(context_name)
+            cacheable = False
+
             # Update the error message
             log_message = _exception_message(
                 self._poll.hostname,
@@ -537,6 +1094,10 @@ class Interact:
             )
 
         except SystemError as exception_error:
+            # Don't reuse a session that may be in a bad state
+            self._drop_session(context_name)
+            cacheable = False
+
             log_message = _exception_message(
                 self._poll.hostname,
                 oid_to_get,
@@ -554,6 +1115,10 @@ class Interact:
             )
 
         except:
+            # Don't reuse a session that may be in a bad state
+            self._drop_session(context_name)
+            cacheable = False
+
             # Update the error message
             log_message = _exception_message(
                 self._poll.hostname,
@@ -568,9 +1133,20 @@ class Interact:
             else:
                 log.log2die(1003, log_message)
 
+        # Count the queries to which the device didn't respond
+        if _contactable is not True:
+            with self._lock:
+                self._unreachable += 1
+
         # Format results
         values = _format_results(results, oid_to_get, normalized=normalized)
 
+        # Only cache successful queries
+        if cacheable is True:
+            with self._lock:
+                self._cache[key] = values
+            values = dict(values)
+
         # Return
         return_value = (_contactable, exists, values)
         return return_value
@@ -715,6 +1291,61 @@ class _Session:
         return result
 
 
+def _table_walk(interact, columns, rows, context_name=""):
+    """Walk table columns one at a time and add the values to rows.
+
+    Args:
+        interact: Interact object
+        columns: List of column OIDs to walk
+        rows: Dict of rows keyed by OID index to update
+        context_name: SNMPv3 context name
+
+    Returns:
+        None
+
+    """
+    # Walk each column
+    for column in columns:
+        results = interact.swalk(column, context_name=context_name)
+        _add_column(column, results, rows)
+
+
+def _add_column(column, results, rows):
+    """Add the results of a walk of a table column to rows.
+
+    Args:
+        column: Column OID
+        results: Results of the walk keyed by the entire OID string
+        rows: Dict of rows keyed by OID index to update
+
+    Returns:
+        None
+
+    """
+    # Add the values
+    for oid, value in results.items():
+        if oid.startswith("{}.".format(column)) is True:
+            index = oid[len(column) + 1 :]
+            rows.setdefault(index, {})[column] = value
+
+
+def _repetitions_error(exception_error):
+    """Determine whether an error may be caused by large GETBULK responses.
+
+    Args:
+        exception_error: Exception error object
+
+    Returns:
+        result: True if a timeout or a tooBig error
+
+    """
+    # Return
+    result = isinstance(
+        exception_error, exceptions.EasySNMPTimeoutError
+    ) or "toobig" in str(exception_error).lower().replace(" ", "")
+    return result
+
+
 def _exception_message(hostname, oid, context, exc_info):
     """Create standardized exception message for SNMP errors.
 
@@ -848,25 +1479,54 @@ def _format_results(results, mock_filter, normalized=False):
     """
     # Initialize key variables
     return_results = {}
+    nodes = mock_filter.strip(".").split(".")
+    matches = {}
 
     for result in results:
-        # Recreate the OID
-        oid = "{}.{}".format(result.oid, result.oid_index)
-
-        # Ignore unwanted OIDs
-        if mock_filter not in oid:
+        # Ignore unwanted OIDs. Results are rarely under more than a few
+        # distinct OIDs, so each one is only compared once
+        if result.oid not in matches:
+            matches[result.oid] = _oid_match(result.oid, nodes)
+        wanted = matches[result.oid]
+        if wanted is None:
+            wanted = _oid_match(result.oid + "." + result.oid_index, nodes)
+        if bool(wanted) is False:
             continue
 
         # Process the rest
         if normalized is True:
             return_results[result.oid_index] = _convert(result)
         else:
-            return_results[oid] = _convert(result)
+            return_results[result.oid + "." + result.oid_index] = _convert(
+                result
+            )
 
     # Return
     return return_results
 
 
+def _oid_match(oid, nodes):
+    """Determine whether an OID is the same as, or under, another OID.
+
+    Args:
+        oid: OID
+        nodes: List of the nodes of the other OID
+
+    Returns:
+        result: True if it is, False if it isn't. None if the OID is
+            shorter than the other OID, but is its start
+
+    """
+    # Compare the nodes
+    components = oid.strip(".").split(".")
+    if len(components) < len(nodes):
+        if nodes[: len(components)] == components:
+            return None
+        return False
+    result = components[: len(nodes)] == nodes
+    return result
+
+
 def _convert(result):
     """Convert SNMP value from pysnmp object to Python type.
 
@@ -877,52 +1537,78 @@ def _convert(result):
         converted: Value converted to appropriate Python type (bytes or int),
             or None for null/empty values
     """
-    # Initialieze key values
-    converted = None
-    value = result.value
+    # Get the function that converts the type. Everything else is an
+    # integer: Integer, Integer32, Counter32, Gauge32, Unsigned32,
+    # TimeTicks and Counter64
     snmp_type = result.snmp_type
-
-    # Convert string type values to bytes
-    if snmp_type.upper() == "OCTETSTR":
-        converted = bytes(value, "utf-8")
-    elif snmp_type.upper() == "OPAQUE":
-        converted = bytes(value, "utf-8")
-    elif snmp_type.upper() == "BITS":
-        converted = bytes(value, "utf-8")
-    elif snmp_type.upper() == "IPADDR":
-        converted = bytes(value, "utf-8")
-    elif snmp_type.upper() == "NETADDR":
-        converted = bytes(value, "utf-8")
-    elif snmp_type.upper() == "OBJECTID":
-        # DO NOT CHANGE !!!
-        converted = bytes(str(value), "utf-8")
-    elif snmp_type.upper() == "NOSUCHOBJECT":
-        # Nothing if OID not found
-        converted = None
-    elif snmp_type.upper() == "NOSUCHINSTANCE":
-        # Nothing if OID not found
-        converted = None
-    elif snmp_type.upper() == "ENDOFMIBVIEW":
-        # Nothing
-        converted = None
-    elif snmp_type.upper() == "NULL":
-        # Nothing
-        converted = None
-    else:
-        # Convert everything else into integer values
-        # rfc1902.Integer
-        # rfc1902.Integer32
-        # rfc1902.Counter32
-        # rfc1902.Gauge32
-        # rfc1902.Unsigned32
-        # rfc1902.TimeTicks
-        # rfc1902.Counter64
-        converted = int(value)
+    converter = _CONVERTERS.get(snmp_type)
+    if converter is None:
+        converter = _CONVERTERS.get(snmp_type.upper(), int)
 
     # Return
+    converted = converter(result.value)
     return converted
 
 
+def _to_bytes(value):
+    """Convert a string SNMP value to bytes.
+
+    Args:
+        value: Value
+
+    Returns:
+        result: Bytes
+
+    """
+    # Return
+    result = bytes(value, "utf-8")
+    return result
+
+
+def _to_oid(value):
+    """Convert an OBJECTID SNMP value to bytes.
+
+    Args:
+        value: Value
+
+    Returns:
+        result: Bytes
+
+    """
+    # DO NOT CHANGE !!!
+    result = bytes(str(value), "utf-8")
+    return result
+
+
+def _to_none(value):
+    """Convert an SNMP value of an OID that wasn't found.
+
+    Args:
+        value: Value
+
+    Returns:
+        None
+
+    """
+    # Nothing
+    return None
+
+
+# Functions that convert SNMP values, keyed by SNMP type
+_CONVERTERS = {
+    "OCTETSTR": _to_bytes,
+    "OPAQUE": _to_bytes,
+    "BITS": _to_bytes,
+    "IPADDR": _to_bytes,
+    "NETADDR": _to_bytes,
+    "OBJECTID": _to_oid,
+    "NOSUCHOBJECT": _to_none,
+    "NOSUCHINSTANCE": _to_none,
+    "ENDOFMIBVIEW": _to_none,
+    "NULL": _to_none,
+}
+
+
 def _oid_valid_format(oid):
     """Validate OID string format.
 
@@ -962,18 +1648,3 @@ def _oid_valid_format(oid):
 
     # Otherwise valid
     return True
-
-
-def _update_cache(filename, group):
-    """Update SNMP credentials cache file.
-
-    Args:
-        filename: String containing path to cache file
-        group: String containing SNMP group name to cache
-
-    Returns:
-        None
-    """
-    # Do update
-    with open(filename, "w+") as env:
-        env.write(group)
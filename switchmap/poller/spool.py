@@ -0,0 +1,319 @@
+"""Module to keep device data that couldn't be posted to the server."""
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import os
+import threading
+import time
+
+from switchmap.core import log
+from switchmap.core import files
+from switchmap.core import payload
+
+
+class Spool:
+    """Directory of device data waiting to be posted again.
+
+    Each post is saved in its own file, named after the time it was spooled
+    and the device, so files are never updated and are replayed oldest
+    first. Only the latest data of each device is kept, as older data would
+    overwrite it on the server. The oldest files are evicted when the spool
+    exceeds its maximum size.
+
+    """
+
+    def __init__(self, config):
+        """Initialize the class.
+
+        Args:
+            config: ConfigPoller object
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._directory = files.spool_directory(config)
+        self._size = config.spool_size() * 1024 * 1024
+        self._concurrency = config.spool_concurrency()
+
+    def put(self, data, name):
+        """Save data in the spool.
+
+        Args:
+            data: Data to save
+            name: Name of the device the data belongs to
+
+        Returns:
+            result: Path of the file, None if spooling is disabled
+
+        """
+        # Initialize key variables
+        result = None
+
+        # Save the data
+        if bool(self._size) is True:
+            result = os.path.join(
+                self._directory,
+                "{:020d}-{}-{}{}".format(
+                    time.time_ns(), os.getpid(), name, payload.EXTENSION
+                ),
+            )
+            payload.dump(data, result)
+            log_message = """\
+Failed to post the data of {}. Spooled it to {}""".format(
+                name, result
+            )
+            log.log2warning(2022, log_message)
+
+            # Older data of the device is replaced
+            self.remove(name, keep=result)
+
+            # Evict the oldest files if the spool is too large
+            self._evict()
+
+        # Return
+        return result
+
+    def remove(self, name, keep=None):
+        """Delete the spooled data of a device.
+
+        Args:
+            name: Name of the device the data belongs to
+            keep: Path of a file of the device not to delete
+
+        Returns:
+            None
+
+        """
+        # Delete
+        for filepath in self.filepaths():
+            if filepath != keep and _name(filepath) == name:
+                _remove(filepath)
+
+    def filepaths(self):
+        """Get the files in the spool.
+
+        Args:
+            None
+
+        Returns:
+            result: List of files, oldest first
+
+        """
+        # Files being written have a temporary extension
+        result = [
+            os.path.join(self._directory, _)
+            for _ in sorted(os.listdir(self._directory))
+            if _.endswith(payload.EXTENSION) is True
+        ]
+        return result
+
+    def drain(self, post):
+        """Post the spooled data, oldest first.
+
+        Posts are made concurrently in rounds of spool_concurrency files.
+        Only the latest file of each device is posted, so the files of a
+        device are never posted at the same time. Draining stops at the end
+        of the first round in which the server can't be reached.
+
+        Args:
+            post: Function that posts data and returns a Post named tuple
+
+        Returns:
+            result: Number of files posted
+
+        """
+        # Initialize key variables
+        latest = {}
+        result = 0
+
+        # Get the latest file of each device
+        for filepath in self.filepaths():
+            name = _name(filepath)
+            if name in latest:
+                _remove(latest[name])
+            latest[name] = filepath
+        filepaths = sorted(latest.values(), key=os.path.basename)
+
+        # Nothing to do if the spool is empty
+        if bool(filepaths) is False:
+            return result
+
+        with ThreadPoolExecutor(max_workers=self._concurrency) as executor:
+            for start in range(0, len(filepaths), self._concurrency):
+                # Post a round of files
+                chunk = filepaths[start : start + self._concurrency]
+                outcomes = list(executor.map(partial(_replay, post), chunk))
+                result += outcomes.count(True)
+
+                # Stop if the server couldn't be reached
+                if None in outcomes:
+                    break
+
+        # Log
+        if bool(result) is True:
+            log_message = "Posted {} spooled device data files".format(result)
+            log.log2info(2024, log_message)
+        return result
+
+    def _evict(self):
+        """Delete the oldest files until the spool fits its maximum size.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        sizes = []
+        for filepath in self.filepaths():
+            try:
+                sizes.append((filepath, os.path.getsize(filepath)))
+            except OSError:
+                continue
+        total = sum(size for _, size in sizes)
+
+        # Delete the oldest files first
+        for filepath, size in sizes:
+            if total <= self._size:
+                break
+            _remove(filepath)
+            total -= size
+            log_message = """\
+Spool exceeds {} bytes. Evicted {}""".format(
+                self._size, filepath
+            )
+            log.log2warning(2023, log_message)
+
+
+class Drainer(threading.Thread):
+    """Thread that periodically posts spooled device data."""
+
+    def __init__(self, spool, post, interval=60):
+        """Initialize the class.
+
+        Args:
+            spool: Spool object
+            post: Function that posts data and returns a Post named tuple
+            interval: Seconds between attempts to drain the spool
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        threading.Thread.__init__(self, daemon=True)
+        self._spool = spool
+        self._post = post
+        self._interval = interval
+        self._stopped = threading.Event()
+
+    def run(self):
+        """Drain the spool until stopped.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Drain
+        while self._stopped.wait(self._interval) is False:
+            try:
+                self._spool.drain(self._post)
+            except Exception as error:
+                log_message = "Failed to drain the spool: {}".format(error)
+                log.log2warning(2026, log_message)
+
+    def stop(self):
+        """Stop draining the spool.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Stop
+        self._stopped.set()
+        self.join()
+
+
+def _name(filepath):
+    """Get the name of the device to which a spooled file belongs.
+
+    Args:
+        filepath: Path of the file
+
+    Returns:
+        result: Name of the device
+
+    """
+    # Files are named <time>-<pid>-<name><extension>
+    result = os.path.basename(filepath)[: -len(payload.EXTENSION)]
+    result = result.split("-", 2)[-1]
+    return result
+
+
+def _replay(post, filepath):
+    """Post a spooled file.
+
+    Args:
+        post: Function that posts data and returns a Post named tuple
+        filepath: Path of the file
+
+    Returns:
+        result: True if posted, False if rejected by the server, None if
+            the server couldn't be reached
+
+    """
+    # Read the file. It may have been evicted
+    try:
+        data = payload.load(filepath)
+    except Exception:
+        return False
+
+    # Don't post the data if a newer post of the device replaced it
+    if os.path.isfile(filepath) is False:
+        return False
+
+    # Post
+    result = post(data)
+    status = getattr(getattr(result, "response", None), "status_code", None)
+    if bool(getattr(result, "success", False)) is True:
+        _remove(filepath)
+        return True
+
+    # Data the server will never accept is discarded
+    if isinstance(status, int) is True and 400 <= status < 500:
+        if status not in [408, 429]:
+            _remove(filepath)
+            log_message = """\
+Server rejected spooled file {} with status {}. Discarded it""".format(
+                filepath, status
+            )
+            log.log2warning(2025, log_message)
+            return False
+    return None
+
+
+def _remove(filepath):
+    """Delete a file that may already have been deleted.
+
+    Args:
+        filepath: Path of the file
+
+    Returns:
+        None
+
+    """
+    # Delete
+    try:
+        os.remove(filepath)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,182 @@
+"""Poller data kept for each device between polling cycles."""
+
+import fcntl
+import os
+import threading
+
+import yaml
+
+# Import project libraries
+from switchmap.poller.configuration import ConfigPoller
+from switchmap.core import log
+from switchmap.core import files
+
+# Stores shared by the process
+_STORES = {}
+_STORES_LOCK = threading.Lock()
+
+
+class Store:
+    """Values keyed by hostname that are saved in a YAML file.
+
+    The file is read once per process. Updates are merged with those made
+    by other poller processes, so the same file can be shared by all of
+    them.
+
+    """
+
+    def __init__(self, filename):
+        """Initialize the class.
+
+        Args:
+            filename: Name of the YAML file
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._filename = filename
+        self._lock = threading.RLock()
+        self._data = None
+
+    def get(self, key, default=None):
+        """Get the value of a key.
+
+        Args:
+            key: Key
+            default: Value to return if the key doesn't exist
+
+        Returns:
+            result: Value of the key
+
+        """
+        # Return
+        with self._lock:
+            result = self._load().get(key, default)
+        return result
+
+    def data(self):
+        """Get all the values.
+
+        Args:
+            None
+
+        Returns:
+            result: Dict of values
+
+        """
+        # Return
+        with self._lock:
+            result = dict(self._load())
+        return result
+
+    def update(self, key, value):
+        """Set the value of a key and save it to the file.
+
+        Args:
+            key: Key
+            value: Value of the key. The key is deleted if None
+
+        Returns:
+            None
+
+        """
+        with self._lock:
+            # Nothing to do if the value is current
+            data = self._load()
+            if data.get(key) == value:
+                return
+            if value is None:
+                data.pop(key, None)
+            else:
+                data[key] = value
+
+            # Prevent other processes from updating the file at the same time
+            with open("{}.lock".format(self._filename), "a") as lock_handle:
+                fcntl.flock(lock_handle, fcntl.LOCK_EX)
+
+                # Add the updates made by other processes
+                saved = _read(self._filename)
+                if value is None:
+                    saved.pop(key, None)
+                else:
+                    saved[key] = value
+                data.clear()
+                data.update(saved)
+
+                # Replace the file
+                temporary = "{}.tmp".format(self._filename)
+                with open(temporary, "w") as f_handle:
+                    yaml.safe_dump(saved, f_handle, default_flow_style=False)
+                os.replace(temporary, self._filename)
+
+    def _load(self):
+        """Read the file if not already done.
+
+        Args:
+            None
+
+        Returns:
+            result: Dict of values
+
+        """
+        # Read the file
+        if self._data is None:
+            self._data = _read(self._filename)
+        result = self._data
+        return result
+
+
+def store(name):
+    """Get the Store shared by the process.
+
+    Args:
+        name: Name of the store
+
+    Returns:
+        result: Store object
+
+    """
+    # Create the store if needed
+    with _STORES_LOCK:
+        if name not in _STORES:
+            _STORES[name] = Store(files.snmp_store_file(name, ConfigPoller()))
+        result = _STORES[name]
+
+    # Return
+    return result
+
+
+def _read(filename):
+    """Read a store file.
+
+    Args:
+        filename: Name of the YAML file
+
+    Returns:
+        result: Dict of values
+
+    """
+    # Initialize key variables
+    result = {}
+
+    # Read the file
+    if os.path.isfile(filename) is True:
+        try:
+            with open(filename, "r") as f_handle:
+                data = yaml.safe_load(f_handle)
+        except:
+            log_message = "Error reading poller data file {}".format(filename)
+            log.log2warning(2013, log_message)
+            data = {}
+
+        if isinstance(data, dict) is True:
+            result = {
+                str(key): value
+                for key, value in data.items()
+                if value is not None
+            }
+
+    # Return
+    return result
@@ -35,9 +35,10 @@ class Device:
             None
 
         """
-        # Initialize key variables
+        # Initialize key variables. The data is never changed, so it isn't
+        # copied either
         self._devicename = data["misc"]["host"]
-        self._data = deepcopy(data)
+        self._data = data
 
     def process(self):
         """Initialize class.
@@ -112,19 +113,31 @@ class Device:
             l1_trunk: A vendor agnostic flag of "True" if the port is a Trunk
             l1_duplex: A vendor agnostic status code for the duplex setting
 
+            =================================================================
+
+            Copies
+
+            The device data isn't copied. A new record is created for each
+            port instead, with the Layer1 keys added to a shallow copy of
+            the polled port data. The records of ports already processed
+            replace the polled ones in a new layer1 dict. All other values
+            are shared with the polled data, and must not be changed.
+
         """
         # Initialize key variables
-        updated_device_data = deepcopy(self._data)
-        layer1_data = updated_device_data["layer1"]
+        updated_device_data = dict(self._data)
+        polled_data = self._data["layer1"]
+        layer1_data = {}
+        updated_device_data["layer1"] = layer1_data
 
         # Send log message
         log_message = "Processing data from host {}".format(self._devicename)
         log.log2debug(1048, log_message)
 
         # Create dict for layer1 Ethernet data
-        for ifindex, _port_data in sorted(layer1_data.items()):
-            # Make a copy of the port data to reduce the risk of corruption
-            port_data = deepcopy(_port_data)
+        for ifindex, _port_data in sorted(polled_data.items()):
+            # Create a new record to avoid changing the polled data
+            port_data = dict(_port_data)
 
             # Process port_data
             if _is_ethernet(port_data) is True:
@@ -168,11 +181,15 @@ the IF-MIB::ifStackStatus OID"""
                             port_data["l1_vlans"],
                             port_data["l1_nativevlan"],
                             port_data["l1_trunk"],
-                        ) = _process_non_trunk(layer1_data[ifstacklowerlayer])
+                        ) = _process_non_trunk(polled_data[ifstacklowerlayer])
 
                     else:
                         meta = _process_trunk(
-                            layer1_data[ifstackhigherlayer], higherlayers
+                            layer1_data.get(
+                                ifstackhigherlayer,
+                                polled_data[ifstackhigherlayer],
+                            ),
+                            higherlayers,
                         )
                         port_data["l1_vlans"] = meta.vlan
                         port_data["l1_nativevlan"] = meta.nativevlan
@@ -185,14 +202,14 @@ the IF-MIB::ifStackStatus OID"""
                 #############################################################
 
                 # Update duplex to universal switchmap.port_data value
-                port_data["l1_duplex"] = _duplex(deepcopy(port_data))
+                port_data["l1_duplex"] = _duplex(port_data)
 
             else:
                 # Update Ethernet status
                 port_data["l1_ethernet"] = False
 
             # Update the data
-            updated_device_data["layer1"][ifindex] = port_data
+            layer1_data[ifindex] = port_data
 
         # Send log message
         log_message = "Completed processing data from host {}".format(
@@ -249,7 +266,7 @@ def _process_trunk(port_data, higherlayers):
     else:
         vlan = _vlan(port_data)
         if "l1_vlans" in port_data:
-            vlan.extend(vlan)
+            vlan = vlan + vlan
         else:
             vlan = vlan
 
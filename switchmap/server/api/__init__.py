@@ -10,6 +10,7 @@ from flask import Flask
 # Do remaining switchmap importations
 from switchmap.server.api.routes.graphql import API_GRAPHQL
 from switchmap.server.api.routes.post import API_POST
+from switchmap.core import payload
 from switchmap import API_PREFIX
 
 # Initializes the Flask Object.
@@ -18,6 +19,9 @@ API = Flask(
     __name__,
 )
 
+# Reject posts larger than the largest payload accepted
+API.config["MAX_CONTENT_LENGTH"] = payload.MAX_SIZE
+
 # Register Blueprints
 API.register_blueprint(API_GRAPHQL, url_prefix=API_PREFIX)
 API.register_blueprint(API_POST, url_prefix=API_PREFIX)
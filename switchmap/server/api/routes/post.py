@@ -2,15 +2,16 @@
 
 # Standard imports
 import os
-import hashlib
 
 # PIP3 imports
 from flask import Blueprint, request, jsonify
-import yaml
 
 # Repository imports
 from switchmap.core import log
+from switchmap.core import payload
+from switchmap.core import delta
 from switchmap import API_POLLER_POST_URI
+from switchmap import API_POLLER_BATCH_URI
 from switchmap import API_POLLER_SEARCH_URI
 from switchmap.server.configuration import ConfigServer
 from switchmap.server.db.misc import search
@@ -33,9 +34,165 @@ def post_device_data():
     """
     # Initialize key variables
     config = ConfigServer()
+    headers = _headers()
+
+    # Get data
+    try:
+        data = _data()
+    except payload.PayloadTooLarge:
+        return "Payload too large", 413, headers
+    if data is None:
+        return "Unsupported payload", 415, headers
+
+    # Save data
+    status, version = _save(data, config)
+    if status == 409:
+        return "Full upload required", 409, headers
+    if bool(version) is True:
+        headers[delta.HEADER] = version
+
+    # Return
+    return "OK", 200, headers
+
+
+@API_POST.route(API_POLLER_BATCH_URI, methods=["POST"])
+def post_device_batch():
+    """Accept posts of the data of several network devices from pollers.
+
+    Args:
+        None
+
+    Returns:
+        _response: JSON list of the HTTP status of each device's data, and
+            the version of the data kept as the base of its next post
+
+    """
+    # Initialize key variables
+    config = ConfigServer()
+    headers = _headers()
+    results = []
+
+    # Get data
+    try:
+        data = _data()
+    except payload.PayloadTooLarge:
+        return "Payload too large", 413, headers
+    if data is None:
+        return "Unsupported payload", 415, headers
+    if (
+        isinstance(data, dict) is False
+        or isinstance(data.get("batch"), list) is False
+    ):
+        return "Invalid batch", 400, headers
+
+    # Save the data of each device
+    for item in data["batch"]:
+        status, version = _save(item, config)
+        results.append({"status": status, "version": version})
+
+    # Return
+    return jsonify({"results": results}), 200, headers
+
+
+@API_POST.route(API_POLLER_SEARCH_URI, methods=["POST"])
+def post_searchterm():
+    """Accept posts searches.
+
+    Args:
+        None
+
+    Returns:
+        _response: OK message when successful
+
+    """
+    # Initialize key variables
+    result = []
 
     # Get data
     data = request.json
+    try:
+        searchterm = data.get("searchterm", "")
+        idx_root = data.get("idx_root", 1)
+
+    except:
+        searchterm = ""
+        idx_root = 1
+
+    if bool(searchterm):
+        result = search.search(int(idx_root), searchterm)
+        return jsonify(result)
+    else:
+        return jsonify(result)
+
+
+def _headers():
+    """Get the HTTP headers of responses to pollers.
+
+    Args:
+        None
+
+    Returns:
+        result: Dict of headers
+
+    """
+    # Tell pollers which binary formats are accepted
+    result = {
+        "Accept-Post": ", ".join(
+            _type
+            for _type in [payload.JSON, payload.MSGPACK]
+            if payload.supported(content_type=_type) is True
+        )
+    }
+    return result
+
+
+def _data():
+    """Get the data posted by a poller.
+
+    Args:
+        None
+
+    Returns:
+        result: Data, None if its format isn't supported. PayloadTooLarge
+            is raised if it is too large once decompressed
+
+    """
+    # Initialize key variables
+    content_encoding = request.headers.get("Content-Encoding")
+    result = None
+
+    # Get data
+    if request.mimetype == payload.JSON and bool(content_encoding) is False:
+        result = request.json
+    elif payload.supported(request.mimetype, content_encoding) is True:
+        result = payload.decode(
+            request.get_data(), request.mimetype, content_encoding
+        )
+    return result
+
+
+def _save(data, config):
+    """Write the data of a device to the cache directory.
+
+    Args:
+        data: Data posted for the device
+        config: ConfigServer object
+
+    Returns:
+        result: Tuple of the HTTP status and the version of the data kept
+            as the base of the device's next post. The status is 409 if
+            the data has to be posted in full
+
+    """
+    # Initialize key variables
+    version = None
+
+    # Rebuild the data from the changes since the device's last post
+    if isinstance(data, dict) is True and "delta" in data:
+        data = _rebuild(data["delta"], config)
+        if data is None:
+            return (409, version)
+
     try:
         hostname = data["misc"]["host"]
     except:
@@ -49,17 +206,13 @@ def post_device_data():
         # Only write data if file doesn't exist. This reduces the risk of
         # duplicate data if data from a previously existing file is still
         # being ingested.
-        filepath = "{}{}{}-{}.yaml".format(
-            config.cache_directory(),
-            os.sep,
-            hostname,
-            hashlib.md5(zone.encode("utf-8")).hexdigest()[:5],
+        name = delta.filename(hostname, zone)
+        filepath = "{}{}{}{}".format(
+            config.cache_directory(), os.sep, name, payload.EXTENSION
         )
         if os.path.exists(filepath) is False:
             # Write data to file
-            # data_as_string = json.dumps(data)
-            with open(filepath, "w") as f_handle:
-                yaml.dump(data, f_handle)
+            payload.dump(data, filepath)
 
             # Log
             log_message = "Successfully created data cache file {}.".format(
@@ -76,36 +229,61 @@ def post_device_data():
             )
             log.log2info(1042, log_message)
 
+        # Keep the data as the base of the device's next post
+        data = delta.canonical(data)
+        version = delta.version(data)
+        payload.dump(
+            {"version": version, "data": data},
+            "{}{}{}{}".format(
+                config.base_directory(), os.sep, name, payload.EXTENSION
+            ),
+        )
+
     # Return
-    return "OK"
+    result = (200, version)
+    return result
 
 
-@API_POST.route(API_POLLER_SEARCH_URI, methods=["POST"])
-def post_searchterm():
-    """Accept posts searches.
+def _rebuild(changes, config):
+    """Rebuild device data from the changes since its last post.
 
     Args:
-        None
+        changes: Dict of the changes posted by the poller
+        config: ConfigServer object
 
     Returns:
-        _response: OK message when successful
+        result: Data, None if the changes don't apply to the last data
+            posted by the device
 
     """
     # Initialize key variables
-    result = []
+    result = None
 
-    # Get data
-    data = request.json
+    # Read the last data posted by the device
     try:
-        searchterm = data.get("searchterm", "")
-        idx_root = data.get("idx_root", 1)
+        name = delta.filename(changes["host"], changes["zone"])
+        filepath = "{}{}{}{}".format(
+            config.base_directory(), os.sep, name, payload.EXTENSION
+        )
+        base = payload.load(filepath) if os.path.isfile(filepath) else {}
+        if base.get("version") == changes["base"]:
+            result = delta.apply(base["data"], changes["changes"])
+    except Exception:
+        result = None
 
-    except:
-        searchterm = ""
-        idx_root = 1
+    # The result must be identical to the data polled
+    if result is not None:
+        if delta.version(result) != changes.get("version"):
+            result = None
 
-    if bool(searchterm):
-        result = search.search(int(idx_root), searchterm)
-        return jsonify(result)
-    else:
-        return jsonify(result)
+    # Log
+    if result is None:
+        log_message = """\
+Changes posted for host {} don't match its last data. Requesting a full \
+upload""".format(
+            changes.get("host") if isinstance(changes, dict) else None
+        )
+        log.log2info(2020, log_message)
+
+    # Return
+    return result
@@ -55,6 +55,34 @@ class ConfigServer(ConfigAPI):
         result = self._config_server.get("api_bind_port", 7000)
         return result
 
+    def base_directory(self):
+        """Determine the directory of the last data posted by each device.
+
+        Args:
+            None
+
+        Returns:
+            result: base_directory
+
+        """
+        # Get result
+        result = "{}{}base".format(self.cache_directory(), os.sep)
+
+        # Create the directory if not found
+        if os.path.isdir(result) is False:
+            files.mkdir(result)
+
+        # Check if value exists
+        if os.path.isdir(result) is False:
+            log_message = (
+                'base_directory: "{}" '
+                "in the configuration file(s) doesn't exist!"
+            ).format(result)
+            log.log2die_safe(2019, log_message)
+
+        # Return
+        return result
+
     def cache_directory(self):
         """Determine the cache_directory.
 
@@ -102,6 +130,26 @@ class ConfigServer(ConfigAPI):
         # Return
         return result
 
+    def db_insert_chunk_size(self):
+        """Get the number of rows inserted per database statement.
+
+        Args:
+            None
+
+        Returns:
+            result: Configured value
+
+        """
+        # Get parameter
+        _result = self._config_server.get("db_insert_chunk_size", 1000)
+        value = int(_result)
+
+        # Set min values
+        result = max(abs(value), 1)
+
+        # Return
+        return result
+
     def db_name(self):
         """Return db_name value.
 
@@ -232,6 +280,22 @@ class ConfigServer(ConfigAPI):
         result = self._config_server.get("ingest_interval", 86400)
         return result
 
+    def ingest_snapshot_interval(self):
+        """Get ingest_snapshot_interval.
+
+        Args:
+            None
+
+        Returns:
+            result: Seconds between ingests that store all the polled data
+                as a new event. Every ingest does if 0
+
+        """
+        # Get result
+        result = self._config_server.get("ingest_snapshot_interval", 0)
+        result = 0 if bool(result) is False else int(result)
+        return result
+
     def purge_after_ingest(self):
         """Return purge_after_ingest value.
 
@@ -18,6 +18,7 @@ from switchmap.core import log
 #############################################################################
 ENGINE = None
 SCOPED_SESSION = None
+INSERT_CHUNK_SIZE = 1000
 
 
 def main():
@@ -34,6 +35,7 @@ def main():
     use_mysql = True
     global ENGINE
     global SCOPED_SESSION
+    global INSERT_CHUNK_SIZE
 
     # Initialize variables
     pool_timeout = 30
@@ -44,6 +46,7 @@ def main():
     config = ConfigServer()
     pool_size = config.db_pool_size()
     max_overflow = config.db_max_overflow()
+    INSERT_CHUNK_SIZE = config.db_insert_chunk_size()
 
     # Create DB connection pool
     if use_mysql is True:
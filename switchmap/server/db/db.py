@@ -1,13 +1,16 @@
 """Class to process connection."""
 
 import sys
+import datetime
 
+from sqlalchemy.dialects.mysql import insert
 from sqlalchemy.sql import Select, Update, Delete
 from sqlalchemy.orm import Session
 
 # Import project libraries
 from switchmap.core import log
 from switchmap.server.db import ENGINE
+from switchmap.server.db import INSERT_CHUNK_SIZE
 
 
 def db_select_row(error_code, statement):
@@ -285,3 +288,68 @@ def db_add_all(error_code, instances, die=True):
 
     # Return
     return result
+
+
+def db_insert_all(error_code, model, rows):
+    """Insert rows using multi-row INSERT ... ON DUPLICATE KEY UPDATE.
+
+    Rows with the same unique key values as existing rows update them. The
+    rows are inserted by statements of up to the configured
+    db_insert_chunk_size rows in a single transaction.
+
+    Args:
+        error_code: Error code to use in messages
+        model: ORM model of the table
+        rows: List of dicts of column values, all with the same columns
+
+    Returns:
+        result: True if successful
+
+    """
+    # Initialize key variables
+    result = False
+    table = model.__table__
+
+    # Nothing to do
+    if bool(rows) is False:
+        result = True
+        return result
+
+    with ENGINE.connect() as connection:
+        # Insert
+        try:
+            with connection.begin():
+                for index in range(0, len(rows), INSERT_CHUNK_SIZE):
+                    connection.execute(
+                        _upsert(table, rows[index : index + INSERT_CHUNK_SIZE])
+                    )
+        except:
+            # Log error
+            log.log2info(error_code, 'DB "insert_all" error.')
+            log.log2exception_die(error_code, sys.exc_info())
+        else:
+            result = True
+
+    # Return
+    return result
+
+
+def _upsert(table, rows):
+    """Create an INSERT ... ON DUPLICATE KEY UPDATE statement.
+
+    Args:
+        table: Table
+        rows: List of dicts of column values
+
+    Returns:
+        statement: Statement
+
+    """
+    # Update the inserted columns of the existing rows. The onupdate values
+    # of the ORM models aren't applied to ON DUPLICATE KEY UPDATE
+    statement = insert(table).values(rows)
+    values = {_: statement.inserted[_] for _ in rows[0]}
+    if "ts_modified" in table.columns:
+        values["ts_modified"] = datetime.datetime.now()
+    statement = statement.on_duplicate_key_update(values)
+    return statement
@@ -3,12 +3,14 @@
 import os.path
 import os
 import tempfile
+import time
 from operator import attrgetter
 
 # Import project libraries
 from multiprocessing import get_context
 from switchmap.core import log
 from switchmap.core import files
+from switchmap.core import payload
 from switchmap.core import general
 from switchmap import AGENT_INGESTER, AGENT_POLLER
 from switchmap.server.db.table import IZone
@@ -17,15 +19,17 @@ from switchmap.server.db.table import IMacIp
 from switchmap.server.db.table import IIpPort
 from switchmap.server.db.table import event as _event
 from switchmap.server.db.table import zone as _zone
+from switchmap.server.db.table import device as _device
 from switchmap.server.db.table import root as _root
 from switchmap.server.db.table import ip as _ip
 from switchmap.server.db.table import ipport as _ipport
 from switchmap.server.db.table import mac as _mac
 from switchmap.server.db.table import macip as _macip
-from switchmap.server.db.table import macport as _macport
+from switchmap.server.db.table import oui as _oui
 from switchmap.server import ZoneData, ZoneDevice, EventObjects
 from switchmap.server.db.ingest.update import device as update_device
 from switchmap.server.db.ingest.update import zone as update_zone
+from switchmap.server.db.ingest.query import zone as _query_zone
 
 
 class Ingest:
@@ -85,10 +89,15 @@ class Ingest:
             # and ingester are running on the same machine
             if os.path.isfile(poller_lock_file) is False:
                 # Copy files from cache to ingest
-                files.move_yaml_files(cache_directory, tmpdir)
+                files.move_cache_files(cache_directory, tmpdir)
+
+                # Reload the OUIs if they were updated since the last run
+                _oui.refresh()
 
                 # Parallel process the files
-                setup_success = setup(tmpdir, self._config)
+                setup_success = setup(
+                    tmpdir, self._config, incremental=bool(self._test) is False
+                )
 
                 if bool(setup_success) is True:
                     # Populate the arguments
@@ -168,7 +177,7 @@ class Ingest:
                 rows.append(process_zone(*argument))
 
         # Insert ARP table
-        pairmacips = insert_arptable(rows)
+        pairmacips = insert_arptable(rows, complete=_complete(arguments))
 
         # Return
         success = True
@@ -326,12 +335,14 @@ shutdown request was probably requested""".format(
     update_device.process(data, idx_zone)
 
 
-def setup(src, config):
+def setup(src, config, incremental=False):
     """Ingest the files in parallel.
 
     Args:
         src: Directory where device YAML files are located
         config: Configuration object
+        incremental: Add the data to the most recent event if a new snapshot
+            isn't due according to the configured ingest_snapshot_interval
 
     Returns:
         result: EventObjects object
@@ -346,8 +357,15 @@ def setup(src, config):
 
     # Parallel processing
     if bool(filepaths) is True:
+        # Carry the data of the most recent event forward until a new
+        # snapshot is due
+        event = False
+        if bool(incremental) is True:
+            event = _recent(config.ingest_snapshot_interval())
+
         # Create an event
-        event = _event.create()
+        if bool(event) is False:
+            event = _event.create()
 
         # Get the _zone data from each file
         for filepath in filepaths:
@@ -366,6 +384,68 @@ def setup(src, config):
     return result
 
 
+def _recent(interval):
+    """Get the most recent event if a new snapshot isn't due.
+
+    Args:
+        interval: Seconds between snapshots
+
+    Returns:
+        result: REvent object. False if a snapshot is due
+
+    """
+    # Initialize key variables
+    result = False
+
+    # Every ingest is a snapshot if there is no interval
+    if bool(interval) is False:
+        return result
+
+    # Use the event if it's recent
+    current = _event.current()
+    if bool(current) is True:
+        if int(time.time()) - current.epoch_utc < interval:
+            result = current
+
+            # Log
+            log_message = (
+                "Ingesting the changes to the data of event {}".format(
+                    current.name
+                )
+            )
+            log.log2info(2029, log_message)
+
+    # Return
+    return result
+
+
+def _complete(arguments):
+    """Get the zones whose devices are all being ingested.
+
+    Args:
+        arguments: List of arguments for the processing the zone
+            [[item.idx_zone, item.data, item.filepath, item.config]]
+
+    Returns:
+        result: Set of idx_zone values
+
+    """
+    # Initialize key variables
+    hostnames = {}
+
+    # Get the hostnames being ingested in each zone
+    for idx_zone, data, _, _ in arguments:
+        hostnames.setdefault(idx_zone, set()).add(data["misc"]["host"])
+
+    # Compare them with the devices of the zones
+    result = set(
+        idx_zone
+        for idx_zone, ingested in hostnames.items()
+        if set(_.hostname for _ in _device.devices(idx_zone)) <= ingested
+    )
+    return result
+
+
 def _filepaths(src):
     """Get and _event ID for the next polling cycle.
 
@@ -373,21 +453,23 @@ def _filepaths(src):
         src: Source directory
 
     Returns:
-        filepaths: List of all yaml files in the directory
+        filepaths: List of all cache files in the directory
 
     """
     # Initialize key variables
     filepaths = []
 
     # Log progress
-    log_message = "Reading ingest YAML files."
+    log_message = "Reading ingest cache files."
     log.log2info(1234, log_message)
 
     # Process files
     src_files = os.listdir(src)
     for filename in src_files:
         filepath = os.path.join(src, filename)
-        if os.path.isfile(filepath) and filepath.lower().endswith(".yaml"):
+        if os.path.isfile(filepath) and filepath.lower().endswith(
+            (".yaml", payload.EXTENSION)
+        ):
             filepaths.append(filepath)
     return filepaths
 
@@ -403,8 +485,8 @@ def _get_zone(event, filepath):
         result: ZoneData object
 
     """
-    # Read the yaml file
-    data = files.read_yaml_file(filepath)
+    # Read the cache file
+    data = files.read_cache_file(filepath)
 
     # Get the zone information
     name = data["misc"]["zone"]
@@ -434,7 +516,7 @@ def _get_zone(event, filepath):
     return result
 
 
-def insert_arptable(data, test=False):
+def insert_arptable(data, test=False, complete=None):
     """Insert values from ARP tables.
 
     Args:
@@ -442,6 +524,8 @@ def insert_arptable(data, test=False):
             OR a single ZoneObjects from testing
         test: Sequentially insert values into the database if True.
             Bulk inserts don't insert data with predictable primary keys.
+        complete: idx_zone values of the zones whose devices are all being
+            ingested. Their stale MAC to IP address pairs are deleted
 
     Returns:
         pairmacips: List of PairMacIp objects
@@ -458,9 +542,10 @@ def insert_arptable(data, test=False):
         ips = data.ips
         pairmacips = data.pairmacips
 
-    # Remove any duplicates
-    macs = list(set(macs))
-    ips = list(set(ips))
+    # Remove any duplicates, and the addresses already in the zones when
+    # the data of the previous ingest is carried forward
+    macs = _new_macs(list(set(macs)))
+    ips = _new_ips(list(set(ips)))
     pairmacips = list(set(pairmacips))
 
     # Insert MAC addresses for all zones
@@ -490,19 +575,99 @@ def insert_arptable(data, test=False):
     # Insert ARP entries for all zones
     log_message = "Updating MAC to IP address mapping in the database."
     log.log2debug(1089, log_message)
-    insert_macips(pairmacips, test=test)
+    insert_macips(pairmacips, test=test, complete=complete)
 
     # Return
     return pairmacips
 
 
-def insert_macips(items, test=False):
+def _new_macs(rows):
+    """Get the MAC addresses that aren't in the database.
+
+    Args:
+        rows: List of IMac objects
+
+    Returns:
+        result: List of IMac objects
+
+    """
+    # Initialize key variables
+    result = []
+    zones = {}
+
+    # Group the addresses by zone
+    for row in rows:
+        zones.setdefault(row.idx_zone, []).append(row)
+
+    # Find the addresses in each zone
+    for idx_zone, items in zones.items():
+        existing = set(
+            _.mac for _ in _mac.findmac(idx_zone, [_.mac for _ in items])
+        )
+        result.extend(
+            _ for _ in items if general.mac(_.mac).mac not in existing
+        )
+
+    # Return
+    return result
+
+
+def _new_ips(rows):
+    """Get the IP addresses that aren't in the database.
+
+    The hostnames of the addresses in the database are updated if changed.
+
+    Args:
+        rows: List of IIp objects
+
+    Returns:
+        result: List of IIp objects
+
+    """
+    # Initialize key variables
+    result = []
+    zones = {}
+
+    # Group the addresses by zone
+    for row in rows:
+        zones.setdefault(row.idx_zone, []).append(row)
+
+    # Find the addresses in each zone
+    for idx_zone, items in zones.items():
+        existing = {
+            _.address: _
+            for _ in _ip.findip(idx_zone, [_.address for _ in items])
+        }
+        for item in items:
+            address = general.ipaddress(item.address)
+            exists = existing.get(address.address) if bool(address) else None
+            if bool(exists) is False:
+                result.append(item)
+            elif bool(item.hostname) is True and (
+                exists.hostname != item.hostname.lower()
+            ):
+                _ip.update_row(exists.idx_ip, item)
+
+    # Return
+    return result
+
+
+def insert_macips(items, test=False, complete=None):
     """Update the mac DB table.
 
+    The keys of the addresses and the existing pairs of each zone are read
+    once, so that the pairs are resolved without querying the database for
+    each of them. The pairs don't record the devices they were learned from,
+    so existing pairs that weren't found are only deleted in the zones whose
+    devices are all being ingested. They are stale when the data of the
+    previous ingest is carried forward.
+
     Args:
         items: List of PairMacIp objects
         test: Sequentially insert values into the database if True.
             Bulk inserts don't insert data with predictable primary keys.
+        complete: idx_zone values of the zones whose devices are all being
+            ingested. No pairs are deleted if None
 
     Returns:
         None
@@ -510,6 +675,9 @@ def insert_macips(items, test=False):
     """
     # Initialize key variables
     rows = []
+    zones = {}
+    found = {}
+    complete = set() if complete is None else complete
 
     # Insert shit
     if isinstance(items, list) is False:
@@ -517,22 +685,34 @@ def insert_macips(items, test=False):
 
     # Process data
     for item in items:
-        # Update the database
-        mac_exists = _mac.exists(item.idx_zone, item.mac)
-        ip_exists = _ip.exists(item.idx_zone, item.ip)
+        # Get the keys of the zone
+        if item.idx_zone not in zones:
+            zones[item.idx_zone] = (
+                _query_zone.macs(item.idx_zone),
+                _query_zone.ips(item.idx_zone),
+                _query_zone.macips(item.idx_zone),
+            )
+            found[item.idx_zone] = set()
+        macs, ips, macips = zones[item.idx_zone]
+
+        # Get the keys of the addresses
+        idx_mac = macs.get(general.mac(item.mac).mac)
+        myp = general.ipaddress(item.ip)
+        idx_ip = ips.get(myp.address) if bool(myp) is True else None
 
         # Insert
-        if bool(mac_exists) and bool(ip_exists):
-            macip_exists = _macip.exists(mac_exists.idx_mac, ip_exists.idx_ip)
-            if bool(macip_exists) is False:
+        if bool(idx_mac) and bool(idx_ip):
+            key = (idx_mac, idx_ip)
+            if key not in macips and key not in found[item.idx_zone]:
                 # Create a DB record
                 rows.append(
                     IMacIp(
-                        idx_ip=ip_exists.idx_ip,
-                        idx_mac=mac_exists.idx_mac,
+                        idx_ip=idx_ip,
+                        idx_mac=idx_mac,
                         enabled=1,
                     )
                 )
+            found[item.idx_zone].add(key)
 
     # Insert the values
     if bool(test) is False:
@@ -541,10 +721,27 @@ def insert_macips(items, test=False):
         for row in sorted(rows, key=attrgetter("idx_mac", "idx_ip")):
             _macip.insert_row(row)
 
+    # Delete the pairs that weren't found
+    for idx_zone, (_, _, macips) in sorted(zones.items()):
+        if idx_zone not in complete:
+            continue
+        _macip.delete_row(
+            sorted(
+                idx for key, idx in macips.items() if key not in found[idx_zone]
+            )
+        )
+
 
 def insert_ipports(items, test=False):
     """Update the mac DB table.
 
+    The keys of the addresses, the interfaces of the MAC addresses and the
+    existing pairs of each zone are read once, so that the pairs are
+    resolved without querying the database for each of them. Existing pairs
+    that weren't found are deleted if the MAC address to interface and MAC
+    to IP address pairs of the zone no longer support them. The pairs of
+    devices that weren't ingested are therefore kept.
+
     Args:
         items: PairMacIp objects list
         test: Sequentially insert values into the database if True.
@@ -556,6 +753,8 @@ def insert_ipports(items, test=False):
     """
     # Initialize key variables
     rows = []
+    zones = {}
+    found = {}
 
     # Process data
     for item in items:
@@ -571,34 +770,38 @@ def insert_ipports(items, test=False):
         else:
             next_mac = mactest.mac
 
+        # Get the keys of the zone
+        if item.idx_zone not in zones:
+            zones[item.idx_zone] = (
+                _query_zone.macs(item.idx_zone),
+                _query_zone.ips(item.idx_zone),
+                _query_zone.macports(item.idx_zone),
+                _query_zone.ipports(item.idx_zone),
+            )
+            found[item.idx_zone] = set()
+        macs, ips, macports, ipports = zones[item.idx_zone]
+
         # Verify prerequisites
-        mac_exists = _mac.exists(item.idx_zone, next_mac)
-        ip_exists = _ip.exists(item.idx_zone, myp.address)
+        idx_mac = macs.get(next_mac)
+        idx_ip = ips.get(myp.address)
 
         # Skip if the IP doesn't exist, or else the following logic will crash
-        if bool(ip_exists) is False:
+        if bool(idx_ip) is False:
             continue
 
-        # Iterate over existing MAC entries
-        if bool(mac_exists) is True:
-            # Get the ports on which the MAC address resides
-            macports = _macport.find_idx_mac(mac_exists.idx_mac)
-
-            # Iterate over the MAC assignments to interfaces
-            for macport in macports:
-                ipport_exists = _ipport.exists(
-                    macport.idx_l1interface, ip_exists.idx_ip
-                )
-
-                # Assign the IP to this port
-                if bool(ipport_exists) is False:
-                    rows.append(
-                        IIpPort(
-                            idx_l1interface=macport.idx_l1interface,
-                            idx_ip=ip_exists.idx_ip,
-                            enabled=1,
-                        )
+        # Iterate over the MAC assignments to interfaces
+        for idx_l1interface in macports.get(idx_mac, []):
+            # Assign the IP to this port
+            key = (idx_l1interface, idx_ip)
+            if key not in ipports and key not in found[item.idx_zone]:
+                rows.append(
+                    IIpPort(
+                        idx_l1interface=idx_l1interface,
+                        idx_ip=idx_ip,
+                        enabled=1,
                     )
+                )
+            found[item.idx_zone].add(key)
 
     # Do the inserts
     if bool(test) is False:
@@ -606,3 +809,18 @@ def insert_ipports(items, test=False):
     else:
         for row in sorted(rows, key=attrgetter("idx_ip", "idx_l1interface")):
             _ipport.insert_row(row)
+
+    # Delete the pairs that weren't found and are no longer supported
+    for idx_zone, (_, _, macports, ipports) in sorted(zones.items()):
+        supported = set(
+            (idx_l1interface, idx_ip)
+            for idx_mac, idx_ip in _query_zone.macips(idx_zone)
+            for idx_l1interface in macports.get(idx_mac, [])
+        )
+        _ipport.delete_row(
+            sorted(
+                idx
+                for key, idx in ipports.items()
+                if key not in found[idx_zone] and key not in supported
+            )
+        )
@@ -0,0 +1,128 @@
+"""Module for getting the keys of the addresses of a zone in bulk."""
+
+# PIP3 imports
+from sqlalchemy import select, and_
+
+# Application imports
+from switchmap.server.db import db
+from switchmap.server.db.models import Mac as _Mac
+from switchmap.server.db.models import Ip as _Ip
+from switchmap.server.db.models import MacIp as _MacIp
+from switchmap.server.db.models import MacPort as _MacPort
+from switchmap.server.db.models import IpPort as _IpPort
+
+
+def macs(idx_zone):
+    """Get the idx_mac values of the MAC addresses of a zone.
+
+    Args:
+        idx_zone: Zone index
+
+    Returns:
+        result: Dict of idx_mac values keyed by MAC address
+
+    """
+    # Initialize key variables
+    result = {}
+
+    # Get data
+    statement = select(_Mac.mac, _Mac.idx_mac).where(_Mac.idx_zone == idx_zone)
+    rows = db.db_select(2036, statement)
+    for row in rows:
+        if bool(row.mac) is True:
+            result[row.mac.decode()] = row.idx_mac
+
+    # Return
+    return result
+
+
+def ips(idx_zone):
+    """Get the idx_ip values of the IP addresses of a zone.
+
+    Args:
+        idx_zone: Zone index
+
+    Returns:
+        result: Dict of idx_ip values keyed by IP address
+
+    """
+    # Initialize key variables
+    result = {}
+
+    # Get data
+    statement = select(_Ip.address, _Ip.idx_ip).where(_Ip.idx_zone == idx_zone)
+    rows = db.db_select(2037, statement)
+    for row in rows:
+        if bool(row.address) is True:
+            result[row.address.decode()] = row.idx_ip
+
+    # Return
+    return result
+
+
+def macips(idx_zone):
+    """Get the MAC to IP address pairs of a zone.
+
+    Args:
+        idx_zone: Zone index
+
+    Returns:
+        result: Dict of idx_macip values keyed by (idx_mac, idx_ip) tuples
+
+    """
+    # Get data
+    statement = select(_MacIp.idx_macip, _MacIp.idx_mac, _MacIp.idx_ip).where(
+        and_(_Mac.idx_zone == idx_zone, _Mac.idx_mac == _MacIp.idx_mac)
+    )
+    rows = db.db_select(2038, statement)
+
+    # Return
+    result = {(row.idx_mac, row.idx_ip): row.idx_macip for row in rows}
+    return result
+
+
+def macports(idx_zone):
+    """Get the interfaces on which the MAC addresses of a zone were found.
+
+    Args:
+        idx_zone: Zone index
+
+    Returns:
+        result: Dict of lists of idx_l1interface values keyed by idx_mac
+
+    """
+    # Initialize key variables
+    result = {}
+
+    # Get data
+    statement = select(_MacPort.idx_mac, _MacPort.idx_l1interface).where(
+        and_(_Mac.idx_zone == idx_zone, _Mac.idx_mac == _MacPort.idx_mac)
+    )
+    rows = db.db_select(2039, statement)
+    for row in rows:
+        result.setdefault(row.idx_mac, []).append(row.idx_l1interface)
+
+    # Return
+    return result
+
+
+def ipports(idx_zone):
+    """Get the interface to IP address pairs of a zone.
+
+    Args:
+        idx_zone: Zone index
+
+    Returns:
+        result: Dict of idx_ipport values keyed by (idx_l1interface, idx_ip)
+            tuples
+
+    """
+    # Get data
+    statement = select(
+        _IpPort.idx_ipport, _IpPort.idx_l1interface, _IpPort.idx_ip
+    ).where(and_(_Ip.idx_zone == idx_zone, _Ip.idx_ip == _IpPort.idx_ip))
+    rows = db.db_select(2040, statement)
+
+    # Return
+    result = {(row.idx_l1interface, row.idx_ip): row.idx_ipport for row in rows}
+    return result
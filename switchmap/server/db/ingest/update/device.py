@@ -7,6 +7,7 @@ from operator import attrgetter
 
 # Application imports
 from switchmap.core import log
+from switchmap.core import general
 from switchmap.server.db.ingest.query import device as _misc_device
 from switchmap.server.db.misc import interface as _historical
 from switchmap.server.db.table import device as _device
@@ -233,8 +234,21 @@ class Topology:
         # Initialize more key variables
         data = self._data
         interfaces = data.get("layer1")
-        historical = {_.ifname: _ for _ in _historical.interfaces(self._device)}
+        existing = {
+            _.ifindex: _
+            for _ in _l1interface.ifindexes(self._device.idx_device)
+        }
         rows = []
+        updates = []
+
+        # The interfaces already in the database are those of the previous
+        # ingest when its data is carried forward
+        if bool(existing) is True:
+            historical = {_.ifname: _ for _ in existing.values()}
+        else:
+            historical = {
+                _.ifname: _ for _ in _historical.interfaces(self._device)
+            }
 
         # Log
         self.log("L1Interface")
@@ -261,34 +275,39 @@ class Topology:
                     previous.ts_idle if bool(previous) else int(time.time())
                 )
 
-            # Add new row to the database table
-            rows.append(
-                IL1Interface(
-                    idx_device=self._device.idx_device,
-                    ifindex=ifindex,
-                    duplex=interface.get("l1_duplex"),
-                    ethernet=int(bool(interface.get("l1_ethernet"))),
-                    nativevlan=interface.get("l1_nativevlan"),
-                    trunk=int(bool(interface.get("l1_trunk"))),
-                    ifspeed=_ifspeed(interface),
-                    iftype=interface.get("ifType"),
-                    ifalias=interface.get("ifAlias"),
-                    ifname=ifname,
-                    ifdescr=interface.get("ifDescr"),
-                    ifadminstatus=interface.get("ifAdminStatus"),
-                    ifoperstatus=interface.get("ifOperStatus"),
-                    cdpcachedeviceid=interface.get("cdpCacheDeviceId"),
-                    cdpcachedeviceport=interface.get("cdpCacheDevicePort"),
-                    cdpcacheplatform=interface.get("cdpCachePlatform"),
-                    lldpremportdesc=interface.get("lldpRemPortDesc"),
-                    lldpremsyscapenabled=interface.get("lldpRemSysCapEnabled"),
-                    lldpremsysdesc=interface.get("lldpRemSysDesc"),
-                    lldpremsysname=interface.get("lldpRemSysName"),
-                    ts_idle=ts_idle,
-                    enabled=1,
-                )
+            # Create the row
+            row = IL1Interface(
+                idx_device=self._device.idx_device,
+                ifindex=ifindex,
+                duplex=interface.get("l1_duplex"),
+                ethernet=int(bool(interface.get("l1_ethernet"))),
+                nativevlan=interface.get("l1_nativevlan"),
+                trunk=int(bool(interface.get("l1_trunk"))),
+                ifspeed=_ifspeed(interface),
+                iftype=interface.get("ifType"),
+                ifalias=interface.get("ifAlias"),
+                ifname=ifname,
+                ifdescr=interface.get("ifDescr"),
+                ifadminstatus=interface.get("ifAdminStatus"),
+                ifoperstatus=interface.get("ifOperStatus"),
+                cdpcachedeviceid=interface.get("cdpCacheDeviceId"),
+                cdpcachedeviceport=interface.get("cdpCacheDevicePort"),
+                cdpcacheplatform=interface.get("cdpCachePlatform"),
+                lldpremportdesc=interface.get("lldpRemPortDesc"),
+                lldpremsyscapenabled=interface.get("lldpRemSysCapEnabled"),
+                lldpremsysdesc=interface.get("lldpRemSysDesc"),
+                lldpremsysname=interface.get("lldpRemSysName"),
+                ts_idle=ts_idle,
+                enabled=1,
             )
 
+            # Only write new and changed rows
+            current = existing.get(ifindex)
+            if bool(current) is False:
+                rows.append(row)
+            elif _modified(current, row) is True:
+                updates.append((current.idx_l1interface, row))
+
         # Insert rows
         if bool(rows):
             if bool(test) is False:
@@ -297,6 +316,19 @@ class Topology:
                 for row in sorted(rows, key=attrgetter("ifindex")):
                     _l1interface.insert_row(row)
 
+        # Update rows
+        for idx, row in updates:
+            _l1interface.update_row(idx, row)
+
+        # Delete the rows of interfaces the device no longer has
+        _l1interface.delete_row(
+            [
+                _.idx_l1interface
+                for ifindex, _ in existing.items()
+                if ifindex not in interfaces
+            ]
+        )
+
         # Log
         self.log("L1Interface", updated=True)
 
@@ -321,8 +353,10 @@ class Topology:
 
         # Initialize key variables
         interfaces = self._data.get("layer1")
+        existing = {_.vlan: _ for _ in _vlan.vlans(self._device.idx_device)}
         rows = []
         inserts = []
+        updates = []
 
         # Log
         self.log("Vlan")
@@ -338,13 +372,18 @@ class Topology:
                             idx_device=self._device.idx_device,
                             vlan=next_vlan,
                             name=None,
-                            state=0,
+                            state=None,
                             enabled=1,
                         )
                     )
 
-        # Remove duplicates
-        inserts = list(set(rows))
+        # Remove duplicates. Only write new and changed rows
+        for row in set(rows):
+            current = existing.get(row.vlan)
+            if bool(current) is False:
+                inserts.append(row)
+            elif _modified(current, row) is True:
+                updates.append((current.idx_vlan, row))
 
         # Insert if required
         if bool(inserts) is True:
@@ -356,6 +395,16 @@ class Topology:
                 ):
                     _vlan.insert_row(insert)
 
+        # Update rows
+        for idx, row in updates:
+            _vlan.update_row(idx, row)
+
+        # Delete the VLANs the device no longer has
+        vlans = set(_.vlan for _ in rows)
+        _vlan.delete_row(
+            [_.idx_vlan for vlan, _ in existing.items() if vlan not in vlans]
+        )
+
         # Log
         self.log("Vlan", updated=True)
 
@@ -383,6 +432,7 @@ class Topology:
         interfaces = self._data.get("layer1")
         lookup = _lookup(self._device.idx_device)
         inserts = []
+        found = set()
 
         # Log
         self.log("VlanPort")
@@ -419,12 +469,12 @@ class Topology:
                             )
 
                             # Verify that a VLAN / Port mapping exists
-                            vlanport_exists = db_vlanports.get(
-                                VlanInterface(
-                                    idx_l1interface=if_exists.idx_l1interface,
-                                    idx_vlan=vlan_exists.idx_vlan,
-                                )
+                            key = VlanInterface(
+                                idx_l1interface=if_exists.idx_l1interface,
+                                idx_vlan=vlan_exists.idx_vlan,
                             )
+                            vlanport_exists = db_vlanports.get(key)
+                            found.add(key)
 
                             # Update the VLAN / Port mapping
                             if bool(vlanport_exists) is False:
@@ -440,6 +490,15 @@ class Topology:
                 ):
                     _vlanport.insert_row(insert)
 
+        # Delete the VLAN / Port mappings the device no longer has
+        _vlanport.delete_row(
+            [
+                _.idx_vlanport
+                for key, _ in db_vlanports.items()
+                if key not in found
+            ]
+        )
+
         # Log
         self.log("VlanPort", updated=True)
 
@@ -466,12 +525,27 @@ class Topology:
         interfaces = self._data.get("layer1")
         lookup = _lookup(self._device.idx_device)
         inserts = []
+        found = set()
 
         # Log
         self.log("MacPort")
 
-        # Get all the existing ifindexes
+        # Get all the existing ifindexes and MacPorts
         db_ifindexes = {_.ifindex: _ for _ in lookup.ifindexes}
+        db_macports = {
+            (_.idx_l1interface, _.idx_mac): _
+            for _ in _misc_device.macports(self._device.idx_device)
+        }
+
+        # Get the idx_mac values of all the MACs found on the device at once
+        macs = set()
+        for interface in interfaces.values():
+            if bool(interface.get("l1_macs")) is True:
+                macs.update(interface.get("l1_macs"))
+        db_macs = {
+            _.mac: _.idx_mac
+            for _ in _mac.findmac(self._device.idx_zone, sorted(macs))
+        }
 
         # Process each interface
         for ifindex, interface in sorted(interfaces.items()):
@@ -492,14 +566,18 @@ class Topology:
                 # Iterate over the MACs found
                 for item in sorted(_macs):
                     # Ensure the MAC exists in the database
-                    mac_exists = _mac.exists(self._device.idx_zone, item)
+                    idx_mac = db_macs.get(general.mac(item).mac)
 
                     # If True update the port to MAC address mapping
-                    if bool(mac_exists) is True:
+                    if bool(idx_mac) is True:
+                        key = (if_exists.idx_l1interface, idx_mac)
+                        found.add(key)
+                        if key in db_macports:
+                            continue
                         inserts.append(
                             IMacPort(
                                 idx_l1interface=if_exists.idx_l1interface,
-                                idx_mac=mac_exists.idx_mac,
+                                idx_mac=idx_mac,
                                 enabled=1,
                             )
                         )
@@ -514,6 +592,15 @@ class Topology:
                 ):
                     _macport.insert_row(insert)
 
+        # Delete the port to MAC address mappings no longer found
+        _macport.delete_row(
+            [
+                _.idx_macport
+                for key, _ in db_macports.items()
+                if key not in found
+            ]
+        )
+
         # Log
         self.log("MacPort", updated=True)
 
@@ -562,6 +649,31 @@ after starting".format(
         log.log2debug(1029, log_message)
 
 
+def _modified(current, row):
+    """Determine whether a database row differs from its new values.
+
+    Args:
+        current: Database row tuple
+        row: Insert row tuple of the new values
+
+    Returns:
+        result: True if modified
+
+    """
+    # Initialize key variables
+    result = False
+
+    # Compare the values. BIT columns are read as bytes.
+    for field in row._fields:
+        value = getattr(current, field)
+        if isinstance(value, bytes) is True:
+            value = int.from_bytes(value, "big")
+        if value != getattr(row, field):
+            result = True
+            break
+    return result
+
+
 def _ifspeed(interface):
     """Get the speed of an interface.
 
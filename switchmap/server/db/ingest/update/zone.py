@@ -176,8 +176,6 @@ class Topology:
         # Initialize key variables
         all_macs = []
         unique_macs = []
-        unique_ouis = []
-        lookup = {}
         rows = []
 
         # Test validity
@@ -205,21 +203,14 @@ class Topology:
         for item in self._arp_table:
             all_macs.append(item.mac)
 
-        # Get macs and ouis
+        # Get macs
         unique_macs = list(set(_.lower() for _ in all_macs))
-        unique_ouis = list(set([_[:6].lower() for _ in unique_macs]))
-
-        # Process ouis
-        for item in sorted(unique_ouis):
-            if bool(lookup.get(item)) is False:
-                exists = _oui.exists(item)
-                lookup[item] = exists.idx_oui if bool(exists) is True else 1
 
         # Process macs
         for item in sorted(unique_macs):
             rows.append(
                 IMac(
-                    idx_oui=lookup.get(item[:6], 1),
+                    idx_oui=_oui.idx_oui(item),
                     idx_zone=self._idx_zone,
                     mac=item,
                     enabled=1,
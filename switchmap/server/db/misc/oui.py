@@ -10,11 +10,12 @@ from switchmap.server.db import SCOPED_SESSION
 from switchmap.server.db.models import Oui
 
 
-def update_db_oui(filepath):
+def update_db_oui(filepath, new=False):
     """Update the database with Oui data.
 
     Args:
         filepath: File to process
+        new: Insert the rows without checking for existing rows if True
 
     Returns:
         None
@@ -38,7 +39,7 @@ def update_db_oui(filepath):
         )
 
     # Insert rows into the database if it is empty
-    if row_count <= 1:
+    if row_count <= 1 or bool(new) is True:
         _oui.insert_row(rows)
 
     # Selectively update rows if the database is not empty
@@ -49,7 +50,7 @@ def update_db_oui(filepath):
 
             # Process insertions and updates
             if bool(exists) is False:
-                inserts.add(row)
+                inserts.append(row)
             else:
                 if exists.organization != row.organization:
                     _oui.update_row(exists.idx_oui, row)
@@ -215,6 +215,26 @@ def create(name=None):
     return result
 
 
+def current():
+    """Get the event of the most recently ingested data.
+
+    Args:
+        None
+
+    Returns:
+        result: REvent object. False if no data has been ingested
+
+    """
+    # Initialize key variables
+    result = False
+
+    # The root table points to the event being used
+    exists = root.idx_exists(1)
+    if bool(exists) is True and exists.idx_event != 1:
+        result = idx_exists(exists.idx_event)
+    return result
+
+
 def purge():
     """Purge all events except the most recent two.
 
@@ -156,29 +156,29 @@ def insert_row(rows):
     # Remove any duplicates
     rows = list(set(rows))
 
-    # Create objects
+    # Create the rows
     for row in rows:
         # Fix the MAC address
         ip = general.ipaddress(row.address)
 
         # Do the insertion
         inserts.append(
-            Ip(
+            dict(
                 idx_zone=row.idx_zone,
                 hostname=(
-                    null()
+                    None
                     if bool(row.hostname) is False
                     else row.hostname.encode()
                 ),
                 version=row.version,
-                address=(null() if bool(ip) is False else ip.address.encode()),
+                address=(None if bool(ip) is False else ip.address.encode()),
                 enabled=int(bool(row.enabled) is True),
             )
         )
 
     # Insert
     if bool(inserts):
-        db.db_add_all(1065, inserts)
+        db.db_insert_all(1065, Ip, inserts)
 
 
 def update_row(idx, row):
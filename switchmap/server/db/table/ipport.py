@@ -1,6 +1,6 @@
 """Module for querying the IpPort table."""
 
-from sqlalchemy import select, update, and_
+from sqlalchemy import select, update, delete, and_
 
 # Import project libraries
 from switchmap.server.db import db
@@ -108,10 +108,10 @@ def insert_row(rows):
     # Remove any duplicates
     rows = list(set(rows))
 
-    # Create objects
+    # Create the rows
     for row in rows:
         inserts.append(
-            IpPort(
+            dict(
                 idx_l1interface=row.idx_l1interface,
                 idx_ip=row.idx_ip,
                 enabled=int(bool(row.enabled) is True),
@@ -120,7 +120,7 @@ def insert_row(rows):
 
     # Insert
     if bool(inserts):
-        db.db_add_all(1063, inserts)
+        db.db_insert_all(1063, IpPort, inserts)
 
 
 def update_row(idx, row):
@@ -147,3 +147,23 @@ def update_row(idx, row):
         )
     )
     db.db_update(1070, statement)
+
+
+def delete_row(idxs):
+    """Delete IpPort table entries.
+
+    Args:
+        idxs: List of idx_ipport values
+
+    Returns:
+        None
+
+    """
+    # Create list
+    if isinstance(idxs, list) is False:
+        idxs = [idxs]
+
+    # Delete
+    if bool(idxs):
+        statement = delete(IpPort).where(IpPort.idx_ipport.in_(idxs))
+        db.db_delete(2045, statement)
@@ -1,6 +1,6 @@
 """Module for querying the L1Interface table."""
 
-from sqlalchemy import select, update, and_, null, func
+from sqlalchemy import select, update, delete, and_, null, func
 
 # Import project libraries
 from switchmap.server.db import db
@@ -149,66 +149,60 @@ def insert_row(rows):
     # Remove any duplicates
     rows = list(set(rows))
 
-    # Create objects
+    # Create the rows
     for row in rows:
         inserts.append(
-            L1Interface(
+            dict(
                 idx_device=row.idx_device,
                 ifindex=row.ifindex,
-                duplex=null() if row.duplex is None else row.duplex,
-                ethernet=null() if row.ethernet is None else row.ethernet,
-                nativevlan=(
-                    null() if row.nativevlan is None else row.nativevlan
-                ),
-                trunk=null() if row.trunk is None else row.trunk,
-                iftype=null() if row.iftype is None else row.iftype,
-                ifspeed=null() if row.ifspeed is None else row.ifspeed,
-                ifalias=(
-                    null() if row.ifalias is None else row.ifalias.encode()
-                ),
-                ifname=(null() if row.ifname is None else row.ifname.encode()),
-                ifdescr=(
-                    null() if row.ifdescr is None else row.ifdescr.encode()
-                ),
+                duplex=None if row.duplex is None else row.duplex,
+                ethernet=None if row.ethernet is None else row.ethernet,
+                nativevlan=(None if row.nativevlan is None else row.nativevlan),
+                trunk=None if row.trunk is None else row.trunk,
+                iftype=None if row.iftype is None else row.iftype,
+                ifspeed=None if row.ifspeed is None else row.ifspeed,
+                ifalias=(None if row.ifalias is None else row.ifalias.encode()),
+                ifname=(None if row.ifname is None else row.ifname.encode()),
+                ifdescr=(None if row.ifdescr is None else row.ifdescr.encode()),
                 ifadminstatus=(
-                    null() if row.ifadminstatus is None else row.ifadminstatus
+                    None if row.ifadminstatus is None else row.ifadminstatus
                 ),
                 ifoperstatus=(
-                    null() if row.ifoperstatus is None else row.ifoperstatus
+                    None if row.ifoperstatus is None else row.ifoperstatus
                 ),
                 ts_idle=0 if not bool(row.ts_idle) else row.ts_idle,
                 cdpcachedeviceid=(
-                    null()
+                    None
                     if row.cdpcachedeviceid is None
                     else row.cdpcachedeviceid.encode()
                 ),
                 cdpcachedeviceport=(
-                    null()
+                    None
                     if row.cdpcachedeviceport is None
                     else row.cdpcachedeviceport.encode()
                 ),
                 cdpcacheplatform=(
-                    null()
+                    None
                     if row.cdpcacheplatform is None
                     else row.cdpcacheplatform.encode()
                 ),
                 lldpremportdesc=(
-                    null()
+                    None
                     if row.lldpremportdesc is None
                     else row.lldpremportdesc.encode()
                 ),
                 lldpremsyscapenabled=(
-                    null()
+                    None
                     if row.lldpremsyscapenabled is None
                     else row.lldpremsyscapenabled.encode()
                 ),
                 lldpremsysdesc=(
-                    null()
+                    None
                     if row.lldpremsysdesc is None
                     else row.lldpremsysdesc.encode()
                 ),
                 lldpremsysname=(
-                    null()
+                    None
                     if row.lldpremsysname is None
                     else row.lldpremsysname.encode()
                 ),
@@ -218,7 +212,7 @@ def insert_row(rows):
 
     # Insert
     if bool(inserts):
-        db.db_add_all(1154, inserts)
+        db.db_insert_all(1154, L1Interface, inserts)
 
 
 def update_row(idx, row):
@@ -304,3 +298,25 @@ def update_row(idx, row):
         )
     )
     db.db_update(1112, statement)
+
+
+def delete_row(idxs):
+    """Delete L1Interface table entries.
+
+    Args:
+        idxs: List of idx_l1interface values
+
+    Returns:
+        None
+
+    """
+    # Create list
+    if isinstance(idxs, list) is False:
+        idxs = [idxs]
+
+    # Delete
+    if bool(idxs):
+        statement = delete(L1Interface).where(
+            L1Interface.idx_l1interface.in_(idxs)
+        )
+        db.db_delete(2030, statement)
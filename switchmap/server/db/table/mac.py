@@ -131,7 +131,7 @@ def insert_row(rows):
     # Remove any duplicates
     rows = list(set(rows))
 
-    # Create objects
+    # Create the rows
     for row in rows:
         # Fix the MAC address
         mactest = general.mac(row.mac)
@@ -147,17 +147,17 @@ def insert_row(rows):
 
         # Do the insertion
         inserts.append(
-            Mac(
+            dict(
                 idx_oui=idx_oui,
                 idx_zone=row.idx_zone,
-                mac=(null() if bool(mac) is False else mac.encode()),
+                mac=(None if bool(mac) is False else mac.encode()),
                 enabled=int(bool(row.enabled) is True),
             )
         )
 
     # Insert
     if bool(inserts):
-        db.db_add_all(1087, inserts)
+        db.db_insert_all(1087, Mac, inserts)
 
 
 def update_row(idx, row):
@@ -1,6 +1,6 @@
 """Module for querying the MacIp table."""
 
-from sqlalchemy import select, update, and_
+from sqlalchemy import select, update, delete, and_
 
 # Import project libraries
 from switchmap.server.db import db
@@ -151,10 +151,10 @@ def insert_row(rows):
     # Remove any duplicates
     rows = list(set(rows))
 
-    # Create objects
+    # Create the rows
     for row in rows:
         inserts.append(
-            MacIp(
+            dict(
                 idx_ip=row.idx_ip,
                 idx_mac=row.idx_mac,
                 enabled=int(bool(row.enabled) is True),
@@ -163,7 +163,7 @@ def insert_row(rows):
 
     # Insert
     if bool(inserts):
-        db.db_add_all(1091, inserts)
+        db.db_insert_all(1091, MacIp, inserts)
 
 
 def update_row(idx, row):
@@ -190,3 +190,23 @@ def update_row(idx, row):
         )
     )
     db.db_update(1115, statement)
+
+
+def delete_row(idxs):
+    """Delete MacIp table entries.
+
+    Args:
+        idxs: List of idx_macip values
+
+    Returns:
+        None
+
+    """
+    # Create list
+    if isinstance(idxs, list) is False:
+        idxs = [idxs]
+
+    # Delete
+    if bool(idxs):
+        statement = delete(MacIp).where(MacIp.idx_macip.in_(idxs))
+        db.db_delete(2044, statement)
@@ -1,6 +1,6 @@
 """Module for querying the MacPort table."""
 
-from sqlalchemy import select, update, and_
+from sqlalchemy import select, update, delete, and_
 
 # Import project libraries
 from switchmap.server.db import db
@@ -108,10 +108,10 @@ def insert_row(rows):
     # Remove any duplicates
     rows = list(set(rows))
 
-    # Create objects
+    # Create the rows
     for row in rows:
         inserts.append(
-            MacPort(
+            dict(
                 idx_l1interface=row.idx_l1interface,
                 idx_mac=row.idx_mac,
                 enabled=int(bool(row.enabled) is True),
@@ -120,7 +120,7 @@ def insert_row(rows):
 
     # Insert
     if bool(inserts):
-        db.db_add_all(1092, inserts)
+        db.db_insert_all(1092, MacPort, inserts)
 
 
 def update_row(idx, row):
@@ -147,3 +147,23 @@ def update_row(idx, row):
         )
     )
     db.db_update(1117, statement)
+
+
+def delete_row(idxs):
+    """Delete MacPort table entries.
+
+    Args:
+        idxs: List of idx_macport values
+
+    Returns:
+        None
+
+    """
+    # Create list
+    if isinstance(idxs, list) is False:
+        idxs = [idxs]
+
+    # Delete
+    if bool(idxs):
+        statement = delete(MacPort).where(MacPort.idx_macport.in_(idxs))
+        db.db_delete(2033, statement)
@@ -1,12 +1,19 @@
 """Module for querying the Oui table."""
 
-from sqlalchemy import select, update, null
+from sqlalchemy import select, update, null, func
 
 # Import project libraries
 from switchmap.server.db import db
 from switchmap.server.db.models import Oui
 from switchmap.server.db.misc import rows as _rows
 
+# Read only idx_oui values keyed by OUI, shared by the process
+LOOKUP = {}
+
+# Number of rows and last modification time of the Oui table when LOOKUP
+# was loaded
+_VERSION = None
+
 
 def idx_oui(mac):
     """Get the idx_oui value.
@@ -23,11 +30,103 @@ def idx_oui(mac):
 
     # Find the true idx_oui
     if bool(mac) is True:
-        statement = select(Oui.idx_oui).where(Oui.oui == mac[:6].encode())
-        items = db.db_select(1177, statement)
-        for item in items:
-            result = item.idx_oui
-            break
+        result = lookup().get(mac[:6], 1)
+    return result
+
+
+def lookup():
+    """Get the idx_oui values of all the OUIs.
+
+    The values are read from the database only once, the first time they
+    are needed after the Oui table is updated.
+
+    Args:
+        None
+
+    Returns:
+        result: Dict of idx_oui values keyed by OUI
+
+    """
+    # Initialize key variables
+    global LOOKUP
+    global _VERSION
+
+    # Load the OUIs
+    if _VERSION is None:
+        version = _version()
+        items = {}
+        statement = select(Oui.oui, Oui.idx_oui)
+        rows = db.db_select(1177, statement)
+        for row in rows:
+            if bool(row.oui) is True:
+                items[row.oui.decode()] = row.idx_oui
+        LOOKUP = items
+        _VERSION = version
+
+    # Return
+    result = LOOKUP
+    return result
+
+
+def refresh():
+    """Invalidate the OUI lookup if the Oui table changed since it was loaded.
+
+    This allows long running processes to detect the updates of other
+    processes.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+    # Invalidate
+    if _VERSION is not None and _version() != _VERSION:
+        invalidate()
+
+
+def invalidate():
+    """Invalidate the OUI lookup.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+    # Initialize key variables
+    global LOOKUP
+    global _VERSION
+
+    # Invalidate
+    LOOKUP = {}
+    _VERSION = None
+
+
+def _version():
+    """Get the number of rows and last modification time of the Oui table.
+
+    Args:
+        None
+
+    Returns:
+        result: Tuple of the number of rows and last modification time
+
+    """
+    # Initialize key variables
+    result = None
+
+    # Get data
+    statement = select(
+        func.count(Oui.idx_oui).label("count"),
+        func.max(Oui.ts_modified).label("ts_modified"),
+    )
+    rows = db.db_select(2042, statement)
+    for row in rows:
+        result = (row.count, row.ts_modified)
+        break
     return result
 
 
@@ -101,13 +200,13 @@ def insert_row(rows):
     # Remove any duplicates
     rows = list(set(rows))
 
-    # Create objects
+    # Create the rows
     for row in rows:
         inserts.append(
-            Oui(
-                oui=(null() if bool(row.oui) is False else row.oui.encode()),
+            dict(
+                oui=(None if bool(row.oui) is False else row.oui.encode()),
                 organization=(
-                    null()
+                    None
                     if bool(row.organization) is False
                     else row.organization.encode()
                 ),
@@ -117,7 +216,8 @@ def insert_row(rows):
 
     # Insert
     if bool(inserts):
-        db.db_add_all(1096, inserts)
+        db.db_insert_all(1096, Oui, inserts)
+        invalidate()
 
 
 def update_row(idx, row):
@@ -148,6 +248,7 @@ def update_row(idx, row):
         )
     )
     db.db_update(1118, statement)
+    invalidate()
 
 
 def ouis():
@@ -1,6 +1,6 @@
 """Module for querying the Vlan table."""
 
-from sqlalchemy import select, update, null, and_
+from sqlalchemy import select, update, delete, null, and_
 
 # Import project libraries
 from switchmap.server.db import db
@@ -105,21 +105,21 @@ def insert_row(rows):
     # Remove any duplicates
     rows = list(set(rows))
 
-    # Create objects
+    # Create the rows
     for row in rows:
         inserts.append(
-            Vlan(
+            dict(
                 idx_device=row.idx_device,
-                vlan=null() if row.vlan is None else row.vlan,
-                name=null() if bool(row.name) is False else row.name.encode(),
-                state=null() if bool(row.state) is False else row.state,
+                vlan=None if row.vlan is None else row.vlan,
+                name=None if bool(row.name) is False else row.name.encode(),
+                state=None if bool(row.state) is False else row.state,
                 enabled=int(bool(row.enabled) is True),
             )
         )
 
     # Insert
     if bool(inserts):
-        db.db_add_all(1093, inserts)
+        db.db_insert_all(1093, Vlan, inserts)
 
 
 def update_row(idx, row):
@@ -150,3 +150,23 @@ def update_row(idx, row):
         )
     )
     db.db_update(1120, statement)
+
+
+def delete_row(idxs):
+    """Delete Vlan table entries.
+
+    Args:
+        idxs: List of idx_vlan values
+
+    Returns:
+        None
+
+    """
+    # Create list
+    if isinstance(idxs, list) is False:
+        idxs = [idxs]
+
+    # Delete
+    if bool(idxs):
+        statement = delete(Vlan).where(Vlan.idx_vlan.in_(idxs))
+        db.db_delete(2031, statement)
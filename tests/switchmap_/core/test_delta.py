@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""Test the delta module."""
+
+import unittest
+import os
+import sys
+import tempfile
+from unittest.mock import patch
+
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(os.path.join(EXEC_DIR, os.pardir)), os.pardir
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}core".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+from switchmap.core import delta as testimport
+
+# Data similar to that posted by pollers
+_DATA = {
+    "misc": {"host": "switch.example.org", "zone": "SITE-A", "timestamp": 1},
+    "layer1": {
+        ifindex: {
+            "ifAlias": "Port {}".format(ifindex),
+            "ifOperStatus": 1,
+            "l1_macs": ["00:11:22:33:44:{:02x}".format(ifindex)],
+        }
+        for ifindex in range(1, 49)
+    },
+    "layer3": {"ipNetToMediaTable": {"10.0.0.1": "00:11:22:33:44:01"}},
+}
+
+
+class TestFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def test_filename(self):
+        """Testing function filename."""
+        # Test
+        result = testimport.filename("switch.example.org", "SITE-A")
+        self.assertEqual(
+            result,
+            "switch.example.org-{}".format(
+                testimport.hashlib.md5(b"SITE-A").hexdigest()[:5]
+            ),
+        )
+
+    def test_canonical(self):
+        """Testing function canonical."""
+        # Test
+        result = testimport.canonical({1: {2: (3, {4: None})}, "a": "b"})
+        self.assertEqual(result, {"1": {"2": [3, {"4": None}]}, "a": "b"})
+
+    def test_version(self):
+        """Testing function version."""
+        # The version doesn't depend on the order or type of the keys
+        data = testimport.canonical(_DATA)
+        reverse = testimport.canonical(dict(reversed(list(_DATA.items()))))
+        self.assertEqual(testimport.version(data), testimport.version(reverse))
+        self.assertEqual(len(testimport.version(data)), 64)
+
+        # Any change changes the version
+        changed = testimport.canonical(_DATA)
+        changed["layer1"]["5"]["ifOperStatus"] = 2
+        self.assertNotEqual(
+            testimport.version(data), testimport.version(changed)
+        )
+
+    def test_diff(self):
+        """Testing function diff."""
+        # Initialize key variables
+        old = testimport.canonical(_DATA)
+        new = testimport.canonical(_DATA)
+        new["misc"]["timestamp"] = 2
+        new["layer1"]["3"]["l1_macs"].append("00:11:22:33:44:ff")
+        new["layer1"]["49"] = {"ifAlias": "New", "ifOperStatus": 2}
+        del new["layer1"]["7"]
+        del new["layer3"]["ipNetToMediaTable"]["10.0.0.1"]
+
+        # Test
+        result = testimport.diff(old, new)
+        self.assertEqual(
+            result,
+            {
+                "set": [
+                    [["misc", "timestamp"], 2],
+                    [
+                        ["layer1", "3", "l1_macs"],
+                        ["00:11:22:33:44:03", "00:11:22:33:44:ff"],
+                    ],
+                    [["layer1", "49"], {"ifAlias": "New", "ifOperStatus": 2}],
+                ],
+                "delete": [
+                    ["layer1", "7"],
+                    ["layer3", "ipNetToMediaTable", "10.0.0.1"],
+                ],
+            },
+        )
+
+        # There are no changes between identical data
+        self.assertEqual(
+            testimport.diff(old, testimport.canonical(_DATA)),
+            {"set": [], "delete": []},
+        )
+
+    def test_apply(self):
+        """Testing function apply."""
+        # Initialize key variables
+        old = testimport.canonical(_DATA)
+        new = testimport.canonical(_DATA)
+        new["layer1"]["1"]["ifAlias"] = "Changed"
+        new["layer1"]["50"] = {}
+        del new["layer3"]
+        changes = testimport.diff(old, new)
+
+        # Test
+        result = testimport.apply(old, changes)
+        self.assertEqual(result, new)
+        self.assertEqual(testimport.version(result), testimport.version(new))
+
+        # The base isn't changed
+        self.assertEqual(old, testimport.canonical(_DATA))
+
+        # Data replaced as a whole
+        self.assertEqual(testimport.apply(old, {"set": [[[], new]]}), new)
+
+        # Changes that don't match the base
+        self.assertIsNone(testimport.apply(old, {"delete": [["layer2", "1"]]}))
+        self.assertIsNone(
+            testimport.apply(
+                old, {"set": [[["misc", "host", "name"], "value"]]}
+            )
+        )
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
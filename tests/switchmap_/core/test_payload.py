@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""Test the payload module."""
+
+import unittest
+import os
+import sys
+import tempfile
+from unittest.mock import patch
+
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(os.path.join(EXEC_DIR, os.pardir)), os.pardir
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}core".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+from switchmap.core import payload as testimport
+
+# Data similar to that posted by pollers
+_DATA = {
+    "misc": {"host": "switch.example.org", "zone": "SITE-A"},
+    "layer1": {
+        ifindex: {
+            "ifAlias": "Port {}".format(ifindex),
+            "ifOperStatus": 1,
+            "cdp": None,
+            "l1_macs": ["00:11:22:33:44:{:02x}".format(ifindex)],
+        }
+        for ifindex in range(1, 49)
+    },
+}
+
+
+class TestFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def test_encode(self):
+        """Testing function encode."""
+        # Test
+        body, headers = testimport.encode(_DATA)
+        self.assertEqual(
+            testimport.decode(
+                body, headers["Content-Type"], headers["Content-Encoding"]
+            ),
+            _DATA,
+        )
+
+        # The payload is much smaller than JSON
+        self.assertLess(
+            len(body) * 5, len(testimport.json.dumps(_DATA).encode())
+        )
+
+    def test_encode_fallback(self):
+        """Testing function encode without the optional packages."""
+        # Test
+        with patch.object(testimport, "msgpack", None), patch.object(
+            testimport, "zstandard", None
+        ):
+            body, headers = testimport.encode(_DATA)
+            self.assertEqual(
+                headers,
+                {
+                    "Content-Type": testimport.JSON,
+                    "Content-Encoding": testimport.GZIP,
+                },
+            )
+            result = testimport.decode(
+                body, headers["Content-Type"], headers["Content-Encoding"]
+            )
+
+        # JSON only supports string keys
+        self.assertEqual(result["layer1"]["1"], _DATA["layer1"][1])
+
+    def test_decode(self):
+        """Testing function decode."""
+        # Test
+        body = testimport.json.dumps({"a": 1}).encode()
+        self.assertEqual(testimport.decode(body), {"a": 1})
+        self.assertEqual(
+            testimport.decode(
+                testimport.gzip.compress(body),
+                testimport.JSON,
+                testimport.GZIP,
+            ),
+            {"a": 1},
+        )
+
+    def test_decode_max_size(self):
+        """Testing function decode with a maximum size."""
+        # Initialize key variables
+        body = testimport.json.dumps({"a": "x" * 1000}).encode()
+        size = len(body)
+        bodies = {
+            None: body,
+            testimport.GZIP: testimport.gzip.compress(body),
+        }
+        if testimport.zstandard is not None:
+            bodies[
+                testimport.ZSTD
+            ] = testimport.zstandard.ZstdCompressor().compress(body)
+
+        # Data no larger than the limit is decoded
+        for content_encoding, value in bodies.items():
+            self.assertEqual(
+                testimport.decode(
+                    value, testimport.JSON, content_encoding, max_size=size
+                ),
+                {"a": "x" * 1000},
+            )
+
+        # Larger data is rejected, even when compressed below the limit
+        self.assertLess(len(bodies[testimport.GZIP]), size - 1)
+        for content_encoding, value in bodies.items():
+            with self.assertRaises(testimport.PayloadTooLarge):
+                testimport.decode(
+                    value, testimport.JSON, content_encoding, max_size=size - 1
+                )
+
+        # Zstandard frames without a content size are decoded
+        if testimport.zstandard is not None:
+            compressor = testimport.zstandard.ZstdCompressor().compressobj()
+            value = compressor.compress(body) + compressor.flush()
+            self.assertEqual(testimport.zstandard.frame_content_size(value), -1)
+            self.assertEqual(
+                testimport.decode(
+                    value, testimport.JSON, testimport.ZSTD, max_size=size
+                ),
+                {"a": "x" * 1000},
+            )
+
+    def test_supported(self):
+        """Testing function supported."""
+        # Test
+        self.assertTrue(testimport.supported())
+        self.assertTrue(testimport.supported(testimport.JSON, "gzip"))
+        self.assertFalse(testimport.supported("text/plain"))
+        self.assertFalse(testimport.supported(testimport.JSON, "br"))
+        with patch.object(testimport, "zstandard", None):
+            self.assertFalse(testimport.supported(testimport.JSON, "zstd"))
+        with patch.object(testimport, "msgpack", None):
+            self.assertFalse(testimport.supported(testimport.MSGPACK))
+
+    def test_dump(self):
+        """Testing function dump."""
+        # Initialize key variables
+        directory = tempfile.mkdtemp()
+        filepath = os.path.join(directory, "test.payload")
+
+        # Test
+        testimport.dump(_DATA, filepath)
+        self.assertEqual(os.listdir(directory), ["test.payload"])
+        self.assertEqual(testimport.load(filepath), _DATA)
+
+    def test_load(self):
+        """Testing function load."""
+        # Initialize key variables
+        directory = tempfile.mkdtemp()
+        filepath = os.path.join(directory, "test.payload")
+
+        # Files written without the optional packages can be read
+        with patch.object(testimport, "msgpack", None), patch.object(
+            testimport, "zstandard", None
+        ):
+            testimport.dump({"a": [1, 2]}, filepath)
+        self.assertEqual(testimport.load(filepath), {"a": [1, 2]})
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Test the rest module."""
+
+import unittest
+import os
+import sys
+from unittest.mock import patch
+
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(os.path.join(EXEC_DIR, os.pardir)), os.pardir
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}core".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+from switchmap.core import rest as testimport
+from switchmap.poller.configuration import ConfigPoller
+
+
+class TestFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def test_post(self):
+        """Testing function post."""
+        pass
+
+    def test_get(self):
+        """Testing function get."""
+        pass
+
+    def test_get_graphql(self):
+        """Testing function get_graphql."""
+        pass
+
+    def test__session(self):
+        """Testing function _session."""
+        # Initialize key variables
+        config = ConfigPoller()
+        testimport._SESSIONS.clear()
+
+        # The session is reused by the process
+        session = testimport._session(config)
+        self.assertIs(testimport._session(config), session)
+        adapter = session.get_adapter("http://localhost")
+        self.assertEqual(adapter._pool_maxsize, config.server_pool_size())
+        self.assertIs(session.get_adapter("https://localhost"), adapter)
+
+        # Forked processes create their own session
+        with patch.object(
+            testimport.os, "getpid", return_value=os.getpid() + 1
+        ):
+            forked = testimport._session(config)
+            self.assertIsNot(forked, session)
+            self.assertIs(testimport._session(config), forked)
+        self.assertEqual(len(testimport._SESSIONS), 1)
+        testimport._SESSIONS.clear()
+
+    def test__clean_url(self):
+        """Testing function _clean_url."""
+        # Test
+        self.assertEqual(
+            testimport._clean_url("http://localhost:7000//switchmap//api"),
+            "http://localhost:7000/switchmap/api",
+        )
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
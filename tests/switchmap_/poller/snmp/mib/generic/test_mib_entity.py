@@ -2,6 +2,7 @@
 """Test the mib_entity module."""
 
 import unittest
+from unittest.mock import patch
 import os
 import sys
 
@@ -60,6 +61,8 @@ CONFIG = setup.config()
 CONFIG.save()
 
 # Import other required libraries
+from switchmap.poller.snmp.mib.generic import mib_entity as testimport
+from tests.testlib_ import snmp
 
 
 class Query:
@@ -184,7 +187,31 @@ class TestMibEntity(unittest.TestCase):
 
     def test_system(self):
         """Testing function system."""
-        pass
+        # Initialize key variables
+        values = {}
+        for column in [2, 5, 7, 8, 9, 10, 11, 13]:
+            for index in range(1, 61):
+                oid = ".1.3.6.1.2.1.47.1.1.1.1.{}.{}".format(column, index)
+                if column == 5:
+                    values[oid] = [str(index % 12 + 1), "INTEGER"]
+                elif column == 11 and bool(index % 3) is True:
+                    values[oid] = ["", "OCTETSTR"]
+                else:
+                    values[oid] = ["{}-{}".format(column, index), "OCTETSTR"]
+
+        # Get results walking each column
+        interact, agent = snmp.interact(values)
+        with patch.object(interact, "table"):
+            expected = testimport.init_query(interact).system()
+        walks = agent.requests
+
+        # Get results walking the columns together. Only the entries with
+        # serial numbers are returned
+        interact, agent = snmp.interact(values)
+        results = testimport.init_query(interact).system()
+        self.assertEqual(len(results["ENTITY-MIB"]["entPhysicalSerialNum"]), 20)
+        self.assertEqual(results, expected)
+        self.assertLess(agent.requests, walks)
 
     def test_entphysicaldescr(self):
         """Testing function entphysicaldescr."""
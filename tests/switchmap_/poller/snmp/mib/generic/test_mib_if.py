@@ -5,6 +5,7 @@ import os
 import sys
 import binascii
 import unittest
+from unittest.mock import patch
 from mock import Mock
 
 # Try to create a working PYTHONPATH
@@ -63,6 +64,7 @@ CONFIG.save()
 
 # Import other required libraries
 from switchmap.poller.snmp.mib.generic import mib_if as testimport
+from tests.testlib_ import snmp
 
 
 class Query:
@@ -285,9 +287,46 @@ class TestMibIf(unittest.TestCase):
 
     def test_layer1(self):
         """Testing function layer1."""
-        # Layer 1 testing only seems to work when all the methods return
-        # the same type of results (eg. int, string, hex)
-        pass
+        # Initialize key variables
+        values = {}
+        columns = {
+            ".1.3.6.1.2.1.2.2.1.1": "INTEGER",
+            ".1.3.6.1.2.1.2.2.1.2": "OCTETSTR",
+            ".1.3.6.1.2.1.2.2.1.3": "INTEGER",
+            ".1.3.6.1.2.1.2.2.1.5": "GAUGE",
+            ".1.3.6.1.2.1.2.2.1.6": "OCTETSTR",
+            ".1.3.6.1.2.1.2.2.1.7": "INTEGER",
+            ".1.3.6.1.2.1.2.2.1.8": "INTEGER",
+            ".1.3.6.1.2.1.2.2.1.9": "TICKS",
+            ".1.3.6.1.2.1.2.2.1.10": "COUNTER",
+            ".1.3.6.1.2.1.2.2.1.16": "COUNTER",
+            ".1.3.6.1.2.1.31.1.1.1.1": "OCTETSTR",
+            ".1.3.6.1.2.1.31.1.1.1.2": "COUNTER",
+            ".1.3.6.1.2.1.31.1.1.1.3": "COUNTER",
+            ".1.3.6.1.2.1.31.1.1.1.4": "COUNTER",
+            ".1.3.6.1.2.1.31.1.1.1.5": "COUNTER",
+            ".1.3.6.1.2.1.31.1.1.1.18": "OCTETSTR",
+        }
+        for column, snmp_type in columns.items():
+            for ifindex in range(1, 61):
+                if snmp_type == "OCTETSTR":
+                    value = "{}{}".format(column[-2:], ifindex)
+                else:
+                    value = str(ifindex * 1000 + len(column))
+                values["{}.{}".format(column, ifindex)] = [value, snmp_type]
+
+        # Get results walking each column
+        interact, agent = snmp.interact(values)
+        with patch.object(interact, "table"):
+            expected = testimport.init_query(interact).layer1()
+        walks = agent.requests
+
+        # Get results walking the columns together
+        interact, agent = snmp.interact(values)
+        results = testimport.init_query(interact).layer1()
+        self.assertEqual(len(results), 60)
+        self.assertEqual(results, expected)
+        self.assertLess(agent.requests, walks)
 
     def test_iflastchange(self):
         """Testing function iflastchange."""
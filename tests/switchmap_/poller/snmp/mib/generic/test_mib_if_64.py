@@ -4,6 +4,7 @@
 import os
 import sys
 import unittest
+from unittest.mock import patch
 from mock import Mock
 
 # Try to create a working PYTHONPATH
@@ -62,6 +63,7 @@ CONFIG.save()
 
 # Import other required libraries
 from switchmap.poller.snmp.mib.generic import mib_if_64 as testimport
+from tests.testlib_ import snmp
 
 
 class Query:
@@ -234,8 +236,9 @@ class TestMibIf64(unittest.TestCase):
     def test_layer1(self):
         """Testing method / function layer1."""
         # Get results
-        testobj = testimport.init_query(self.snmpobj_integer)
-        results = testobj.layer1()
+        with patch.object(testimport.If64Query, "walk_table"):
+            testobj = testimport.init_query(self.snmpobj_integer)
+            results = testobj.layer1()
 
         # Basic testing of results
         for primary in results.keys():
@@ -245,6 +248,37 @@ class TestMibIf64(unittest.TestCase):
                     self.expected_dict[primary][secondary],
                 )
 
+        # Initialize key variables
+        values = {}
+        columns = {
+            ".1.3.6.1.2.1.31.1.1.1.6": "COUNTER64",
+            ".1.3.6.1.2.1.31.1.1.1.7": "COUNTER64",
+            ".1.3.6.1.2.1.31.1.1.1.8": "COUNTER64",
+            ".1.3.6.1.2.1.31.1.1.1.9": "COUNTER64",
+            ".1.3.6.1.2.1.31.1.1.1.10": "COUNTER64",
+            ".1.3.6.1.2.1.31.1.1.1.11": "COUNTER64",
+            ".1.3.6.1.2.1.31.1.1.1.12": "COUNTER64",
+            ".1.3.6.1.2.1.31.1.1.1.13": "COUNTER64",
+            ".1.3.6.1.2.1.31.1.1.1.15": "GAUGE",
+        }
+        for column, snmp_type in columns.items():
+            for ifindex in range(1, 61):
+                value = str(ifindex * 1000 + int(column.split(".")[-1]))
+                values["{}.{}".format(column, ifindex)] = [value, snmp_type]
+
+        # Get results walking each column
+        interact, agent = snmp.interact(values)
+        with patch.object(interact, "table"):
+            expected = testimport.init_query(interact).layer1()
+        walks = agent.requests
+
+        # Get results walking the columns together
+        interact, agent = snmp.interact(values)
+        results = testimport.init_query(interact).layer1()
+        self.assertEqual(len(results), 60)
+        self.assertEqual(results, expected)
+        self.assertLess(agent.requests, walks)
+
     def test_ifhighspeed(self):
         """Testing method / function ifhighspeed."""
         # Initialize key variables
@@ -2,6 +2,7 @@
 """Test the mib_lldp module."""
 
 import unittest
+from unittest.mock import patch
 import os
 import sys
 from mock import Mock
@@ -63,6 +64,7 @@ CONFIG.save()
 
 # Import other required libraries
 from switchmap.poller.snmp.mib.generic import mib_lldp as testimport
+from tests.testlib_ import snmp
 
 
 class Query:
@@ -287,8 +289,29 @@ class TestMibLldp(unittest.TestCase):
 
     def test_layer1(self):
         """Testing method / function layer1."""
-        # Don't know how to test this.
-        return
+        # Initialize key variables
+        values = {}
+        for column in [8, 9, 10, 12]:
+            for port in range(1, 61):
+                oid = ".1.0.8802.1.1.2.1.4.1.1.{}.0.{}.1".format(column, port)
+                if column == 12:
+                    values[oid] = ["(\x00", "OCTETSTR"]
+                else:
+                    values[oid] = ["{}-{}".format(column, port), "OCTETSTR"]
+
+        # Get results walking each column
+        interact, agent = snmp.interact(values)
+        with patch.object(interact, "table"):
+            expected = testimport.init_query(interact).layer1()
+        walks = agent.requests
+
+        # Get results walking the columns together
+        interact, agent = snmp.interact(values)
+        results = testimport.init_query(interact).layer1()
+        self.assertEqual(len(results), 60)
+        self.assertEqual(results[1]["lldpRemSysCapEnabled"], "0010100000000000")
+        self.assertEqual(results, expected)
+        self.assertLess(agent.requests, walks)
 
     def test_lldpremsysname(self):
         """Testing method / function lldpremsysname."""
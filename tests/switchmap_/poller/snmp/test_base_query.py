@@ -2,6 +2,7 @@
 """Test the base_query module."""
 
 import unittest
+from unittest.mock import Mock
 import os
 import sys
 
@@ -46,6 +47,7 @@ CONFIG = setup.config()
 CONFIG.save()
 
 # Import other required libraries
+from switchmap.poller.snmp.base_query import Query as testimport
 
 
 class TestSNMPBaseQuery(unittest.TestCase):
@@ -83,6 +85,34 @@ class TestSNMPBaseQuery(unittest.TestCase):
         """Testing function supported."""
         pass
 
+    def test_walk_table(self):
+        """Testing function walk_table."""
+        # Initialize key variables
+        oids = [".1.3.6.1.2.1.2.2.1.2", ".1.3.6.1.2.1.2.2.1.5"]
+        snmp_object = Mock()
+
+        # The columns are walked together by the SNMP object
+        query = testimport(snmp_object, oids[0], tags=["layer1"])
+        self.assertIsNone(query.walk_table(oids))
+        snmp_object.table.assert_called_once_with(oids)
+        snmp_object.swalk.assert_not_called()
+
+    def test_swalk_contexts(self):
+        """Testing function swalk_contexts."""
+        # Initialize key variables
+        oid = ".1.3.6.1.2.1.17.4.3.1.2"
+        contexts = ["", "vlan-10", "vlan-20"]
+        expected = [{"1": 1}, {"2": 2}, {"3": 3}]
+
+        # Use the concurrent walks of the SNMP object
+        snmp_object = Mock()
+        snmp_object.swalk_contexts.return_value = expected
+        query = testimport(snmp_object, oid, tags=["layer1"])
+        self.assertEqual(query.swalk_contexts(oid, contexts), expected)
+        snmp_object.swalk_contexts.assert_called_once_with(
+            oid, contexts, normalized=False
+        )
+
 
 if __name__ == "__main__":
     # Do the unit test
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""Test the capabilities module."""
+
+import unittest
+import os
+import sys
+import tempfile
+import time
+from unittest.mock import Mock, patch
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(
+                    os.path.join(
+                        os.path.abspath(os.path.join(EXEC_DIR, os.pardir)),
+                        os.pardir,
+                    )
+                ),
+                os.pardir,
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}poller{0}snmp".format(
+    os.sep
+)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+# Import other required libraries
+from switchmap.poller.snmp import capabilities as testimport
+from switchmap.poller.store import Store
+
+
+class _Query:
+    """MIB query class that is supported."""
+
+    probes = 0
+
+    def __init__(self, snmp_object):
+        """Initialize the class.
+
+        Args:
+            snmp_object: SNMP Interact class object
+
+        Returns:
+            None
+
+        """
+        self.snmp_object = snmp_object
+
+    def supported(self):
+        """Determine whether the MIB is supported.
+
+        Args:
+            None
+
+        Returns:
+            result: True
+
+        """
+        type(self).probes += 1
+        return True
+
+
+class _Unsupported(_Query):
+    """MIB query class that isn't supported."""
+
+    probes = 0
+
+    def supported(self):
+        """Determine whether the MIB is supported.
+
+        Args:
+            None
+
+        Returns:
+            result: False
+
+        """
+        type(self).probes += 1
+        return False
+
+
+def _snmp_object(sysdescr=b"Firmware 1.0", sysuptime=100000):
+    """Create a simulated SNMP object.
+
+    Args:
+        sysdescr: sysDescr of the device
+        sysuptime: sysUpTime of the device
+
+    Returns:
+        result: Mock SNMP object
+
+    """
+    # Initialize key variables
+    values = {
+        ".1.3.6.1.2.1.1.1.0": sysdescr,
+        ".1.3.6.1.2.1.1.3.0": sysuptime,
+    }
+
+    # Return
+    result = Mock()
+    result.hostname.return_value = "localhost"
+    result.sysobjectid.return_value = ".1.3.6.1.4.1.9.1.1"
+    result.unreachable.return_value = 0
+    result.get.side_effect = lambda oid, **kwargs: {oid: values[oid]}
+    return result
+
+
+class TestCapabilities(unittest.TestCase):
+    """Checks all methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def setUp(self):
+        """Execute these steps before each test."""
+        # Use a new store for each test
+        directory = tempfile.mkdtemp()
+        self.store = Store(os.path.join(directory, "capabilities.yaml"))
+        _Query.probes = 0
+        _Unsupported.probes = 0
+
+    def _capabilities(self, snmp_object, interval=86400):
+        """Create a Capabilities object that uses the test store.
+
+        Args:
+            snmp_object: SNMP object
+            interval: Seconds after which the profile is revalidated
+
+        Returns:
+            result: Capabilities object
+
+        """
+        with patch.object(testimport.store, "store", return_value=self.store):
+            result = testimport.Capabilities(snmp_object, interval=interval)
+        return result
+
+    def test_query(self):
+        """Testing function query."""
+        # The MIBs are probed when the device is first polled
+        snmp_object = _snmp_object()
+        capabilities = self._capabilities(snmp_object)
+        self.assertFalse(capabilities.valid())
+        result = capabilities.query(_Query)
+        self.assertTrue(isinstance(result, _Query))
+        self.assertEqual(result.snmp_object, snmp_object)
+        self.assertIsNone(capabilities.query(_Unsupported))
+        capabilities.save()
+        self.assertEqual((_Query.probes, _Unsupported.probes), (1, 1))
+
+        # The saved profile is used by the next poll
+        capabilities = self._capabilities(_snmp_object(sysuptime=100100))
+        self.assertTrue(capabilities.valid())
+        self.assertTrue(isinstance(capabilities.query(_Query), _Query))
+        self.assertIsNone(capabilities.query(_Unsupported))
+        self.assertEqual((_Query.probes, _Unsupported.probes), (1, 1))
+
+        # The MIBs are probed again after a firmware upgrade
+        capabilities = self._capabilities(_snmp_object(sysdescr=b"2.0"))
+        self.assertFalse(capabilities.valid())
+        self.assertIsNone(capabilities.query(_Unsupported))
+        self.assertEqual(_Unsupported.probes, 2)
+
+    def test_query_unreachable(self):
+        """Testing function query when the device doesn't respond."""
+        # Initialize key variables
+        snmp_object = _snmp_object()
+        snmp_object.unreachable.side_effect = [0, 1]
+
+        # Probes to which the device didn't respond aren't saved
+        capabilities = self._capabilities(snmp_object)
+        self.assertIsNone(capabilities.query(_Unsupported))
+        capabilities.save()
+        self.assertIsNone(self.store.get("localhost"))
+
+        # The next poll probes the MIB again
+        capabilities = self._capabilities(_snmp_object(sysuptime=100100))
+        self.assertIsNone(capabilities.query(_Unsupported))
+        capabilities.save()
+        self.assertEqual(_Unsupported.probes, 2)
+        self.assertEqual(
+            self.store.get("localhost")["supported"], {"_Unsupported": False}
+        )
+
+    def test_save(self):
+        """Testing function save."""
+        # New profiles are saved
+        capabilities = self._capabilities(_snmp_object())
+        capabilities.query(_Query)
+        capabilities.query(_Unsupported)
+        capabilities.save()
+        profile = self.store.get("localhost")
+        self.assertEqual(
+            profile["supported"], {"_Query": True, "_Unsupported": False}
+        )
+        self.assertEqual(profile["sysobjectid"], ".1.3.6.1.4.1.9.1.1")
+        self.assertEqual(profile["sysuptime"], 100000)
+
+        # Valid profiles are only saved when a new MIB is probed
+        capabilities = self._capabilities(_snmp_object(sysuptime=100100))
+        capabilities.save()
+        self.assertEqual(self.store.get("localhost")["sysuptime"], 100000)
+
+        class _Other(_Query):
+            """Another MIB query class."""
+
+        capabilities.query(_Other)
+        capabilities.save()
+        self.assertEqual(
+            self.store.get("localhost")["supported"],
+            {"_Query": True, "_Unsupported": False, "_Other": True},
+        )
+
+    def test__valid(self):
+        """Testing function _valid."""
+        # Initialize key variables
+        now = int(time.time())
+        identity = {
+            "sysobjectid": ".1.3.6.1.4.1.9.1.1",
+            "sysdescr": "abc",
+            "sysuptime": 100000 + 3600 * 100,
+            "timestamp": now,
+        }
+        profile = {
+            "sysobjectid": ".1.3.6.1.4.1.9.1.1",
+            "sysdescr": "abc",
+            "sysuptime": 100000,
+            "timestamp": now - 3600,
+            "supported": {"_Query": True},
+        }
+
+        # Test
+        self.assertTrue(testimport._valid(profile, identity, 86400, now))
+        self.assertFalse(testimport._valid(None, identity, 86400, now))
+        self.assertFalse(testimport._valid(profile, identity, 3600, now))
+
+        # The device has restarted
+        restarted = dict(identity)
+        restarted["sysuptime"] = 500
+        self.assertFalse(testimport._valid(profile, restarted, 86400, now))
+
+        # The firmware or model has changed
+        for key in ["sysobjectid", "sysdescr"]:
+            changed = dict(identity)
+            changed[key] = "xyz"
+            self.assertFalse(testimport._valid(profile, changed, 86400, now))
+
+    def test__value(self):
+        """Testing function _value."""
+        # Test
+        self.assertEqual(testimport._value({".1.2": b"abc"}), "abc")
+        self.assertEqual(testimport._value({".1.2": 5}), 5)
+        self.assertIsNone(testimport._value({}))
+        self.assertIsNone(testimport._value(None))
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
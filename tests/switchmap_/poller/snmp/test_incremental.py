@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""Test the incremental module."""
+
+import unittest
+import os
+import sys
+import tempfile
+from unittest.mock import Mock, patch
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(
+                    os.path.join(
+                        os.path.abspath(os.path.join(EXEC_DIR, os.pardir)),
+                        os.pardir,
+                    )
+                ),
+                os.pardir,
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}poller{0}snmp".format(
+    os.sep
+)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+
+# Import other required libraries
+from switchmap.poller.snmp import incremental as testimport
+
+# OIDs used by the tests
+_IFDESCR = ".1.3.6.1.2.1.2.2.1.2"
+_IFOPERSTATUS = ".1.3.6.1.2.1.2.2.1.8"
+
+
+class _Device:
+    """Simulated SNMP object of a device with 24 interfaces."""
+
+    def __init__(self, sysuptime=100000):
+        """Initialize the class.
+
+        Args:
+            sysuptime: sysUpTime of the device
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self.values = {testimport.SYSUPTIME: sysuptime}
+        for ifindex in range(1, 25):
+            self.values["{}.{}".format(_IFDESCR, ifindex)] = bytes(
+                "eth{}".format(ifindex), "utf-8"
+            )
+            self.values["{}.{}".format(_IFOPERSTATUS, ifindex)] = 1
+            self.values["{}.{}".format(testimport.IFLASTCHANGE, ifindex)] = 50
+        self.gets = []
+        self.sgets = []
+        self.walks = []
+        self.cache = {}
+
+    def hostname(self):
+        """Get the hostname.
+
+        Args:
+            None
+
+        Returns:
+            result: Hostname
+
+        """
+        return "localhost"
+
+    def get(self, oid, normalized=False, check_reachability=False):
+        """Simulate an SNMP get.
+
+        Args:
+            oid: OID
+            normalized: Key the result by the last node of the OID if True
+            check_reachability: Unused
+
+        Returns:
+            result: Dict of the value keyed by OID
+
+        """
+        self.gets.append(oid)
+        key = oid.split(".")[-1] if normalized is True else oid
+        return {key: self.values.get(oid)}
+
+    def sget(self, oids):
+        """Simulate an SNMP get of several OIDs.
+
+        Args:
+            oids: List of OIDs
+
+        Returns:
+            result: Dict of values keyed by OID
+
+        """
+        self.sgets.append(oids)
+        return {oid: self.values.get(oid) for oid in oids}
+
+    def swalk(self, oid, normalized=False):
+        """Simulate an SNMP walk, keeping the results in the cache.
+
+        Args:
+            oid: OID
+            normalized: Key the results by the last node of the OID if True
+
+        Returns:
+            result: Dict of values keyed by OID
+
+        """
+        # Return the results of earlier walks
+        if oid in self.cache:
+            values = self.cache[oid]
+        else:
+            self.walks.append(oid)
+            values = {
+                key: value
+                for key, value in self.values.items()
+                if key.startswith("{}.".format(oid))
+            }
+            self.cache[oid] = values
+        if normalized is True:
+            return {key.split(".")[-1]: value for key, value in values.items()}
+        return dict(values)
+
+    def cached(self, oid, normalized=False):
+        """Get the results of a walk already made.
+
+        Args:
+            oid: OID
+            normalized: Key the results by the last node of the OID if True
+
+        Returns:
+            result: Dict of values keyed by OID, None if not walked
+
+        """
+        if oid not in self.cache:
+            return None
+        return self.swalk(oid, normalized=normalized)
+
+    def preload(self, oid, values):
+        """Provide the results of a walk.
+
+        Args:
+            oid: OID
+            values: Dict of values keyed by OID
+
+        Returns:
+            None
+
+        """
+        self.cache[oid] = dict(values)
+
+
+class TestIncremental(unittest.TestCase):
+    """Checks all methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def setUp(self):
+        """Execute these steps before each test."""
+        # Use a new file for each test
+        self.filename = os.path.join(tempfile.mkdtemp(), "localhost.yaml")
+
+    def _poll(self, device, cycles=12):
+        """Poll the interfaces of a simulated device.
+
+        Args:
+            device: _Device object
+            cycles: Number of polls between full walks
+
+        Returns:
+            result: Tuple of the Incremental object and the polled ifDescr
+                and ifOperStatus values
+
+        """
+        # Poll
+        device.gets = []
+        device.sgets = []
+        device.walks = []
+        device.cache = {}
+        with patch.object(
+            testimport.files, "incremental_file", return_value=self.filename
+        ):
+            incremental = testimport.Incremental(device, cycles=cycles)
+        values = (
+            device.swalk(_IFDESCR, normalized=True),
+            device.swalk(_IFOPERSTATUS, normalized=True),
+        )
+        incremental.save()
+
+        # Return
+        result = (incremental, values)
+        return result
+
+    def test_incremental(self):
+        """Testing function incremental."""
+        # Initialize key variables
+        device = _Device()
+
+        # The first poll walks the columns
+        incremental, values = self._poll(device)
+        self.assertFalse(incremental.incremental())
+        self.assertIn(_IFDESCR, device.walks)
+        self.assertEqual(values[0]["3"], b"eth3")
+
+        # Later polls reuse their values
+        incremental, result = self._poll(device)
+        self.assertTrue(incremental.incremental())
+        self.assertEqual(device.walks, [testimport.IFLASTCHANGE])
+        self.assertEqual(device.gets, [testimport.SYSUPTIME])
+        self.assertEqual(result, values)
+
+        self.assertEqual(device.sgets, [])
+
+        # ifLastChange is provided to the SNMP object, so the IF-MIB table
+        # walk reuses it with or without normalization
+        self.assertIn(testimport.IFLASTCHANGE, device.cache)
+        self.assertEqual(len(device.cached(testimport.IFLASTCHANGE)), 24)
+
+    def test_incremental_changed(self):
+        """Testing function incremental when an interface changes."""
+        # Initialize key variables
+        device = _Device()
+        self._poll(device)
+
+        # Only the interface that changed is queried
+        device.values["{}.3".format(testimport.IFLASTCHANGE)] = 200
+        device.values["{}.3".format(_IFOPERSTATUS)] = 2
+        device.values["{}.3".format(_IFDESCR)] = b"eth3-changed"
+        incremental, values = self._poll(device)
+        self.assertTrue(incremental.incremental())
+        self.assertEqual(device.walks, [testimport.IFLASTCHANGE])
+        self.assertEqual(device.gets, [testimport.SYSUPTIME])
+        self.assertEqual(
+            device.sgets,
+            [["{}.3".format(_IFDESCR), "{}.3".format(_IFOPERSTATUS)]],
+        )
+        self.assertEqual(values[0]["3"], b"eth3-changed")
+        self.assertEqual(values[1]["3"], 2)
+        self.assertEqual(values[1]["4"], 1)
+
+        # Several interfaces are queried in each request
+        for ifindex in range(1, 15):
+            device.values[
+                "{}.{}".format(testimport.IFLASTCHANGE, ifindex)
+            ] = 300
+        incremental, values = self._poll(device)
+        self.assertTrue(incremental.incremental())
+        self.assertEqual([len(_) for _ in device.sgets], [22, 6])
+
+        # Removed interfaces are dropped
+        del device.values["{}.24".format(testimport.IFLASTCHANGE)]
+        incremental, values = self._poll(device)
+        self.assertTrue(incremental.incremental())
+        self.assertEqual(len(values[0]), 23)
+        self.assertNotIn("24", values[0])
+
+    def test_incremental_full(self):
+        """Testing function incremental when the columns are walked."""
+        # Initialize key variables
+        device = _Device()
+        self._poll(device, cycles=3)
+
+        # After the configured number of polls
+        self.assertTrue(self._poll(device, cycles=3)[0].incremental())
+        self.assertTrue(self._poll(device, cycles=3)[0].incremental())
+        self.assertFalse(self._poll(device, cycles=3)[0].incremental())
+        self.assertTrue(self._poll(device, cycles=3)[0].incremental())
+
+        # After the device restarts
+        device.values[testimport.SYSUPTIME] = 10
+        self.assertFalse(self._poll(device)[0].incremental())
+        self.assertIn(_IFDESCR, device.walks)
+
+        # When querying the changed interfaces takes as many requests as
+        # walking the columns
+        for ifindex in range(1, 24):
+            device.values[
+                "{}.{}".format(testimport.IFLASTCHANGE, ifindex)
+            ] = 300
+        self.assertFalse(self._poll(device)[0].incremental())
+
+        # When the changed interfaces can't be queried
+        self._poll(device)
+        device.values["{}.1".format(testimport.IFLASTCHANGE)] = 400
+        with patch.object(device, "sget", return_value=None):
+            incremental, values = self._poll(device)
+        self.assertFalse(incremental.incremental())
+        self.assertIn(_IFDESCR, device.walks)
+        self.assertEqual(len(values[0]), 24)
+
+    def test__valid(self):
+        """Testing function _valid."""
+        # Initialize key variables
+        saved = {
+            "sysuptime": 1000,
+            "lastchange": {"1": 50},
+            "polls": 2,
+            "columns": {},
+        }
+        state = {"sysuptime": 2000, "lastchange": {"1": 50}}
+
+        # Test
+        self.assertTrue(testimport._valid(saved, state, 12))
+        self.assertFalse(testimport._valid(None, state, 12))
+        self.assertFalse(testimport._valid(saved, state, 3))
+        self.assertFalse(
+            testimport._valid(saved, {"sysuptime": 999, "lastchange": {}}, 12)
+        )
+        self.assertFalse(
+            testimport._valid(saved, {"sysuptime": 500, "lastchange": {}}, 12)
+        )
+        self.assertFalse(
+            testimport._valid(
+                saved, {"sysuptime": 500, "lastchange": {"1": 50}}, 12
+            )
+        )
+        self.assertFalse(
+            testimport._valid(
+                saved, {"sysuptime": None, "lastchange": {"1": 50}}, 12
+            )
+        )
+
+    def test__uptime(self):
+        """Testing function _uptime."""
+        # Test
+        self.assertEqual(testimport._uptime({".1.2": 100}), 100)
+        self.assertIsNone(testimport._uptime({".1.2": None}))
+        self.assertIsNone(testimport._uptime(None))
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
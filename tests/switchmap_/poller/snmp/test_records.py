@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Test the records module."""
+
+import unittest
+import os
+import sys
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(
+                    os.path.join(
+                        os.path.abspath(os.path.join(EXEC_DIR, os.pardir)),
+                        os.pardir,
+                    )
+                ),
+                os.pardir,
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}poller{0}snmp".format(
+    os.sep
+)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+# Import other required libraries
+from switchmap.poller.snmp import records as testimport
+
+
+class TestInterface(unittest.TestCase):
+    """Checks all methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def test___init__(self):
+        """Testing function __init__."""
+        # Records have no dict of attributes
+        record = testimport.Interface()
+        self.assertFalse(hasattr(record, "__dict__"))
+        self.assertEqual(record.dict(), {})
+
+    def test_update(self):
+        """Testing function update."""
+        # Initialize key variables
+        record = testimport.Interface()
+
+        # Values are replaced by later updates
+        record.update({"ifName": "Gi1/0/1", "ifSpeed": 100})
+        record.update({"ifSpeed": 1000, "cdpCacheDeviceId": "switch"})
+        self.assertEqual(record.ifName, "Gi1/0/1")
+        self.assertEqual(record.ifSpeed, 1000)
+        self.assertEqual(record.cdpCacheDeviceId, "switch")
+
+        # Unknown keys are kept
+        record.update({"unknownMib": 1, 2: "two", "_extra": 3})
+        self.assertEqual(record.ifSpeed, 1000)
+        self.assertEqual(record.dict()["unknownMib"], 1)
+        self.assertEqual(record.dict()[2], "two")
+        self.assertEqual(record.dict()["_extra"], 3)
+
+    def test_dict(self):
+        """Testing function dict."""
+        # Initialize key variables
+        values = {
+            "ifIndex": 1,
+            "ifName": "Gi1/0/1",
+            "ifOperStatus": 1,
+            "l1_macs": ["001122334455"],
+            "vlanTrunkPortVlansEnabled": [1, 10],
+            "unknownMib": None,
+        }
+        record = testimport.Interface()
+        record.update(values)
+
+        # Only the values set are returned
+        result = record.dict()
+        self.assertEqual(result, values)
+
+        # The result is independent of the record
+        result["ifName"] = "Gi1/0/2"
+        self.assertEqual(record.ifName, "Gi1/0/1")
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""Test the simulator module."""
+
+import unittest
+import os
+import sys
+import tempfile
+import threading
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(
+                    os.path.join(
+                        os.path.abspath(os.path.join(EXEC_DIR, os.pardir)),
+                        os.pardir,
+                    )
+                ),
+                os.pardir,
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}poller{0}snmp".format(
+    os.sep
+)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+
+# Import other required libraries
+from switchmap.poller.snmp import simulator as testimport
+from switchmap.poller.snmp import snmp_manager
+from switchmap.poller import POLL, SNMP
+
+# OIDs used by the tests
+_IFDESCR = ".1.3.6.1.2.1.2.2.1.2"
+_IFPHYSADDRESS = ".1.3.6.1.2.1.2.2.1.6"
+_IFNAME = ".1.3.6.1.2.1.31.1.1.1.1"
+_ARP_MAC = ".1.3.6.1.2.1.4.22.1.2"
+_ARP_IP = ".1.3.6.1.2.1.4.22.1.3"
+_FDB_PORT = ".1.3.6.1.2.1.17.4.3.1.2"
+
+
+def _capture():
+    """Create a capture of a device with 24 interfaces.
+
+    Args:
+        None
+
+    Returns:
+        result: Capture
+
+    """
+    # Initialize key variables
+    values = {
+        ".1.3.6.1.2.1.1.2.0": [".1.3.6.1.4.1.9.1.1", "OBJECTID"],
+        ".1.3.6.1.2.1.1.3.0": [1000, "TICKS"],
+        ".1.3.6.1.2.1.2.1.0": [24, "INTEGER"],
+    }
+    for ifindex in range(1, 25):
+        values["{}.{}".format(_IFDESCR, ifindex)] = [
+            "eth{}".format(ifindex),
+            "OCTETSTR",
+        ]
+        values["{}.{}".format(_IFNAME, ifindex)] = ["Gi1/01", "OCTETSTR"]
+        values["{}.{}".format(_IFPHYSADDRESS, ifindex)] = [
+            "".join(chr(_) for _ in [0, 1, 2, 3, 4, ifindex]),
+            "OCTETSTR",
+        ]
+
+    # A MAC address in the forwarding and ARP tables
+    values["{}.0.1.2.3.4.99".format(_FDB_PORT)] = [3, "INTEGER"]
+    values["{}.3.10.0.0.7".format(_ARP_MAC)] = [
+        "".join(chr(_) for _ in [0, 1, 2, 3, 4, 99]),
+        "OCTETSTR",
+    ]
+    values["{}.3.10.0.0.7".format(_ARP_IP)] = ["10.0.0.7", "IPADDR"]
+
+    # Return
+    result = {
+        "hostname": "switch",
+        "contexts": {
+            "": values,
+            "10": {"{}.1".format(_IFDESCR): ["x", "OCTETSTR"]},
+        },
+    }
+    return result
+
+
+def _poll(hostname="switch-1"):
+    """Create a POLL object for testing.
+
+    Args:
+        hostname: Hostname
+
+    Returns:
+        result: POLL object
+
+    """
+    # Return
+    result = POLL(
+        hostname=hostname,
+        authorization=SNMP(
+            enabled=True,
+            group="public",
+            version=2,
+            secname=None,
+            authprotocol=None,
+            authpassword=None,
+            privprotocol=None,
+            privpassword=None,
+            port=161,
+            community="public",
+        ),
+    )
+    return result
+
+
+class _Session:
+    """Session created by the original snmp_manager._Session."""
+
+    def __init__(self, _poll, context_name=""):
+        """Initialize the class.
+
+        Args:
+            _poll: POLL object
+            context_name: Context name
+
+        Returns:
+            None
+
+        """
+        self.session = testimport.Agent(
+            _capture()["contexts"].get(context_name, {})
+        )
+
+
+class TestSimulator(unittest.TestCase):
+    """Checks all methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def test_agent(self):
+        """Testing class Agent."""
+        # Initialize key variables
+        agent = testimport.Agent(_capture()["contexts"][""])
+
+        # Get
+        result = agent.get("{}.2".format(_IFDESCR))
+        self.assertEqual(result, (_IFDESCR, "2", "eth2", "OCTETSTR"))
+        result = agent.get("{}.99".format(_IFDESCR))
+        self.assertEqual(result.snmp_type, "NOSUCHINSTANCE")
+        result = agent.get(["{}.2".format(_IFDESCR), "{}.99".format(_IFDESCR)])
+        self.assertEqual(
+            [_.snmp_type for _ in result], ["OCTETSTR", "NOSUCHINSTANCE"]
+        )
+
+        # Walks return the values under the OID in lexicographic order
+        result = agent.walk(_IFDESCR)
+        self.assertEqual(
+            [_.oid_index for _ in result], [str(_) for _ in range(1, 25)]
+        )
+        self.assertEqual(agent.bulkwalk(_IFDESCR), result)
+        self.assertEqual(agent.walk("{}.3".format(_IFDESCR)), [result[2]])
+        self.assertEqual(agent.walk(".1.3.6.1.2.1.99"), [])
+
+        # GETBULK returns the next values of each OID
+        result = agent.get_bulk(
+            ["{}.23".format(_IFDESCR), "{}.24".format(_IFNAME)],
+            max_repetitions=2,
+        )
+        self.assertEqual(
+            [(_.oid, _.oid_index, _.snmp_type) for _ in result],
+            [
+                (_IFDESCR, "24", "OCTETSTR"),
+                (_IFNAME, "24", "ENDOFMIBVIEW"),
+                (_IFPHYSADDRESS, "1", "OCTETSTR"),
+                (_IFNAME, "24", "ENDOFMIBVIEW"),
+            ],
+        )
+
+        # Requests are counted. A bulkwalk of 24 values needs 3 requests
+        self.assertEqual(agent.requests, 10)
+
+    def test_recorder(self):
+        """Testing class Recorder."""
+        # Initialize key variables
+        values = {}
+        session = testimport.Agent(_capture()["contexts"][""])
+        recorder = testimport.Recorder(session, values, threading.Lock())
+
+        # Values returned by the session are recorded
+        result = recorder.get(".1.3.6.1.2.1.1.3.0")
+        self.assertEqual(result.value, 1000)
+        recorder.get([".1.3.6.1.2.1.1.4.0", "{}.2".format(_IFNAME)])
+        recorder.bulkwalk(_IFDESCR, max_repetitions=25)
+        recorder.get_bulk([_IFNAME], max_repetitions=1)
+        expected = {
+            ".1.3.6.1.2.1.1.3.0": [1000, "TICKS"],
+            "{}.1".format(_IFNAME): ["Gi1/01", "OCTETSTR"],
+            "{}.2".format(_IFNAME): ["Gi1/01", "OCTETSTR"],
+        }
+        for ifindex in range(1, 25):
+            expected["{}.{}".format(_IFDESCR, ifindex)] = [
+                "eth{}".format(ifindex),
+                "OCTETSTR",
+            ]
+        self.assertEqual(values, expected)
+
+    def test__simulation(self):
+        """Testing class _Simulation."""
+        # Initialize key variables
+        original = snmp_manager._Session
+        simulation = testimport._Simulation()
+
+        # The sessions are those of the devices by default
+        snmp_manager._Session = _Session
+        try:
+            simulation.start()
+            self.assertIsNot(snmp_manager._Session, _Session)
+            interact = snmp_manager.Interact(_poll())
+            result = interact.swalk(_IFDESCR, normalized=True)
+            simulation.stop()
+            self.assertIs(snmp_manager._Session, _Session)
+        finally:
+            snmp_manager._Session = original
+
+        # Test
+        self.assertEqual(len(result), 24)
+        self.assertEqual(result["1"], b"eth1")
+
+    def test_recording(self):
+        """Testing class Recording."""
+        # Initialize key variables
+        original = snmp_manager._Session
+        recording = testimport.Recording()
+
+        # Poll a device while recording
+        snmp_manager._Session = _Session
+        try:
+            recording.start()
+            interact = snmp_manager.Interact(_poll())
+            interact.swalk(_IFDESCR)
+            interact.swalk(_IFDESCR, context_name="10")
+            recording.stop()
+            self.assertIs(snmp_manager._Session, _Session)
+        finally:
+            snmp_manager._Session = original
+
+        # The values are recorded for each context
+        captures = recording.captures()
+        self.assertEqual(sorted(captures), ["switch-1"])
+        capture = captures["switch-1"]
+        self.assertEqual(capture["hostname"], "switch-1")
+        self.assertEqual(len(capture["contexts"][""]), 24)
+        self.assertEqual(
+            capture["contexts"]["10"],
+            {"{}.1".format(_IFDESCR): ["x", "OCTETSTR"]},
+        )
+
+    def test_replay(self):
+        """Testing class Replay."""
+        # Initialize key variables
+        original = snmp_manager._Session
+        replay = testimport.Replay(testimport.fleet(_capture(), 2))
+
+        # Poll the simulated devices
+        replay.start()
+        try:
+            interact = snmp_manager.Interact(_poll("switch-2"))
+            result = interact.swalk(_IFDESCR, normalized=True)
+            rows = interact.table([_IFNAME])
+            unknown = snmp_manager.Interact(_poll("unknown"))
+            missing = unknown.swalk(_IFDESCR)
+        finally:
+            replay.stop()
+        self.assertIs(snmp_manager._Session, original)
+
+        # Test
+        self.assertEqual(result["1"], b"eth1")
+        self.assertEqual(len(rows), len(result))
+        self.assertEqual(missing, {})
+        self.assertGreater(replay.requests(), 1)
+
+    def test_save(self):
+        """Testing functions save and load."""
+        # Test
+        filepath = os.path.join(tempfile.mkdtemp(), "capture.payload")
+        testimport.save(_capture(), filepath)
+        self.assertEqual(testimport.load(filepath), _capture())
+
+    def test_fleet(self):
+        """Testing function fleet."""
+        # Initialize key variables
+        capture = _capture()
+        result = testimport.fleet(capture, 10, seed=1)
+
+        # The fleet can be recreated
+        self.assertEqual(result, testimport.fleet(capture, 10, seed=1))
+        self.assertNotEqual(result, testimport.fleet(capture, 10, seed=2))
+        self.assertEqual(
+            [_["hostname"] for _ in result],
+            ["switch-{}".format(_) for _ in range(1, 11)],
+        )
+
+        for device in result:
+            values = device["contexts"][""]
+
+            # Devices keep all the interfaces
+            ifindexes = [
+                oid.split(".")[-1]
+                for oid in values
+                if oid.startswith("{}.".format(_IFDESCR)) is True
+            ]
+            self.assertEqual(ifindexes, [str(_) for _ in range(1, 25)])
+            self.assertEqual(values[".1.3.6.1.2.1.2.1.0"][0], 24)
+            self.assertEqual(len(values), len(capture["contexts"][""]))
+
+            # Interface names that look like MAC addresses are unchanged
+            self.assertEqual(values["{}.1".format(_IFNAME)][0], "Gi1/01")
+
+            # MAC addresses are replaced by the same random addresses in
+            # the OIDs and the values
+            fdb = [_ for _ in values if _.startswith(_FDB_PORT) is True]
+            self.assertEqual(len(fdb), 1)
+            mac = [int(_) for _ in fdb[0].split(".")[-6:]]
+            self.assertNotEqual(mac, [0, 1, 2, 3, 4, 99])
+            self.assertEqual(mac[0] & 0x03, 0x02)
+            arp = [_ for _ in values if _.startswith(_ARP_MAC) is True]
+            self.assertEqual(len(arp), 1)
+            self.assertEqual([ord(_) for _ in values[arp[0]][0]], mac)
+
+            # ARP table IP addresses are replaced in the OIDs and values
+            address = ".".join(arp[0].split(".")[-4:])
+            self.assertTrue(address.startswith("10.0."))
+            self.assertEqual(
+                values["{}.3.{}".format(_ARP_IP, address)][0], address
+            )
+
+            # Other contexts are kept
+            self.assertEqual(
+                device["contexts"]["10"], capture["contexts"]["10"]
+            )
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
@@ -4,6 +4,8 @@
 import unittest
 import os
 import sys
+import time
+from unittest.mock import Mock
 
 # Try to create a working PYTHONPATH
 EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
@@ -46,6 +48,8 @@ CONFIG = setup.config()
 CONFIG.save()
 
 # Import other required libraries
+from switchmap.poller.snmp import snmp_info as testimport
+from switchmap.poller.snmp import records
 
 
 class TestSnmpInfo(unittest.TestCase):
@@ -93,7 +97,37 @@ class TestSnmpInfo(unittest.TestCase):
 
     def test_layer1(self):
         """Testing function layer1."""
-        pass
+        # Initialize key variables
+        first = Mock()
+        first.layer1.return_value = {1: {"ifName": "Gi1/0/1", "ifSpeed": 1}}
+        second = Mock()
+        second.layer1.return_value = {
+            1: {"ifSpeed": 1000, "l1_macs": ["001122334455"]},
+            2: {"ifName": "Gi1/0/2"},
+        }
+        capabilities = Mock()
+        capabilities.query.side_effect = [first, second] + [None] * 100
+        query = testimport.Query(Mock(), capabilities=capabilities)
+
+        # The data of all the MIBs is merged into dicts
+        result = query.layer1()
+        self.assertEqual(
+            result,
+            {
+                1: {
+                    "ifName": "Gi1/0/1",
+                    "ifSpeed": 1000,
+                    "l1_macs": ["001122334455"],
+                },
+                2: {"ifName": "Gi1/0/2"},
+            },
+        )
+        self.assertEqual(type(result[1]), dict)
+
+        # No data is returned if no MIBs are supported
+        capabilities.query.side_effect = None
+        capabilities.query.return_value = None
+        self.assertIsNone(query.layer1())
 
     def test_layer2(self):
         """Testing function layer2."""
@@ -103,13 +137,69 @@ class TestSnmpInfo(unittest.TestCase):
         """Testing function layer3."""
         pass
 
+    def test__expired(self):
+        """Testing function _expired."""
+        # Test
+        self.assertFalse(testimport.Query(None)._expired())
+        query = testimport.Query(None, deadline=time.time() + 60)
+        self.assertFalse(query._expired())
+        query = testimport.Query(None, deadline=time.time() - 1)
+        self.assertTrue(query._expired())
+
+    def test_everything_expired(self):
+        """Testing function everything when the deadline has passed."""
+        # Initialize key variables
+        snmp_object = Mock()
+        snmp_object.hostname.return_value = "localhost"
+        snmp_object.sysobjectid.return_value = ".1.3.6.1.4.1.9.1.1"
+        capabilities = Mock()
+        query = testimport.Query(
+            snmp_object, capabilities=capabilities, deadline=time.time() - 1
+        )
+
+        # No MIBs are queried and no data is returned
+        self.assertIsNone(query.everything())
+        capabilities.query.assert_not_called()
+        capabilities.save.assert_not_called()
+
+    def test__layer1(self):
+        """Testing function _layer1."""
+        # Initialize key variables
+        record = records.Interface()
+        record.update({"ifName": "Gi1/0/1", "ifSpeed": 1000})
+
+        # Test
+        self.assertIsNone(testimport._layer1(None))
+        self.assertEqual(testimport._layer1({}), {})
+        self.assertEqual(
+            testimport._layer1({1: record}),
+            {1: {"ifName": "Gi1/0/1", "ifSpeed": 1000}},
+        )
+
     def test__add_data(self):
         """Testing function _add_data."""
         pass
 
     def test__add_layer1(self):
         """Testing function _add_layer1."""
-        pass
+        # Initialize key variables
+        item = Mock()
+        item.layer1.return_value = {
+            1: {"ifAlias": "Uplink", "ifSpeed": 10000},
+            3: {"vmVlan": 10},
+        }
+        data = {1: records.Interface()}
+        data[1].update({"ifName": "Gi1/0/1", "ifSpeed": 1000})
+
+        # Test
+        result = testimport._add_layer1(item, data)
+        self.assertIs(result, data)
+        self.assertEqual(sorted(result), [1, 3])
+        self.assertEqual(
+            result[1].dict(),
+            {"ifName": "Gi1/0/1", "ifAlias": "Uplink", "ifSpeed": 10000},
+        )
+        self.assertEqual(result[3].dict(), {"vmVlan": 10})
 
     def test__add_layer2(self):
         """Testing function _add_layer2."""
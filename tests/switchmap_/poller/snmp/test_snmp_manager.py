@@ -2,9 +2,16 @@
 """Test the snmp_manager module."""
 
 import unittest
+import tempfile
+import threading
+import time
+from collections import namedtuple
+from unittest.mock import Mock, patch
 import os
 import sys
 
+from easysnmp import exceptions
+
 # Try to create a working PYTHONPATH
 EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
 ROOT_DIR = os.path.abspath(
@@ -46,6 +53,132 @@ CONFIG = setup.config()
 CONFIG.save()
 
 # Import other required libraries
+from switchmap.poller.snmp import snmp_manager as testimport
+from switchmap.poller import POLL, SNMP, POLLING_OPTIONS
+from switchmap.poller.store import Store
+
+
+_Variable = namedtuple("_Variable", "oid oid_index value snmp_type")
+
+
+class _Agent:
+    """Simulated SNMP agent session."""
+
+    def __init__(self, mib):
+        """Initialize the class.
+
+        Args:
+            mib: Dict of (value, snmp_type) tuples keyed by OID
+
+        Returns:
+            None
+
+        """
+        # Sort the OIDs in lexicographic order
+        self.mib = mib
+        self.oids = sorted(
+            mib.keys(), key=lambda _: [int(node) for node in _[1:].split(".")]
+        )
+        self.requests = 0
+
+    def get_bulk(self, oids, non_repeaters=0, max_repetitions=10):
+        """Simulate a GETBULK request.
+
+        Args:
+            oids: List of OIDs
+            non_repeaters: Unused
+            max_repetitions: Number of values to return per OID
+
+        Returns:
+            result: List of _Variable objects
+
+        """
+        # Initialize key variables
+        result = []
+        cursors = list(oids)
+        self.requests += 1
+
+        for _ in range(max_repetitions):
+            for position, cursor in enumerate(cursors):
+                following = [
+                    oid
+                    for oid in self.oids
+                    if [int(node) for node in oid[1:].split(".")]
+                    > [int(node) for node in cursor[1:].split(".")]
+                ]
+                if bool(following) is False:
+                    result.append(_Variable(cursor, "", "", "ENDOFMIBVIEW"))
+                    continue
+                oid = following[0]
+                nodes = oid.split(".")
+                value, snmp_type = self.mib[oid]
+                result.append(
+                    _Variable(".".join(nodes[:-1]), nodes[-1], value, snmp_type)
+                )
+                cursors[position] = oid
+        return result
+
+
+def _authorization(group="public", enabled=True):
+    """Create an SNMP authorization for testing.
+
+    Args:
+        group: Group name
+        enabled: True if the group is enabled
+
+    Returns:
+        result: SNMP object
+
+    """
+    # Return
+    result = SNMP(
+        enabled=enabled,
+        group=group,
+        version=2,
+        secname=None,
+        authprotocol=None,
+        authpassword=None,
+        privprotocol=None,
+        privpassword=None,
+        port=161,
+        community=group,
+    )
+    return result
+
+
+def _contactable(interact):
+    """Simulate a device that only accepts the "good" SNMP group.
+
+    Args:
+        interact: Interact object
+
+    Returns:
+        result: True if contactable
+
+    """
+    # Respond slowly to the other groups
+    result = interact._poll.authorization.group == "good"
+    if result is False:
+        time.sleep(0.2)
+    return result
+
+
+def _interact(max_sessions=16):
+    """Create an Interact object for testing.
+
+    Args:
+        max_sessions: Maximum number of SNMP sessions to cache
+
+    Returns:
+        result: Interact object
+
+    """
+    # Return
+    result = testimport.Interact(
+        POLL(hostname="localhost", authorization=_authorization()),
+        max_sessions=max_sessions,
+    )
+    return result
 
 
 class TestSnmpManagerValidate(unittest.TestCase):
@@ -81,11 +214,74 @@ class TestSnmpManagerValidate(unittest.TestCase):
 
     def test_credentials(self):
         """Testing function credentials."""
-        pass
+        # Initialize key variables
+        directory = tempfile.mkdtemp()
+        filename = os.path.join(directory, "credentials.yaml")
+        validate = testimport.Validate(
+            POLLING_OPTIONS(
+                hostname="localhost",
+                authorizations=[_authorization("bad"), _authorization("good")],
+            )
+        )
 
-    def test__credentials(self):
-        """Testing function _credentials."""
-        pass
+        credentials = Store(filename)
+
+        with patch.object(
+            testimport.store, "store", return_value=credentials
+        ), patch.object(
+            testimport.Interact,
+            "contactable",
+            autospec=True,
+            side_effect=_contactable,
+        ):
+            # Test
+            result = validate.credentials()
+            self.assertEqual(result.group, "good")
+
+            # The group is saved in the shared credentials file
+            self.assertEqual(Store(filename).data(), {"localhost": "good"})
+
+            # The saved group is tried first
+            credentials.update("localhost", "bad")
+            result = validate.credentials()
+            self.assertEqual(result.group, "good")
+            self.assertEqual(credentials.data(), {"localhost": "good"})
+
+    def test_validation(self):
+        """Testing function validation."""
+        # Initialize key variables
+        validate = testimport.Validate(
+            POLLING_OPTIONS(
+                hostname="localhost",
+                authorizations=[
+                    _authorization("bad"),
+                    _authorization("good", enabled=False),
+                    _authorization("worse"),
+                    _authorization("good"),
+                ],
+            )
+        )
+
+        with patch.object(
+            testimport.Interact,
+            "contactable",
+            autospec=True,
+            side_effect=_contactable,
+        ):
+            # The successful group doesn't wait for the others
+            ts_start = time.time()
+            result = validate.validation()
+            self.assertLess(time.time() - ts_start, 0.2)
+            self.assertEqual(result, _authorization("good"))
+            self.assertEqual(
+                validate.interact()._poll.authorization, _authorization("good")
+            )
+
+            # Test a specific group
+            self.assertIsNone(validate.validation(group="bad"))
+            self.assertIsNone(validate.interact())
+            result = validate.validation(group="good")
+            self.assertEqual(result, _authorization("good"))
 
 
 class TestSnmpManagerInteract(unittest.TestCase):
@@ -119,6 +315,162 @@ class TestSnmpManagerInteract(unittest.TestCase):
         """Testing function __init__."""
         pass
 
+    def test_close(self):
+        """Testing function close."""
+        # Initialize key variables
+        interact = _interact()
+
+        with patch.object(testimport, "_Session") as session:
+            interact._session()
+            interact.close()
+            interact._session()
+
+        # The session is created again after closing
+        self.assertEqual(session.call_count, 2)
+
+    def test_session_statistics(self):
+        """Testing function session_statistics."""
+        # Initialize key variables
+        interact = _interact()
+        self.assertEqual(
+            interact.session_statistics(), {"created": 0, "reused": 0}
+        )
+
+        with patch.object(testimport, "_Session"):
+            for _ in range(3):
+                interact._session()
+            interact._session(context_name="vlan-10")
+
+        self.assertEqual(
+            interact.session_statistics(), {"created": 2, "reused": 2}
+        )
+
+    def test_cache_statistics(self):
+        """Testing function cache_statistics."""
+        # Initialize key variables
+        oid = ".1.3.6.1.2.1.2.2.1.2"
+        interact = _interact()
+        agent = Mock()
+        agent.bulkwalk.return_value = [_Variable(oid, "1", "eth0", "OCTETSTR")]
+
+        with patch.object(testimport, "_Session") as session:
+            session.return_value = Mock(session=agent)
+
+            # Repeated queries are answered from the cache
+            for _ in range(3):
+                self.assertEqual(
+                    interact.swalk(oid, normalized=True), {"1": b"eth0"}
+                )
+            self.assertEqual(interact.swalk(oid), {"{}.1".format(oid): b"eth0"})
+
+            # Results can't be altered by the caller
+            interact.swalk(oid, normalized=True).clear()
+            self.assertEqual(
+                interact.swalk(oid, normalized=True), {"1": b"eth0"}
+            )
+
+        self.assertEqual(agent.bulkwalk.call_count, 2)
+        self.assertEqual(
+            interact.cache_statistics(),
+            {"hits": 4, "misses": 2, "oids": {oid: 4}},
+        )
+
+        # The cache is emptied when the sessions are closed
+        interact.close()
+        with patch.object(testimport, "_Session") as session:
+            session.return_value = Mock(session=agent)
+            interact.swalk(oid, normalized=True)
+        self.assertEqual(agent.bulkwalk.call_count, 3)
+
+    def test_unreachable(self):
+        """Testing function unreachable."""
+        # Initialize key variables
+        oid = ".1.3.6.1.2.1.1.2.0"
+        agent = Mock()
+        interact = _interact()
+        self.assertEqual(interact.unreachable(), 0)
+
+        with patch.object(testimport, "_Session") as session:
+            session.return_value = Mock(session=agent)
+
+            # Errors about the OID aren't counted
+            agent.get.side_effect = exceptions.EasySNMPNoSuchObjectError("x")
+            interact.query(oid, get=True, check_existence=True)
+            self.assertEqual(interact.unreachable(), 0)
+
+            # Timeouts are
+            agent.get.side_effect = exceptions.EasySNMPTimeoutError("x")
+            interact.query(oid, get=True, check_reachability=True)
+            self.assertEqual(interact.unreachable(), 1)
+            interact.sget([oid])
+            self.assertEqual(interact.unreachable(), 2)
+
+    def test__session(self):
+        """Testing function _session."""
+        # Initialize key variables
+        interact = _interact(max_sessions=2)
+
+        with patch.object(testimport, "_Session") as session:
+            session.side_effect = lambda _poll, context_name="": Mock(
+                session=context_name
+            )
+
+            # Sessions are reused per context
+            self.assertEqual(interact._session(), "")
+            self.assertEqual(interact._session("vlan-10"), "vlan-10")
+            self.assertEqual(interact._session(), "")
+            self.assertEqual(session.call_count, 2)
+
+            # The least recently used context is evicted
+            self.assertEqual(interact._session("vlan-20"), "vlan-20")
+            self.assertEqual(interact._session(), "")
+            self.assertEqual(session.call_count, 3)
+            self.assertEqual(interact._session("vlan-10"), "vlan-10")
+            self.assertEqual(session.call_count, 4)
+
+    def test_max_repetitions(self):
+        """Testing function max_repetitions."""
+        # Initialize key variables
+        oid = ".1.3.6.1.2.1.17.4.3.1.2"
+        results = [_Variable(oid, str(_), "1", "INTEGER") for _ in range(100)]
+        authorization = _authorization()
+
+        for adaptive, expected in [(False, 25), (True, 50)]:
+            interact = testimport.Interact(
+                POLL(hostname="localhost", authorization=authorization),
+                adaptive=adaptive,
+            )
+            agent = Mock()
+            agent.bulkwalk.return_value = results
+            with patch.object(testimport, "_Session") as session:
+                session.return_value = Mock(session=agent)
+                self.assertEqual(len(interact.swalk(oid)), 100)
+            self.assertEqual(interact.max_repetitions(), expected)
+
+        # Back off and retry after timeouts
+        interact = testimport.Interact(
+            POLL(hostname="localhost", authorization=authorization),
+            max_repetitions=40,
+            adaptive=True,
+        )
+        agent = Mock()
+        agent.bulkwalk.side_effect = [
+            testimport.exceptions.EasySNMPTimeoutError("Timeout"),
+            testimport.exceptions.EasySNMPTimeoutError("Timeout"),
+            results[:5],
+        ]
+        with patch.object(testimport, "_Session") as session:
+            session.return_value = Mock(session=agent)
+            self.assertEqual(len(interact.walk(oid)), 5)
+        self.assertEqual(interact.max_repetitions(), 10)
+        self.assertEqual(
+            [
+                _.kwargs["max_repetitions"]
+                for _ in agent.bulkwalk.call_args_list
+            ],
+            [40, 20, 10],
+        )
+
     def test_enterprise_number(self):
         """Testing function enterprise_number."""
         pass
@@ -151,6 +503,158 @@ class TestSnmpManagerInteract(unittest.TestCase):
         """Testing function swalk."""
         pass
 
+    def test_sget(self):
+        """Testing function sget."""
+        # Initialize key variables
+        oids = [".1.3.6.1.2.1.2.2.1.2.1", ".1.3.6.1.2.1.2.2.1.2.2"]
+        agent = Mock()
+        interact = _interact()
+
+        with patch.object(testimport, "_Session") as session:
+            session.return_value = Mock(session=agent)
+
+            # The OIDs are got in a single request
+            agent.get.return_value = [
+                _Variable(".1.3.6.1.2.1.2.2.1.2", "1", "eth0", "OCTETSTR"),
+                _Variable(oids[1], "", "NOSUCHINSTANCE", "NOSUCHINSTANCE"),
+            ]
+            result = interact.sget(oids)
+            self.assertEqual(result, {oids[0]: b"eth0", oids[1]: None})
+            agent.get.assert_called_once_with(oids)
+
+            # Errors don't stop the poll. Timeouts drop the session
+            agent.get.side_effect = exceptions.EasySNMPNoSuchNameError("x")
+            self.assertIsNone(interact.sget(oids))
+            self.assertIn("", interact._sessions)
+            agent.get.side_effect = exceptions.EasySNMPTimeoutError("x")
+            self.assertIsNone(interact.sget(oids))
+            self.assertNotIn("", interact._sessions)
+
+    def test_table(self):
+        """Testing function table."""
+        # Initialize key variables
+        ifdescr = ".1.3.6.1.2.1.2.2.1.2"
+        ifspeed = ".1.3.6.1.2.1.2.2.1.5"
+        mib = {}
+        expected = {}
+        for ifindex in range(1, 61):
+            mib["{}.{}".format(ifdescr, ifindex)] = (
+                "eth{}".format(ifindex),
+                "OCTETSTR",
+            )
+            expected[str(ifindex)] = {
+                ifdescr: bytes("eth{}".format(ifindex), "utf-8")
+            }
+        for ifindex in range(1, 41):
+            mib["{}.{}".format(ifspeed, ifindex)] = (ifindex * 1000, "GAUGE")
+            expected[str(ifindex)][ifspeed] = ifindex * 1000
+        mib[".1.3.6.1.2.1.2.2.1.6.1"] = ("00:00:00:00:00:01", "OCTETSTR")
+        agent = _Agent(mib)
+
+        # Test
+        interact = _interact()
+        with patch.object(testimport, "_Session") as session:
+            session.return_value = Mock(session=agent)
+            result = interact.table([ifdescr, ifspeed])
+
+        self.assertEqual(result, expected)
+
+        # Both columns are retrieved in a few requests
+        self.assertEqual(agent.requests, 2)
+
+        # Columns walked before aren't walked again
+        with patch.object(testimport, "_Session") as session:
+            session.return_value = Mock(session=agent)
+            result = interact.table([ifdescr, ifspeed])
+        self.assertEqual(result, expected)
+        self.assertEqual(agent.requests, 2)
+        self.assertEqual(interact.cached(ifspeed, normalized=True)["40"], 40000)
+
+    def test_cached(self):
+        """Testing function cached."""
+        # Initialize key variables
+        oid = ".1.3.6.1.2.1.2.2.1.2"
+        interact = _interact()
+
+        # Test
+        self.assertIsNone(interact.cached(oid))
+        interact._cache[(oid, "", False, False)] = {"{}.1".format(oid): b"x"}
+        result = interact.cached(oid)
+        self.assertEqual(result, {"{}.1".format(oid): b"x"})
+        self.assertIsNone(interact.cached(oid, normalized=True))
+        self.assertIsNone(interact.cached(oid, context_name="10"))
+
+        # Results are copies
+        result.clear()
+        self.assertEqual(interact.cached(oid), {"{}.1".format(oid): b"x"})
+
+    def test_preload(self):
+        """Testing function preload."""
+        # Initialize key variables
+        ifdescr = ".1.3.6.1.2.1.2.2.1.2"
+        ifspeed = ".1.3.6.1.2.1.2.2.1.5"
+        agent = _Agent({"{}.1".format(ifspeed): (1000, "GAUGE")})
+        interact = _interact()
+        interact.preload(ifdescr, {"{}.1".format(ifdescr): b"eth1"})
+
+        # Walks of the OID return the values without querying the device
+        with patch.object(testimport, "_Session") as session:
+            session.return_value = Mock(session=agent)
+            self.assertEqual(
+                interact.swalk(ifdescr, normalized=True), {"1": b"eth1"}
+            )
+            self.assertEqual(
+                interact.swalk(ifdescr), {"{}.1".format(ifdescr): b"eth1"}
+            )
+            result = interact.table([ifdescr, ifspeed])
+        self.assertEqual(result, {"1": {ifdescr: b"eth1", ifspeed: 1000}})
+
+        # Only the other column was requested
+        self.assertEqual(agent.requests, 1)
+
+    def test_swalk_contexts(self):
+        """Testing function swalk_contexts."""
+        # Initialize key variables
+        oid = ".1.3.6.1.2.1.17.4.3.1.2"
+        contexts = ["", "1", "10", "20", "30", "40", "50", "60"]
+        lock = threading.Lock()
+        active = []
+        peak = []
+
+        def _swalk(oid_to_get, normalized=False, context_name=""):
+            """Simulate a walk in a context.
+
+            Args:
+                oid_to_get: OID
+                normalized: Unused
+                context_name: Context name
+
+            Returns:
+                result: Walk results
+
+            """
+            with lock:
+                active.append(context_name)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.remove(context_name)
+            result = {"{}.{}".format(oid_to_get, context_name): context_name}
+            return result
+
+        # Results are in the order of the contexts
+        expected = [{"{}.{}".format(oid, _): _} for _ in contexts]
+        for concurrency in [1, 3]:
+            interact = testimport.Interact(
+                POLL(hostname="localhost", authorization=_authorization()),
+                context_concurrency=concurrency,
+            )
+            del peak[:]
+            with patch.object(interact, "swalk", side_effect=_swalk):
+                result = interact.swalk_contexts(oid, contexts)
+            self.assertEqual(result, expected)
+            self.assertEqual(max(peak), concurrency)
+
     def test_walk(self):
         """Testing function walk."""
         pass
@@ -161,7 +665,30 @@ class TestSnmpManagerInteract(unittest.TestCase):
 
     def test_query(self):
         """Testing function query."""
-        pass
+        # Initialize key variables
+        oid = ".1.3.6.1.2.1.1.2.0"
+        agent = Mock()
+        interact = _interact()
+
+        with patch.object(testimport, "_Session") as session:
+            session.return_value = Mock(session=agent)
+
+            # Errors about the OID keep the session
+            agent.get.side_effect = exceptions.EasySNMPNoSuchObjectError("x")
+            result = interact.query(oid, get=True, check_existence=True)
+            self.assertEqual(result, (True, False, {}))
+            self.assertIn("", interact._sessions)
+
+            # Timeouts drop the session
+            agent.get.side_effect = exceptions.EasySNMPTimeoutError("x")
+            result = interact.query(oid, get=True, check_reachability=True)
+            self.assertEqual(result, (False, False, {}))
+            self.assertNotIn("", interact._sessions)
+            self.assertEqual(session.call_count, 1)
+
+            # The next query uses a new session
+            interact.query(oid, get=True, check_reachability=True)
+            self.assertEqual(session.call_count, 2)
 
 
 class TestSnmpManagerSession(unittest.TestCase):
@@ -245,20 +772,138 @@ class TestSnmpManagerFunctions(unittest.TestCase):
 
     def test__format_results(self):
         """Testing function _format_results."""
-        pass
+        # Initialize key variables
+        results = [
+            _Variable(".1.3.6.1.2.1.2.2.1.2", "1", "Gi1/0/1", "OCTETSTR"),
+            _Variable(".1.3.6.1.2.1.2.2.1.2", "2", "Gi1/0/2", "OCTETSTR"),
+            _Variable(".1.3.6.1.2.1.2.2.1.20", "1", "5", "COUNTER32"),
+            _Variable(".1.3.6.1.2.1.2.2.1.3", "1", "6", "INTEGER"),
+        ]
+
+        # Only OIDs under the OID requested are returned
+        result = testimport._format_results(results, ".1.3.6.1.2.1.2.2.1.2")
+        self.assertEqual(
+            result,
+            {
+                ".1.3.6.1.2.1.2.2.1.2.1": b"Gi1/0/1",
+                ".1.3.6.1.2.1.2.2.1.2.2": b"Gi1/0/2",
+            },
+        )
+        result = testimport._format_results(
+            results, ".1.3.6.1.2.1.2.2.1.2", normalized=True
+        )
+        self.assertEqual(result, {"1": b"Gi1/0/1", "2": b"Gi1/0/2"})
+        result = testimport._format_results(
+            results, ".1.3.6.1.2.1.2.2.1", normalized=True
+        )
+        self.assertEqual(result, {"1": 6, "2": b"Gi1/0/2"})
+
+        # The OID requested may include the index
+        result = testimport._format_results(results, ".1.3.6.1.2.1.2.2.1.2.2")
+        self.assertEqual(result, {".1.3.6.1.2.1.2.2.1.2.2": b"Gi1/0/2"})
+        self.assertEqual(
+            testimport._format_results(results, ".1.3.6.1.2.1.2.2.1.2.3"), {}
+        )
+
+    def test__format_results_cost(self):
+        """Testing the cost of each value formatted by _format_results."""
+        # Initialize key variables
+        count = 10000
+        results = [
+            _Variable(
+                ".1.3.6.1.2.1.2.2.1.{}".format(column),
+                str(index),
+                "1" if column == 10 else "Gi1/0/{}".format(index),
+                "COUNTER32" if column == 10 else "OCTETSTR",
+            )
+            for column in [2, 10]
+            for index in range(count // 2)
+        ]
+
+        # Get the best of several runs of _format_results and of a baseline
+        # that only converts the values and recreates their OIDs
+        durations = []
+        baselines = []
+        for _ in range(5):
+            start = time.perf_counter()
+            {
+                "{}.{}".format(
+                    result.oid, result.oid_index
+                ): testimport._convert(result)
+                for result in results
+            }
+            baselines.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            testimport._format_results(results, ".1.3.6.1.2.1.2.2.1")
+            durations.append(time.perf_counter() - start)
+
+        # Filtering the OIDs must cost little more than the conversions
+        self.assertLess(min(durations), 3 * min(baselines))
+
+    def test__oid_match(self):
+        """Testing function _oid_match."""
+        # Initialize key variables
+        nodes = ["1", "3", "6", "1", "2", "1", "2", "2", "1", "2"]
+
+        # Test
+        self.assertTrue(testimport._oid_match(".1.3.6.1.2.1.2.2.1.2", nodes))
+        self.assertTrue(testimport._oid_match(".1.3.6.1.2.1.2.2.1.2.5", nodes))
+        self.assertTrue(testimport._oid_match("1.3.6.1.2.1.2.2.1.2", nodes))
+        self.assertFalse(testimport._oid_match(".1.3.6.1.2.1.2.2.1.20", nodes))
+        self.assertFalse(testimport._oid_match(".1.3.6.1.2.1.2.2.1.3", nodes))
+        self.assertFalse(testimport._oid_match(".1.3.6.1.2.1.1", nodes))
+        self.assertIsNone(testimport._oid_match(".1.3.6.1.2.1.2.2.1", nodes))
 
     def test__convert(self):
         """Testing function _convert."""
-        pass
+        # Initialize key variables
+        expected = [
+            ("OCTETSTR", "Gi1/0/1", b"Gi1/0/1"),
+            ("OPAQUE", "x", b"x"),
+            ("BITS", "x", b"x"),
+            ("IPADDR", "192.168.1.1", b"192.168.1.1"),
+            ("NETADDR", "192.168.1.1", b"192.168.1.1"),
+            ("OBJECTID", ".1.3.6.1", b".1.3.6.1"),
+            ("NOSUCHOBJECT", "", None),
+            ("NOSUCHINSTANCE", "", None),
+            ("ENDOFMIBVIEW", "", None),
+            ("NULL", "", None),
+            ("INTEGER", "1", 1),
+            ("COUNTER32", "2", 2),
+            ("COUNTER64", "18446744073709551615", 18446744073709551615),
+            ("GAUGE", "3", 3),
+            ("TICKS", "4", 4),
+            ("octetstr", "x", b"x"),
+            ("integer", "5", 5),
+        ]
+
+        # Test
+        for snmp_type, value, result in expected:
+            self.assertEqual(
+                testimport._convert(_Variable(".1", "1", value, snmp_type)),
+                result,
+            )
+
+    def test__repetitions_error(self):
+        """Testing function _repetitions_error."""
+        # Test
+        errors = testimport.exceptions
+        self.assertTrue(
+            testimport._repetitions_error(errors.EasySNMPTimeoutError("x"))
+        )
+        self.assertTrue(
+            testimport._repetitions_error(errors.EasySNMPError("tooBig"))
+        )
+        self.assertFalse(
+            testimport._repetitions_error(
+                errors.EasySNMPUnknownObjectIDError("x")
+            )
+        )
 
     def test__oid_valid_format(self):
         """Testing function _oid_valid_format."""
         pass
 
-    def test__update_cache(self):
-        """Testing function _update_cache."""
-        pass
-
 
 if __name__ == "__main__":
     # Do the unit test
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""Test the benchmark module."""
+
+import unittest
+import os
+import sys
+import tempfile
+import json
+import time
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(os.path.join(EXEC_DIR, os.pardir)), os.pardir
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}poller".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+from switchmap.poller import benchmark as testimport
+from switchmap.poller.snmp import snmp_manager
+from switchmap.poller.snmp import IfQuery
+from switchmap.poller.configuration import ConfigPoller
+from switchmap.poller import store
+
+# OIDs used by the tests
+_IFDESCR = ".1.3.6.1.2.1.2.2.1.2"
+_IFNAME = ".1.3.6.1.2.1.31.1.1.1.1"
+
+
+def _capture():
+    """Create a capture of a device with 8 interfaces.
+
+    Args:
+        None
+
+    Returns:
+        result: Capture
+
+    """
+    # Initialize key variables
+    values = {
+        ".1.3.6.1.2.1.1.1.0": ["Test switch", "OCTETSTR"],
+        ".1.3.6.1.2.1.1.2.0": [".1.3.6.1.4.1.9.1.1", "OBJECTID"],
+        ".1.3.6.1.2.1.1.3.0": [1000, "TICKS"],
+        ".1.3.6.1.2.1.1.4.0": ["Contact", "OCTETSTR"],
+        ".1.3.6.1.2.1.1.5.0": ["switch", "OCTETSTR"],
+        ".1.3.6.1.2.1.1.6.0": ["Location", "OCTETSTR"],
+        ".1.3.6.1.2.1.2.1.0": [8, "INTEGER"],
+    }
+    for ifindex in range(1, 9):
+        values["{}.{}".format(_IFDESCR, ifindex)] = [
+            "eth{}".format(ifindex),
+            "OCTETSTR",
+        ]
+        values["{}.{}".format(_IFNAME, ifindex)] = [
+            "eth{}".format(ifindex),
+            "OCTETSTR",
+        ]
+
+    # Return
+    result = {"hostname": "switch", "contexts": {"": values}}
+    return result
+
+
+class TestBenchmark(unittest.TestCase):
+    """Checks all methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def test_timings(self):
+        """Testing class Timings."""
+        # Initialize key variables
+        timings = testimport.Timings()
+
+        # The time of nested calls isn't counted twice
+        outer = timings.start()
+        inner = timings.start()
+        time.sleep(0.02)
+        timings.stop("inner", inner)
+        timings.stop("outer", outer)
+        inner = timings.start()
+        timings.stop("inner", inner)
+
+        result = timings.summary()
+        self.assertEqual(list(result), ["inner", "outer"])
+        self.assertEqual(result["inner"]["calls"], 2)
+        self.assertEqual(result["outer"]["calls"], 1)
+        self.assertGreaterEqual(result["inner"]["seconds"], 0.02)
+        self.assertLess(result["outer"]["seconds"], 0.01)
+
+    def test_run(self):
+        """Testing function run."""
+        # Initialize key variables
+        query = snmp_manager.Interact.query
+        supported = IfQuery.supported
+        stores = store._STORES
+        directory = os.path.join(ConfigPoller().system_directory(), "snmp")
+        files = os.listdir(directory) if os.path.isdir(directory) else []
+
+        # Poll a fleet
+        result = testimport.run(_capture(), 4)
+        self.assertEqual(result["devices"], 4)
+        self.assertEqual(result["polled"], 4)
+        self.assertGreater(result["devices_per_second"], 0)
+        self.assertGreater(result["requests"], 0)
+        self.assertEqual(list(result["latency"]), ["p50", "p95", "p99"])
+        self.assertLessEqual(result["latency"]["p50"], result["latency"]["p99"])
+        self.assertEqual(list(result["stages"]), list(testimport.STAGES))
+        for seconds in result["stages"].values():
+            self.assertGreater(seconds, 0)
+
+        # The time of the MIB query classes and OIDs is reported
+        self.assertEqual(result["queries"]["IfQuery"]["calls"] % 4, 0)
+        self.assertIn(_IFDESCR, ",".join(result["oids"]))
+
+        # The results can be written as JSON
+        with tempfile.NamedTemporaryFile(suffix=".json") as f_handle:
+            testimport.write(result, f_handle.name)
+            with open(f_handle.name) as r_handle:
+                self.assertEqual(json.load(r_handle), result)
+
+        # The original methods are restored
+        self.assertEqual(snmp_manager.Interact.query, query)
+        self.assertEqual(IfQuery.supported, supported)
+        self.assertNotIn("supported", IfQuery.__dict__)
+        self.assertNotIn("system_directory", ConfigPoller.__dict__)
+        self.assertIs(store._STORES, stores)
+
+        # The data of the simulated devices isn't saved with that of the
+        # real ones
+        self.assertEqual(
+            os.listdir(directory) if os.path.isdir(directory) else [], files
+        )
+
+    def test_percentile(self):
+        """Testing function percentile."""
+        # Initialize key variables
+        values = list(range(100, 0, -1))
+
+        # Test
+        self.assertEqual(testimport.percentile(values, 50), 50)
+        self.assertEqual(testimport.percentile(values, 95), 95)
+        self.assertEqual(testimport.percentile(values, 99), 99)
+        self.assertEqual(testimport.percentile(values, 0), 1)
+        self.assertEqual(testimport.percentile([3], 99), 3)
+        self.assertIsNone(testimport.percentile([], 50))
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Test the breaker module."""
+
+import unittest
+import os
+import sys
+import tempfile
+from unittest.mock import patch
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(os.path.join(EXEC_DIR, os.pardir)), os.pardir
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}poller".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+from switchmap.poller import breaker as testimport
+from switchmap.poller.store import Store
+
+
+class TestBreaker(unittest.TestCase):
+    """Checks all methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def setUp(self):
+        """Execute these steps before each test."""
+        # Use a new store for each test
+        directory = tempfile.mkdtemp()
+        self.store = Store(os.path.join(directory, "breaker.yaml"))
+        with patch.object(testimport.store, "store", return_value=self.store):
+            self.breaker = testimport.Breaker(threshold=3, backoff=60)
+
+    def test_failure(self):
+        """Testing function failure."""
+        # Polling isn't backed off before the threshold
+        self.assertEqual(self.breaker.failure("a", now=1000), 0)
+        self.assertEqual(self.breaker.failure("a", now=1000), 0)
+        self.assertEqual(
+            self.store.get("a"), {"failures": 2, "last": 1000, "until": 1000}
+        )
+
+        # The backoff period doubles with each further failure
+        self.assertEqual(self.breaker.failure("a", now=1000), 60)
+        self.assertEqual(self.breaker.failure("a", now=2000), 120)
+        self.assertEqual(self.breaker.failure("a", now=3000), 240)
+        self.assertEqual(
+            self.store.get("a"), {"failures": 5, "last": 3000, "until": 3240}
+        )
+
+        # The backoff period is limited
+        for _ in range(20):
+            result = self.breaker.failure("a", now=3000)
+        self.assertEqual(result, 86400)
+
+    def test_wait(self):
+        """Testing function wait."""
+        # Test
+        self.assertEqual(self.breaker.wait("a", now=1000), 0)
+        for _ in range(3):
+            self.breaker.failure("a", now=1000)
+        self.assertEqual(self.breaker.wait("a", now=1000), 60)
+        self.assertEqual(self.breaker.wait("a", now=1050), 10)
+        self.assertEqual(self.breaker.wait("a", now=2000), 0)
+
+    def test_success(self):
+        """Testing function success."""
+        # Test
+        for _ in range(3):
+            self.breaker.failure("a", now=1000)
+        self.breaker.success("a")
+        self.assertEqual(self.breaker.wait("a", now=1000), 0)
+        self.assertIsNone(self.store.get("a"))
+
+        # Failures are counted from zero again
+        self.assertEqual(self.breaker.failure("a", now=1000), 0)
+
+    def test_status(self):
+        """Testing function status."""
+        # Test
+        self.breaker.failure("a", now=1000)
+        with patch.object(testimport.store, "store", return_value=self.store):
+            result = testimport.status()
+        self.assertEqual(
+            result, {"a": {"failures": 1, "last": 1000, "until": 1000}}
+        )
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
@@ -70,6 +70,104 @@ class Test_ConfigPoller(unittest.TestCase):
         result = self.config.polling_interval()
         self.assertEqual(result, expected)
 
+    def test_ingest_interval(self):
+        """Testing function ingest_interval."""
+        # Run test
+        expected = 98712
+        result = self.config.ingest_interval()
+        self.assertEqual(result, expected)
+
+    def test_polling_jitter(self):
+        """Testing function polling_jitter."""
+        # Run test
+        expected = 0.2
+        result = self.config.polling_jitter()
+        self.assertEqual(result, expected)
+
+    def test_polling_timeout(self):
+        """Testing function polling_timeout."""
+        # Run test
+        expected = 120
+        result = self.config.polling_timeout()
+        self.assertEqual(result, expected)
+
+    def test_breaker_threshold(self):
+        """Testing function breaker_threshold."""
+        # Run test
+        expected = 5
+        result = self.config.breaker_threshold()
+        self.assertEqual(result, expected)
+
+    def test_breaker_backoff(self):
+        """Testing function breaker_backoff."""
+        # Run test
+        expected = 60
+        result = self.config.breaker_backoff()
+        self.assertEqual(result, expected)
+
+    def test_polling_engine(self):
+        """Testing function polling_engine."""
+        # Run test
+        expected = "asyncio"
+        result = self.config.polling_engine()
+        self.assertEqual(result, expected)
+
+    def test_polling_concurrency(self):
+        """Testing function polling_concurrency."""
+        # Run test
+        expected = 250
+        result = self.config.polling_concurrency()
+        self.assertEqual(result, expected)
+
+    def test_zone_concurrency(self):
+        """Testing function zone_concurrency."""
+        # Run test
+        expected = 30
+        result = self.config.zone_concurrency()
+        self.assertEqual(result, expected)
+
+    def test_snmp_adaptive_repetitions(self):
+        """Testing function snmp_adaptive_repetitions."""
+        # Run test
+        expected = True
+        result = self.config.snmp_adaptive_repetitions()
+        self.assertEqual(result, expected)
+
+    def test_snmp_capabilities_interval(self):
+        """Testing function snmp_capabilities_interval."""
+        # Run test
+        expected = 3600
+        result = self.config.snmp_capabilities_interval()
+        self.assertEqual(result, expected)
+
+    def test_snmp_incremental_cycles(self):
+        """Testing function snmp_incremental_cycles."""
+        # Run test
+        expected = 12
+        result = self.config.snmp_incremental_cycles()
+        self.assertEqual(result, expected)
+
+    def test_snmp_context_concurrency(self):
+        """Testing function snmp_context_concurrency."""
+        # Run test
+        expected = 6
+        result = self.config.snmp_context_concurrency()
+        self.assertEqual(result, expected)
+
+    def test_snmp_max_repetitions(self):
+        """Testing function snmp_max_repetitions."""
+        # Run test
+        expected = 40
+        result = self.config.snmp_max_repetitions()
+        self.assertEqual(result, expected)
+
+    def test_snmp_max_sessions(self):
+        """Testing function snmp_max_sessions."""
+        # Run test
+        expected = 12
+        result = self.config.snmp_max_sessions()
+        self.assertEqual(result, expected)
+
     def test_server_address(self):
         """Testing function server_address."""
         # Run test
@@ -98,6 +196,27 @@ class Test_ConfigPoller(unittest.TestCase):
         result = self.config.server_password()
         self.assertEqual(result, expected)
 
+    def test_server_batch_size(self):
+        """Testing function server_batch_size."""
+        # Run test
+        expected = 25
+        result = self.config.server_batch_size()
+        self.assertEqual(result, expected)
+
+    def test_server_batch_interval(self):
+        """Testing function server_batch_interval."""
+        # Run test
+        expected = 5
+        result = self.config.server_batch_interval()
+        self.assertEqual(result, expected)
+
+    def test_server_pool_size(self):
+        """Testing function server_pool_size."""
+        # Run test
+        expected = 20
+        result = self.config.server_pool_size()
+        self.assertEqual(result, expected)
+
     def test_server_url_root(self):
         """Testing function server_url_root."""
         # Run test
@@ -112,6 +231,27 @@ class Test_ConfigPoller(unittest.TestCase):
         result = self.config.server_username()
         self.assertEqual(result, expected)
 
+    def test_spool_concurrency(self):
+        """Testing function spool_concurrency."""
+        # Run test
+        expected = 3
+        result = self.config.spool_concurrency()
+        self.assertEqual(result, expected)
+
+    def test_spool_interval(self):
+        """Testing function spool_interval."""
+        # Run test
+        expected = 30
+        result = self.config.spool_interval()
+        self.assertEqual(result, expected)
+
+    def test_spool_size(self):
+        """Testing function spool_size."""
+        # Run test
+        expected = 64
+        result = self.config.spool_size()
+        self.assertEqual(result, expected)
+
     def test_snmp_auth(self):
         """Testing function snmp_auth."""
         # Run test
@@ -159,13 +299,27 @@ class Test_ConfigPoller(unittest.TestCase):
             ZONE(
                 name="SITE-A",
                 hostnames=["hostname1", "hostname2", "hostname3"],
+                polling_interval=300,
+                hostname_intervals={"hostname2": 60},
             ),
             ZONE(
                 name="SITE-B",
                 hostnames=["hostnameA", "hostnameB", "hostnameC"],
+                polling_interval=None,
+                hostname_intervals={},
+            ),
+            ZONE(
+                name="SITE-C",
+                hostnames=None,
+                polling_interval=None,
+                hostname_intervals={},
+            ),
+            ZONE(
+                name=None,
+                hostnames=None,
+                polling_interval=None,
+                hostname_intervals={},
             ),
-            ZONE(name="SITE-C", hostnames=None),
-            ZONE(name=None, hostnames=None),
         ]
         result = self.config.zones()
         self.assertEqual(result, expected)
@@ -0,0 +1,798 @@
+#!/usr/bin/env python3
+"""Test the poll module."""
+
+import unittest
+import os
+import sys
+import asyncio
+import threading
+import time
+from unittest.mock import Mock, patch
+import tempfile
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(os.path.join(EXEC_DIR, os.pardir)), os.pardir
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}poller".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+from switchmap.poller import poll as testimport
+from switchmap.poller import ZONE
+from switchmap.poller.scheduler import Scheduler
+from switchmap.poller.store import Store
+from switchmap.poller import breaker
+from switchmap.poller.configuration import ConfigPoller
+from switchmap.core import delta
+from switchmap.core import files
+
+
+class _Counter:
+    """Track the number of simultaneous calls per zone."""
+
+    def __init__(self):
+        """Initialize the class.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self.lock = threading.Lock()
+        self.active = {}
+        self.peak = {}
+        self.polled = []
+
+    def device(self, argument):
+        """Simulate a blocking device poll.
+
+        Args:
+            argument: _META object
+
+        Returns:
+            result: True
+
+        """
+        with self.lock:
+            self.active[None] = self.active.get(None, 0) + 1
+            self.active[argument.zone] = self.active.get(argument.zone, 0) + 1
+            for key in [None, argument.zone]:
+                self.peak[key] = max(self.peak.get(key, 0), self.active[key])
+
+        # Block like an SNMP query
+        time.sleep(0.3 if argument.hostname.startswith("slow") else 0.01)
+
+        with self.lock:
+            self.active[None] -= 1
+            self.active[argument.zone] -= 1
+            self.polled.append(argument.hostname)
+
+        # Simulate a poll that fails
+        if argument.hostname == "fail":
+            raise RuntimeError("Poll failed")
+        return True
+
+    def submit(self, argument, done):
+        """Simulate the polling of a device by a worker.
+
+        Args:
+            argument: _META object
+            done: Function to call once polled
+
+        Returns:
+            None
+
+        """
+        threading.Thread(
+            target=testimport._serial, args=(self.device, argument, done)
+        ).start()
+
+
+class _Control(testimport._Control):
+    """Stop polling once a device has been polled enough times."""
+
+    def __init__(
+        self,
+        counter,
+        hostname,
+        polls,
+        interval=0.05,
+        breaker=None,
+        devices=None,
+    ):
+        """Initialize the class.
+
+        Args:
+            counter: _Counter object
+            hostname: Hostname of the device
+            polls: Number of polls of the device
+            interval: Polling interval of the devices
+            breaker: Breaker object
+            devices: List of (zone, hostname) tuples of the devices to poll
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        devices = devices or [
+            ("SITE-A", "fast"),
+            ("SITE-A", "slow"),
+            ("SITE-B", "fail"),
+        ]
+
+        # Initialize key variables
+        testimport._Control.__init__(self, Scheduler(jitter=0), breaker=breaker)
+        self._counter = counter
+        self._hostname = hostname
+        self._polls = polls
+        self.threads = set()
+        self.scheduler.update(
+            {
+                (zone, hostname): (
+                    testimport._META(zone=zone, hostname=hostname, config=None),
+                    interval,
+                )
+                for zone, hostname in devices
+            }
+        )
+
+    def running(self):
+        """Determine whether polling should continue.
+
+        Args:
+            None
+
+        Returns:
+            result: False once the device has been polled enough times
+
+        """
+        with self._counter.lock:
+            result = self._counter.polled.count(self._hostname) < self._polls
+        self.threads.add(threading.current_thread())
+        return result
+
+
+def _breaker(threshold):
+    """Create a Breaker object that saves its state in a temporary file.
+
+    Args:
+        threshold: Number of failures after which polling is backed off
+
+    Returns:
+        result: Breaker object
+
+    """
+    # Initialize key variables
+    filename = os.path.join(tempfile.mkdtemp(), "breaker.yaml")
+
+    # Return
+    with patch.object(breaker.store, "store", return_value=Store(filename)):
+        result = breaker.Breaker(threshold=threshold, backoff=10)
+    return result
+
+
+class _Server:
+    """Server that accepts the changes and batches posted by the poller."""
+
+    def __init__(self, version=True, batch=True):
+        """Initialize the class.
+
+        Args:
+            version: Return the version of the data posted if True
+            batch: Accept batches if True
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self.version = version
+        self.batch = batch
+        self.posts = []
+        self.batches = []
+        self.data = {}
+
+    def post(self, uri, data, config, binary=False):
+        """Accept a post.
+
+        Args:
+            uri: URI for posting
+            data: Data posted
+            config: ConfigPoller object
+            binary: Post compressed binary data if True
+
+        Returns:
+            result: Post named tuple
+
+        """
+        # Accept batches
+        if uri == testimport.API_POLLER_BATCH_URI:
+            if self.batch is False:
+                return Mock(success=False, response=Mock(status_code=404))
+            self.batches.append(data["batch"])
+            results = [self._save(_) for _ in data["batch"]]
+            result = Mock(success=True, response=Mock(status_code=200))
+            result.response.json.return_value = {"results": results}
+            return result
+
+        # Accept the data of a single device
+        self.posts.append(data)
+        item = self._save(data)
+        headers = {}
+        if item["version"] is not None:
+            headers[delta.HEADER] = item["version"]
+        result = Mock(
+            success=item["status"] == 200,
+            response=Mock(status_code=item["status"], headers=headers),
+        )
+        return result
+
+    def _save(self, data):
+        """Save the data of a device.
+
+        Args:
+            data: Data posted
+
+        Returns:
+            result: Dict of the HTTP status and version of the data
+
+        """
+        # Apply the changes
+        if "delta" in data:
+            changes = data["delta"]
+            host = changes["host"]
+            if changes["base"] != delta.version(self.data.get(host)):
+                return {"status": 409, "version": None}
+            data = delta.apply(self.data[host], changes["changes"])
+
+        # Return the version
+        data = delta.canonical(data)
+        self.data[data["misc"]["host"]] = data
+        version = delta.version(data) if self.version is True else None
+        result = {"status": 200, "version": version}
+        return result
+
+
+class TestPollFunctions(unittest.TestCase):
+    """Checks all methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def test__devices_asyncio(self):
+        """Testing function _devices_asyncio."""
+        # Initialize key variables
+        counter = _Counter()
+        arguments = []
+        for zone in ["SITE-A", "SITE-B"]:
+            arguments.extend(
+                testimport._META(
+                    zone=zone,
+                    hostname="{}-{}".format(zone, _),
+                    config=None,
+                )
+                for _ in range(20)
+            )
+        arguments.append(
+            testimport._META(zone="SITE-C", hostname="fail", config=None)
+        )
+
+        # Test
+        asyncio.run(
+            testimport._devices_asyncio(
+                arguments, counter.device, concurrency=6, zone_concurrency=4
+            )
+        )
+
+        # All devices must be polled despite the failure
+        self.assertEqual(
+            sorted(counter.polled), sorted(_.hostname for _ in arguments)
+        )
+
+        # Concurrency limits must be respected
+        self.assertLessEqual(counter.peak[None], 6)
+        self.assertLessEqual(counter.peak["SITE-A"], 4)
+        self.assertLessEqual(counter.peak["SITE-B"], 4)
+        self.assertGreater(counter.peak[None], 1)
+
+    def test__tasks(self):
+        """Testing function _tasks."""
+        # Initialize key variables
+        expected = {
+            ("SITE-A", "hostname1"): 300,
+            ("SITE-A", "hostname2"): 60,
+            ("SITE-A", "hostname3"): 300,
+            ("SITE-B", "hostnameA"): 21600,
+            ("SITE-B", "hostnameB"): 21600,
+            ("SITE-B", "hostnameC"): 21600,
+        }
+
+        config = Mock()
+        config.polling_interval.return_value = 21600
+        config.ingest_interval.return_value = 21600
+        config.zones.return_value = [
+            ZONE(
+                name="SITE-A",
+                hostnames=["hostname1", "hostname2", "hostname3"],
+                polling_interval=300,
+                hostname_intervals={"hostname2": 60},
+            ),
+            ZONE(
+                name="SITE-B",
+                hostnames=["hostnameA", "hostnameB", "hostnameC"],
+                polling_interval=None,
+                hostname_intervals={},
+            ),
+            ZONE(
+                name="SITE-C",
+                hostnames=None,
+                polling_interval=None,
+                hostname_intervals={},
+            ),
+        ]
+
+        # Test
+        with patch.object(testimport.log, "log2warning") as warning:
+            result = testimport._tasks(config)
+        self.assertEqual(
+            {key: interval for key, (_, interval) in result.items()}, expected
+        )
+        for (zone, hostname), (argument, _) in result.items():
+            self.assertEqual(
+                (argument.zone, argument.hostname), (zone, hostname)
+            )
+        warning.assert_not_called()
+
+        # Warn when devices are polled less often than data is ingested
+        config.ingest_interval.return_value = 3600
+        with patch.object(testimport.log, "log2warning") as warning:
+            testimport._tasks(config)
+        warning.assert_called_once()
+        self.assertEqual(warning.call_args[0][0], 2048)
+        self.assertIn("hostnameA", warning.call_args[0][1])
+
+        # The server's ingest_interval is unknown without a server section
+        config.ingest_interval.return_value = None
+        with patch.object(testimport.log, "log2warning") as warning:
+            testimport._tasks(config)
+        warning.assert_not_called()
+
+    def test__serial(self):
+        """Testing function _serial."""
+        # Initialize key variables
+        counter = _Counter()
+        results = []
+        argument = testimport._META(zone="SITE-A", hostname="a", config=None)
+        failure = testimport._META(zone="SITE-A", hostname="fail", config=None)
+
+        # Test
+        def _done(*args, **kwargs):
+            """Record the end of a poll.
+
+            Args:
+                *args: Positional arguments
+                **kwargs: Keyword arguments
+
+            Returns:
+                None
+
+            """
+            results.append((args, kwargs))
+
+        testimport._serial(counter.device, argument, _done)
+        self.assertEqual(results, [((argument, True), {})])
+        testimport._serial(counter.device, failure, _done)
+        self.assertEqual(results[1][0], (failure,))
+        self.assertTrue(isinstance(results[1][1]["error"], RuntimeError))
+
+    def test__schedule(self):
+        """Testing function _schedule."""
+        # Initialize key variables
+        counter = _Counter()
+        control = _Control(counter, "fast", 5, breaker=_breaker(2))
+        start = time.time()
+
+        # Test
+        testimport._schedule(control, counter.submit, 3)
+
+        # The slow device doesn't hold up the polling of the others
+        self.assertGreaterEqual(counter.polled.count("fast"), 5)
+        self.assertLessEqual(counter.polled.count("slow"), 3)
+
+        # The failing device is backed off
+        self.assertEqual(counter.polled.count("fail"), 2)
+        self.assertLess(time.time() - start, 1.5)
+
+        # Concurrency limits must be respected
+        self.assertLessEqual(counter.peak[None], 3)
+
+    def test__schedule_asyncio(self):
+        """Testing function _schedule_asyncio."""
+        # Initialize key variables
+        counter = _Counter()
+        control = _Control(counter, "fast", 5)
+        start = time.time()
+
+        # Test
+        asyncio.run(
+            testimport._schedule_asyncio(
+                control, counter.device, concurrency=3, zone_concurrency=2
+            )
+        )
+
+        # The slow device doesn't hold up the polling of the others
+        self.assertGreaterEqual(counter.polled.count("fast"), 5)
+        self.assertLessEqual(counter.polled.count("slow"), 3)
+        self.assertGreaterEqual(counter.polled.count("fail"), 4)
+        self.assertLess(time.time() - start, 1.5)
+
+        # Concurrency limits must be respected
+        self.assertLessEqual(counter.peak[None], 3)
+        self.assertLessEqual(counter.peak["SITE-A"], 2)
+
+    def test__schedule_asyncio_zones(self):
+        """Testing function _schedule_asyncio with a zone at its limit."""
+        # Initialize key variables
+        counter = _Counter()
+        control = _Control(
+            counter,
+            "fast",
+            5,
+            devices=[("SITE-A", "slow-{}".format(_)) for _ in range(4)]
+            + [("SITE-B", "fast")],
+        )
+        start = time.time()
+
+        # Test
+        asyncio.run(
+            testimport._schedule_asyncio(
+                control, counter.device, concurrency=2, zone_concurrency=1
+            )
+        )
+
+        # The devices waiting for their zone don't hold up the other zones
+        self.assertLess(time.time() - start, 0.6)
+
+        # Batches aren't posted by the thread of the event loop
+        self.assertNotIn(threading.main_thread(), control.threads)
+        self.assertLessEqual(counter.peak["SITE-A"], 1)
+        self.assertLessEqual(counter.peak[None], 2)
+
+    def test__control(self):
+        """Testing functions pop and done of _Control."""
+        # Initialize key variables
+        counter = _Counter()
+        breaker = _breaker(1)
+        control = _Control(counter, "fast", 5, interval=0, breaker=breaker)
+        polled = []
+
+        # Test
+        for _ in range(6):
+            argument = control.pop()
+            if argument is None:
+                break
+            polled.append(argument.hostname)
+            result = argument.hostname != "fail"
+            control.done(argument, result=result)
+
+        # The failing device is backed off after the first failure
+        self.assertEqual(polled.count("fail"), 1)
+        self.assertGreater(breaker.wait("fail"), 0)
+        self.assertEqual(breaker.wait("fast"), 0)
+
+        # Exceptions are failures
+        breaker.success("fail")
+        control.done(
+            testimport._META(zone="SITE-A", hostname="fast", config=None),
+            error=RuntimeError("Poll failed"),
+        )
+        self.assertGreater(breaker.wait("fast"), 0)
+
+    def test_schedule(self):
+        """Testing function schedule."""
+        pass
+
+    def test_devices(self):
+        """Testing function devices."""
+        pass
+
+    def test_device(self):
+        """Testing function device."""
+        pass
+
+    def test__post(self):
+        """Testing function _post."""
+        # Initialize key variables
+        config = ConfigPoller()
+        server = _Server()
+        data = {
+            "misc": {"host": "delta-host", "zone": "SITE-A", "timestamp": 1},
+            "layer1": {
+                1: {"ifAlias": "uplink", "ifOperStatus": 1},
+                2: {"ifAlias": "server", "ifOperStatus": 1},
+            },
+        }
+        filepath = files.base_file(
+            delta.filename("delta-host", "SITE-A"), config
+        )
+        if os.path.isfile(filepath) is True:
+            os.remove(filepath)
+
+        # All the data is posted the first time
+        with patch.object(testimport.rest, "post", side_effect=server.post):
+            testimport._post(data, config)
+        self.assertEqual(server.posts, [delta.canonical(data)])
+        self.assertTrue(os.path.isfile(filepath))
+
+        # Only the changes are posted next
+        data["misc"]["timestamp"] = 2
+        data["layer1"][2]["ifOperStatus"] = 2
+        del data["layer1"][1]
+        with patch.object(testimport.rest, "post", side_effect=server.post):
+            testimport._post(data, config)
+        self.assertEqual(len(server.posts), 2)
+        self.assertEqual(
+            server.posts[-1]["delta"]["changes"],
+            {
+                "set": [
+                    [["misc", "timestamp"], 2],
+                    [["layer1", "2", "ifOperStatus"], 2],
+                ],
+                "delete": [["layer1", "1"]],
+            },
+        )
+        self.assertEqual(server.data["delta-host"], delta.canonical(data))
+
+        # All the data is posted if the server lost the base
+        server.data = {}
+        data["misc"]["timestamp"] = 3
+        with patch.object(testimport.rest, "post", side_effect=server.post):
+            testimport._post(data, config)
+        self.assertEqual(len(server.posts), 4)
+        self.assertIn("delta", server.posts[2])
+        self.assertEqual(server.posts[3], delta.canonical(data))
+        self.assertEqual(server.data["delta-host"], delta.canonical(data))
+
+        # Servers that don't return the version are always sent all the data
+        server = _Server(version=False)
+        for _ in range(2):
+            with patch.object(testimport.rest, "post", side_effect=server.post):
+                testimport._post(data, config)
+            self.assertEqual(server.posts[-1], delta.canonical(data))
+            self.assertFalse(os.path.isfile(filepath))
+        self.assertEqual(len(server.posts), 3)
+
+    def test__complete(self):
+        """Testing function _complete."""
+        # Initialize key variables
+        config = ConfigPoller()
+        data = {
+            "misc": {"host": "spool-host", "zone": "SITE-A", "timestamp": 1},
+            "layer1": {1: {"ifAlias": "uplink"}},
+        }
+        spooled = []
+        removed = []
+        reposts = []
+
+        def _put(_data, name):
+            """Record spooled data.
+
+            Args:
+                _data: Data spooled
+                name: Name of the device
+
+            Returns:
+                None
+
+            """
+            spooled.append((_data, name))
+
+        def _post(uri, _data, _config, binary=False):
+            """Record a failed post.
+
+            Args:
+                uri: URI for posting
+                _data: Data posted
+                _config: ConfigPoller object
+                binary: Post compressed binary data if True
+
+            Returns:
+                result: Post named tuple
+
+            """
+            reposts.append(_data)
+            return Mock(success=False, response=Mock(status_code=503))
+
+        # Test
+        upload = testimport._upload(data, config)
+        with patch.object(
+            testimport.spool.Spool, "put", side_effect=_put
+        ), patch.object(
+            testimport.spool.Spool, "remove", side_effect=removed.append
+        ), patch.object(
+            testimport.rest, "post", side_effect=_post
+        ):
+            # Data is spooled if the server isn't reached or fails
+            for status in [None, 500]:
+                testimport._complete(upload, status, None, config)
+            self.assertEqual(spooled, [(upload.data, upload.name)] * 2)
+
+            # Data the server saved or rejected isn't spooled. The older
+            # data spooled is deleted once the server saved newer data
+            for status in [200, 400]:
+                testimport._complete(upload, status, None, config)
+            self.assertEqual(len(spooled), 2)
+            self.assertEqual(removed, [upload.name])
+
+            # Changes are posted again in full unless the server wasn't
+            # reached
+            upload = upload._replace(body={"delta": {}})
+            testimport._complete(upload, None, None, config)
+            self.assertEqual(reposts, [])
+            testimport._complete(upload, 409, None, config)
+            self.assertEqual(reposts, [upload.data])
+            self.assertEqual(len(spooled), 4)
+
+    def test__batch(self):
+        """Testing class _Batch."""
+        # Initialize key variables
+        config = ConfigPoller()
+        server = _Server()
+        hostnames = ["batch-{}".format(_) for _ in range(5)]
+        filepaths = [
+            files.base_file(delta.filename(_, "SITE-A"), config)
+            for _ in hostnames
+        ]
+        for filepath in filepaths:
+            if os.path.isfile(filepath) is True:
+                os.remove(filepath)
+        with patch.object(config, "server_batch_size", return_value=2):
+            batch = testimport._Batch(config)
+
+        def _data(hostname, timestamp):
+            """Create device data.
+
+            Args:
+                hostname: Hostname of the device
+                timestamp: Timestamp of the poll
+
+            Returns:
+                result: Device data
+
+            """
+            result = {
+                "misc": {
+                    "host": hostname,
+                    "zone": "SITE-A",
+                    "timestamp": timestamp,
+                },
+                "layer1": {1: {"ifAlias": hostname}},
+            }
+            return result
+
+        with patch.object(testimport.rest, "post", side_effect=server.post):
+            # Data is posted once the batch is full
+            batch.add(_data(hostnames[0], 1))
+            self.assertEqual(server.batches, [])
+            batch.add(_data(hostnames[1], 1))
+            self.assertEqual(len(server.batches), 1)
+            self.assertEqual(
+                server.batches[0],
+                [delta.canonical(_data(_, 1)) for _ in hostnames[:2]],
+            )
+
+            # Data is posted once older than server_batch_interval
+            batch.add(_data(hostnames[0], 2))
+            batch.flush(force=False)
+            self.assertEqual(len(server.batches), 1)
+            with patch.object(
+                testimport.time, "time", return_value=time.time() + 10
+            ):
+                batch.flush(force=False)
+            self.assertEqual(len(server.batches), 2)
+
+            # Only the changes are posted
+            self.assertEqual(
+                server.batches[1][0]["delta"]["changes"],
+                {"set": [[["misc", "timestamp"], 2]], "delete": []},
+            )
+            self.assertEqual(
+                server.data[hostnames[0]],
+                delta.canonical(_data(hostnames[0], 2)),
+            )
+
+            # Changes the server can't apply are posted again in full
+            del server.data[hostnames[1]]
+            batch.add(_data(hostnames[1], 3))
+            batch.flush()
+            self.assertIn("delta", server.batches[2][0])
+            self.assertEqual(
+                server.posts, [delta.canonical(_data(hostnames[1], 3))]
+            )
+
+        # Servers without batches are sent each device's data
+        server = _Server(batch=False)
+        with patch.object(testimport.rest, "post", side_effect=server.post):
+            for hostname in hostnames[2:]:
+                batch.add(_data(hostname, 1))
+            batch.flush()
+        self.assertEqual(server.batches, [])
+        self.assertEqual(
+            server.posts, [delta.canonical(_data(_, 1)) for _ in hostnames[2:]]
+        )
+
+        # Cleanup
+        for filepath in filepaths:
+            if os.path.isfile(filepath) is True:
+                os.remove(filepath)
+
+    def test_cli_device(self):
+        """Testing function cli_device."""
+        pass
+
+    def test_cli_breakers(self):
+        """Testing function cli_breakers."""
+        pass
+
+    def test__timestamp(self):
+        """Testing function _timestamp."""
+        # Test
+        result = testimport._timestamp(
+            time.mktime((2024, 3, 1, 8, 5, 9, 0, 0, -1))
+        )
+        self.assertEqual(result, "2024-03-01 08:05:09")
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""Test the scheduler module."""
+
+import unittest
+import os
+import sys
+from unittest.mock import patch
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(os.path.join(EXEC_DIR, os.pardir)), os.pardir
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}poller".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+from switchmap.poller import scheduler as testimport
+
+
+class TestScheduler(unittest.TestCase):
+    """Checks all methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def test_update(self):
+        """Testing function update."""
+        # Initialize key variables
+        scheduler = testimport.Scheduler(jitter=0.1)
+
+        # New devices are due within the jitter of their interval
+        scheduler.update({"a": ("A", 100), "b": ("B", 1000)}, now=0)
+        self.assertLessEqual(scheduler.wait(now=0), 10)
+        self.assertEqual(
+            {scheduler.pop(now=100), scheduler.pop(now=100)}, {"A", "B"}
+        )
+        self.assertIsNone(scheduler.pop(now=100))
+
+        # Removed devices aren't polled again
+        scheduler.update({"b": ("B", 1000)}, now=100)
+        scheduler.done("a", now=110)
+        scheduler.done("b", now=110)
+        self.assertEqual(scheduler.pop(now=10000), "B")
+        self.assertIsNone(scheduler.pop(now=10000))
+        self.assertIsNone(scheduler.wait())
+
+        # Updated intervals are used for the next poll
+        scheduler.update({"b": ("B", 50)}, now=10000)
+        scheduler.done("b", now=10010)
+        self.assertIsNone(scheduler.pop(now=10040))
+        self.assertEqual(scheduler.pop(now=10060), "B")
+
+    def test_pop(self):
+        """Testing function pop."""
+        # Initialize key variables
+        scheduler = testimport.Scheduler(jitter=0)
+        scheduler.update({"slow": ("SLOW", 300), "fast": ("FAST", 60)}, now=0)
+
+        # Devices are returned in the order they are due
+        self.assertEqual(scheduler.pop(now=0), "SLOW")
+        self.assertEqual(scheduler.pop(now=0), "FAST")
+        scheduler.done("fast", now=1)
+
+        # The fast device is polled repeatedly while the slow one is busy
+        for now in [60, 120, 180]:
+            self.assertEqual(scheduler.pop(now=now), "FAST")
+            self.assertIsNone(scheduler.pop(now=now))
+            scheduler.done("fast", now=now + 1)
+
+    def test_done(self):
+        """Testing function done."""
+        # Initialize key variables
+        scheduler = testimport.Scheduler(jitter=0.2)
+        scheduler.update({"a": ("A", 100)}, now=0)
+
+        # The next poll is due an interval after the start of the last one
+        start = scheduler.wait(now=0)
+        self.assertEqual(scheduler.pop(now=start), "A")
+        scheduler.done("a", now=start + 30)
+        self.assertGreaterEqual(scheduler.wait(now=start), 80)
+        self.assertLessEqual(scheduler.wait(now=start), 120)
+
+        # The next poll is due immediately if the poll was too slow
+        self.assertEqual(scheduler.pop(now=start + 200), "A")
+        scheduler.done("a", now=start + 500)
+        self.assertEqual(scheduler.wait(now=start + 500), 0)
+
+        # The next poll can be delayed
+        self.assertEqual(scheduler.pop(now=start + 500), "A")
+        scheduler.done("a", now=start + 510, delay=1000)
+        self.assertAlmostEqual(scheduler.wait(now=start + 510), 1000)
+
+    def test_wait(self):
+        """Testing function wait."""
+        # Initialize key variables
+        scheduler = testimport.Scheduler(jitter=0)
+
+        # Test
+        self.assertIsNone(scheduler.wait(now=0))
+        with patch.object(testimport.random, "uniform", return_value=25):
+            scheduler.update({"a": ("A", 100)}, now=0)
+        self.assertEqual(scheduler.wait(now=10), 15)
+        self.assertEqual(scheduler.wait(now=50), 0)
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
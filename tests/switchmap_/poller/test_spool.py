@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""Test the spool module."""
+
+import unittest
+import os
+import sys
+import tempfile
+import time
+from unittest.mock import Mock
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(os.path.join(EXEC_DIR, os.pardir)), os.pardir
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}poller".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+from switchmap.poller import spool as testimport
+
+
+def _config(size=1, concurrency=2):
+    """Create the configuration of a spool in a new directory.
+
+    Args:
+        size: Maximum size of the spool in megabytes
+        concurrency: Maximum number of posts replayed at the same time
+
+    Returns:
+        result: Mock ConfigPoller object
+
+    """
+    # Return
+    directory = tempfile.mkdtemp()
+    result = Mock()
+    result.system_directory.return_value = directory
+    result.daemon_directory.return_value = directory
+    result.spool_size.return_value = size
+    result.spool_concurrency.return_value = concurrency
+    return result
+
+
+class _Server:
+    """Server that accepts the posts replayed from the spool."""
+
+    def __init__(self, status=200, fail=None):
+        """Initialize the class.
+
+        Args:
+            status: HTTP status of the posts
+            fail: HTTP status of the posts of data whose "fail" key is True.
+                None if the server can't be reached
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self.status = status
+        self.fail = fail
+        self.posts = []
+
+    def post(self, data):
+        """Accept a post.
+
+        Args:
+            data: Data posted
+
+        Returns:
+            result: Post named tuple
+
+        """
+        # Initialize key variables
+        status = self.fail if data.get("fail") is True else self.status
+        self.posts.append(data["id"])
+
+        # Return
+        if status is None:
+            return Mock(success=False, response=False)
+        result = Mock(success=status == 200, response=Mock(status_code=status))
+        return result
+
+
+class TestSpool(unittest.TestCase):
+    """Checks all methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def test_put(self):
+        """Testing function put."""
+        # Initialize key variables
+        spool = testimport.Spool(_config())
+
+        # Test
+        filepaths = [
+            spool.put({"id": _}, "host-{}".format(_)) for _ in range(3)
+        ]
+        self.assertEqual(spool.filepaths(), filepaths)
+        self.assertEqual(
+            [testimport.payload.load(_) for _ in filepaths],
+            [{"id": _} for _ in range(3)],
+        )
+
+        # Only the latest data of a device is kept
+        filepath = spool.put({"id": 3}, "host-1")
+        self.assertEqual(
+            spool.filepaths(), [filepaths[0], filepaths[2], filepath]
+        )
+
+        # Nothing is spooled when disabled
+        spool = testimport.Spool(_config(size=0))
+        self.assertIsNone(spool.put({"id": 0}, "host-0"))
+        self.assertEqual(spool.filepaths(), [])
+
+    def test_remove(self):
+        """Testing function remove."""
+        # Initialize key variables
+        spool = testimport.Spool(_config())
+        filepaths = [
+            spool.put({"id": _}, "host-{}".format(_)) for _ in range(2)
+        ]
+
+        # Test
+        spool.remove("host-0")
+        self.assertEqual(spool.filepaths(), filepaths[1:])
+        spool.remove("host-1", keep=filepaths[1])
+        self.assertEqual(spool.filepaths(), filepaths[1:])
+        spool.remove("host-2")
+        self.assertEqual(spool.filepaths(), filepaths[1:])
+
+    def test_filepaths(self):
+        """Testing function filepaths."""
+        # Initialize key variables
+        spool = testimport.Spool(_config())
+        filepath = spool.put({"id": 0}, "host-0")
+
+        # Files being written are ignored
+        with open("{}.tmp".format(filepath), "w") as f_handle:
+            f_handle.write("")
+        self.assertEqual(spool.filepaths(), [filepath])
+
+    def test_drain(self):
+        """Testing function drain."""
+        # Initialize key variables
+        spool = testimport.Spool(_config(concurrency=2))
+        for _ in range(5):
+            spool.put({"id": _, "fail": _ == 2}, "host-{}".format(_))
+
+        # Draining stops after the round in which the server isn't reached
+        server = _Server(fail=None)
+        self.assertEqual(spool.drain(server.post), 3)
+        self.assertEqual(sorted(server.posts), [0, 1, 2, 3])
+        self.assertEqual(len(spool.filepaths()), 2)
+
+        # Data the server rejects is discarded
+        server = _Server(fail=400)
+        self.assertEqual(spool.drain(server.post), 1)
+        self.assertEqual(sorted(server.posts), [2, 4])
+        self.assertEqual(spool.filepaths(), [])
+
+        # Nothing to do if the spool is empty
+        self.assertEqual(spool.drain(server.post), 0)
+
+    def test_drain_device(self):
+        """Testing function drain with several files of a device."""
+        # Initialize key variables
+        spool = testimport.Spool(_config(concurrency=4))
+        for _ in range(3):
+            testimport.payload.dump(
+                {"id": _},
+                os.path.join(
+                    spool._directory,
+                    "{:020d}-1-host{}".format(_, testimport.payload.EXTENSION),
+                ),
+            )
+
+        # Only the latest data of the device is posted
+        server = _Server()
+        self.assertEqual(spool.drain(server.post), 1)
+        self.assertEqual(server.posts, [2])
+        self.assertEqual(spool.filepaths(), [])
+
+    def test_drain_unavailable(self):
+        """Testing function drain with server errors."""
+        # Initialize key variables
+        spool = testimport.Spool(_config(concurrency=2))
+        for _ in range(4):
+            spool.put({"id": _}, "host-{}".format(_))
+
+        # Data is kept while the server is unavailable
+        for status in [503, 429]:
+            server = _Server(status=status)
+            self.assertEqual(spool.drain(server.post), 0)
+            self.assertEqual(sorted(server.posts), [0, 1])
+            self.assertEqual(len(spool.filepaths()), 4)
+
+    def test__evict(self):
+        """Testing function _evict."""
+        # Initialize key variables
+        spool = testimport.Spool(_config())
+        data = {"id": 0, "data": os.urandom(400 * 1024)}
+
+        # The oldest files are evicted
+        filepaths = [spool.put(data, "host-{}".format(_)) for _ in range(4)]
+        self.assertEqual(spool.filepaths(), filepaths[2:])
+
+    def test__name(self):
+        """Testing function _name."""
+        # Test
+        spool = testimport.Spool(_config())
+        filepath = spool.put({"id": 0}, "host-a-1b2c3")
+        self.assertEqual(testimport._name(filepath), "host-a-1b2c3")
+
+
+class TestDrainer(unittest.TestCase):
+    """Checks all methods."""
+
+    def test_run(self):
+        """Testing function run."""
+        # Initialize key variables
+        spool = testimport.Spool(_config())
+        spool.put({"id": 0}, "host-0")
+        server = _Server()
+
+        # Test
+        drainer = testimport.Drainer(spool, server.post, interval=0.01)
+        drainer.start()
+        for _ in range(500):
+            if bool(spool.filepaths()) is False:
+                break
+            time.sleep(0.01)
+        drainer.stop()
+        self.assertFalse(drainer.is_alive())
+        self.assertEqual(server.posts, [0])
+        self.assertEqual(spool.filepaths(), [])
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
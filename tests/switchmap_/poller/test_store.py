@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Test the store module."""
+
+import unittest
+import os
+import sys
+import tempfile
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(os.path.join(EXEC_DIR, os.pardir)), os.pardir
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}poller".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+from switchmap.poller import store as testimport
+
+
+class TestStore(unittest.TestCase):
+    """Checks all methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def setUp(self):
+        """Create a store file for each test."""
+        # Initialize key variables
+        self.filename = os.path.join(tempfile.mkdtemp(), "test.yaml")
+
+    def test_get(self):
+        """Testing function get."""
+        # Initialize key variables
+        with open(self.filename, "w") as f_handle:
+            f_handle.write("host-1: group-1\n")
+        item = testimport.Store(self.filename)
+
+        # Test
+        self.assertEqual(item.get("host-1"), "group-1")
+        self.assertEqual(item.get("host-2", 25), 25)
+
+        # The file is only read once
+        os.remove(self.filename)
+        self.assertEqual(item.get("host-1"), "group-1")
+
+    def test_data(self):
+        """Testing function data."""
+        # Initialize key variables
+        item = testimport.Store(self.filename)
+        self.assertEqual(item.data(), {})
+
+        # Changing the result doesn't change the store
+        item.update("host-1", 1)
+        result = item.data()
+        result.clear()
+        self.assertEqual(item.data(), {"host-1": 1})
+
+    def test_update(self):
+        """Testing function update."""
+        # Initialize key variables
+        item = testimport.Store(self.filename)
+        item.update("host-1", "group-1")
+        item.update("host-2", {"failures": 2})
+
+        # Simulate an update by another process
+        with open(self.filename, "a") as f_handle:
+            f_handle.write("host-3: group-3\n")
+
+        # Test
+        item.update("host-1", "group-4")
+        expected = {
+            "host-1": "group-4",
+            "host-2": {"failures": 2},
+            "host-3": "group-3",
+        }
+        self.assertEqual(testimport.Store(self.filename).data(), expected)
+        self.assertEqual(item.data(), expected)
+
+        # Delete a value
+        item.update("host-3", None)
+        del expected["host-3"]
+        self.assertEqual(testimport.Store(self.filename).data(), expected)
+        self.assertEqual(item.data(), expected)
+
+    def test_store(self):
+        """Testing function store."""
+        # The same object is shared by the process
+        result = testimport.store("test")
+        self.assertIs(testimport.store("test"), result)
+        self.assertIsNot(testimport.store("other"), result)
+
+    def test__read(self):
+        """Testing function _read."""
+        # Missing and invalid files have no values
+        self.assertEqual(testimport._read(self.filename), {})
+        with open(self.filename, "w") as f_handle:
+            f_handle.write("- list\n")
+        self.assertEqual(testimport._read(self.filename), {})
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
@@ -71,6 +71,79 @@ def _prerequisites():
     return result
 
 
+def _stacked(polled_data, members):
+    """Create the data of a stacked chassis from the data of a device.
+
+    Args:
+        polled_data: Polled data of a device
+        members: Number of devices in the stack
+
+    Returns:
+        result: Polled data of the stack
+
+    """
+    # Initialize key variables
+    result = deepcopy(polled_data)
+    layer1 = result["layer1"]
+    stack = result["system"]["IF-MIB"]["ifStackStatus"]
+
+    # Add the interfaces of the other devices with different ifIndexes
+    for member in range(1, members):
+        offset = member * 100000
+        for ifindex, port_data in polled_data["layer1"].items():
+            layer1[ifindex + offset] = deepcopy(port_data)
+        for ifindex, higherlayers in polled_data["system"]["IF-MIB"][
+            "ifStackStatus"
+        ].items():
+            stack[ifindex + offset] = [
+                _ + offset if bool(_) is True else _ for _ in higherlayers
+            ]
+    return result
+
+
+def _reference(polled_data):
+    """Process polled data the way Device.process did by copying it.
+
+    Args:
+        polled_data: Polled data of a device
+
+    Returns:
+        result: Processed data
+
+    """
+    # Initialize key variables
+    result = deepcopy(polled_data)
+    layer1_data = result["layer1"]
+
+    for ifindex, _port_data in sorted(layer1_data.items()):
+        port_data = deepcopy(_port_data)
+        if testimport._is_ethernet(port_data) is True:
+            port_data["l1_ethernet"] = True
+            try:
+                higherlayers = result["system"]["IF-MIB"]["ifStackStatus"][
+                    ifindex
+                ]
+            except KeyError:
+                higherlayers = []
+            for ifstackhigherlayer in higherlayers:
+                if bool(ifstackhigherlayer) is False:
+                    meta = testimport._process_non_trunk(layer1_data[ifindex])
+                else:
+                    meta = testimport._process_trunk(
+                        layer1_data[ifstackhigherlayer], higherlayers
+                    )
+                port_data["l1_vlans"] = meta.vlan
+                port_data["l1_nativevlan"] = meta.nativevlan
+                port_data["l1_trunk"] = meta.trunk
+            port_data["l1_duplex"] = testimport._duplex(deepcopy(port_data))
+        else:
+            port_data["l1_ethernet"] = False
+        result["layer1"][ifindex] = port_data
+
+    # Return
+    return result
+
+
 class TestPollUpdateDevice(unittest.TestCase):
     """Checks all functions and methods."""
 
@@ -109,6 +182,20 @@ class TestPollUpdateDevice(unittest.TestCase):
         expected = data.polled_data(strip=False)
         self.assertEqual(result, expected)
 
+    def test_process_equivalence(self):
+        """Testing function process against processing a copy."""
+        # Test the data of a device and of a stacked chassis
+        for polled_data in [
+            deepcopy(self.polled_data),
+            _stacked(self.polled_data, 4),
+        ]:
+            original = deepcopy(polled_data)
+            result = testimport.Device(polled_data).process()
+            self.assertEqual(result, _reference(original))
+
+            # The polled data isn't changed
+            self.assertEqual(polled_data, original)
+
 
 class TestSuite(unittest.TestCase):
     """Checks all functions and methods."""
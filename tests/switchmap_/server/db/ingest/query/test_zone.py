@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Test the zone module."""
+
+import os
+import sys
+import unittest
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(
+                    os.path.join(
+                        os.path.abspath(
+                            os.path.join(
+                                os.path.abspath(
+                                    os.path.join(
+                                        os.path.abspath(
+                                            os.path.join(EXEC_DIR, os.pardir)
+                                        ),
+                                        os.pardir,
+                                    )
+                                ),
+                                os.pardir,
+                            )
+                        ),
+                        os.pardir,
+                    )
+                ),
+                os.pardir,
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = """\
+{0}switchmap-ng{0}tests{0}switchmap_{0}server{0}db{0}ingest{0}query""".format(
+    os.sep
+)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+from switchmap.core import general
+from switchmap.server.db.table import mac
+from switchmap.server.db.table import ip
+from switchmap.server.db.table import macport
+from switchmap.server.db.table import macip
+from switchmap.server.db.table import ipport
+from switchmap.server.db import models
+
+from tests.testlib_ import db
+
+from switchmap.server.db.ingest.query import zone as testimport
+
+
+class TestFunctions(unittest.TestCase):
+    """Checks all functions and methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+    prerequisites = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting each test."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+        # Create database tables
+        models.create_all_tables()
+
+        # Pollinate db with prerequisites
+        cls.prerequisites = db.populate()
+        cls.idx_zone = cls.prerequisites.macs[0].idx_zone
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps after each tests is completed."""
+        # Drop tables
+        database = db.Database()
+        database.drop()
+
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def test_macs(self):
+        """Testing function macs."""
+        # Initialize key variables
+        expected = {}
+
+        # Prepare data for testing
+        for item in self.prerequisites.macs:
+            address = general.mac(item.mac).mac
+            expected[address] = mac.exists(self.idx_zone, address).idx_mac
+
+        # Test
+        result = testimport.macs(self.idx_zone)
+        self.assertEqual(result, expected)
+        self.assertEqual(testimport.macs(self.idx_zone + 1), {})
+
+    def test_ips(self):
+        """Testing function ips."""
+        # Initialize key variables
+        expected = {}
+
+        # Prepare data for testing
+        for item in self.prerequisites.ips:
+            address = general.ipaddress(item.address).address
+            expected[address] = ip.exists(self.idx_zone, address).idx_ip
+
+        # Test
+        result = testimport.ips(self.idx_zone)
+        self.assertEqual(result, expected)
+        self.assertEqual(testimport.ips(self.idx_zone + 1), {})
+
+    def test_macips(self):
+        """Testing function macips."""
+        # Initialize key variables
+        expected = {}
+
+        # Each MAC address was paired with the IP address of the same index
+        for key in range(len(self.prerequisites.macs)):
+            row = macip.exists(key + 1, key + 1)
+            expected[(key + 1, key + 1)] = row.idx_macip
+
+        # Test
+        result = testimport.macips(self.idx_zone)
+        self.assertEqual(result, expected)
+        self.assertEqual(testimport.macips(self.idx_zone + 1), {})
+
+    def test_macports(self):
+        """Testing function macports."""
+        # Initialize key variables
+        expected = {}
+
+        # Prepare data for testing
+        for key in range(len(self.prerequisites.macs)):
+            rows = macport.find_idx_mac(key + 1)
+            if bool(rows) is True:
+                expected[key + 1] = sorted(_.idx_l1interface for _ in rows)
+
+        # Test
+        result = testimport.macports(self.idx_zone)
+        self.assertEqual(
+            {key: sorted(value) for key, value in result.items()}, expected
+        )
+        self.assertEqual(testimport.macports(self.idx_zone + 1), {})
+
+    def test_ipports(self):
+        """Testing function ipports."""
+        # Initialize key variables
+        expected = {}
+
+        # Prepare data for testing
+        for item in self.prerequisites.ipports:
+            row = ipport.exists(item.idx_l1interface, item.idx_ip)
+            expected[(item.idx_l1interface, item.idx_ip)] = row.idx_ipport
+
+        # Test
+        result = testimport.ipports(self.idx_zone)
+        self.assertEqual(result, expected)
+        self.assertEqual(testimport.ipports(self.idx_zone + 1), {})
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
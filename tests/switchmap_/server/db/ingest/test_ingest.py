@@ -5,9 +5,11 @@ import os
 import sys
 import unittest
 from copy import deepcopy
+from functools import partial
 
 
 from sqlalchemy import select
+from sqlalchemy import event as orm_event
 
 # Try to create a working PYTHONPATH
 EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
@@ -64,15 +66,27 @@ from switchmap.server.db.ingest.update import device as device_update
 from switchmap.server.db.ingest.update import zone as zone_update
 from switchmap.server.db.ingest import update as testimport
 from switchmap.server.db.ingest import ingest
+from switchmap.server.db.ingest.query import zone as query_zone
 from switchmap.server.db.table import zone
 from switchmap.server.db.table import oui
 from switchmap.server.db.table import event
+from switchmap.server.db.table import root
+from switchmap.server.db.table import ip
+from switchmap.server.db.table import macip
+from switchmap.server.db.table import ipport
 from switchmap.server.db import db
+from switchmap.server.db import ENGINE
 from switchmap.server.db import models
 from switchmap.server.db.models import IpPort
 from switchmap.server.db.table import RIpPort
 from switchmap.server.db.table import IZone
 from switchmap.server.db.table import IOui
+from switchmap.server.db.table import IRoot
+from switchmap.server.db.table import IIp
+from switchmap.server.db.table import IMacIp
+from switchmap.server.db.table import IIpPort
+from switchmap.server.configuration import ConfigServer
+from switchmap.core import payload
 
 from tests.testlib_ import db as dblib
 from tests.testlib_ import data as datalib
@@ -148,6 +162,65 @@ def _reset_db():
     return result
 
 
+def _zone_objects():
+    """Get the zone data of the polled data.
+
+    Args:
+        None
+
+    Returns:
+        result: ZoneObjects object
+
+    """
+    # Return
+    _device = device.Device(_polled_data())
+    result = zone_update.Topology(_device.process(), 1, dns=False).process()
+    return result
+
+
+def _queries(function, items):
+    """Count the database queries made by a function.
+
+    Args:
+        function: Function
+        items: Argument of the function
+
+    Returns:
+        result: Number of queries
+
+    """
+    # Initialize key variables
+    statements = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        """Count a query.
+
+        Args:
+            conn: Connection
+            cursor: DBAPI cursor
+            statement: SQL statement
+            parameters: Parameters of the statement
+            context: Execution context
+            executemany: True if executemany() is used
+
+        Returns:
+            None
+
+        """
+        statements.append(statement)
+
+    # Call the function
+    orm_event.listen(ENGINE, "before_cursor_execute", _count)
+    try:
+        function(items)
+    finally:
+        orm_event.remove(ENGINE, "before_cursor_execute", _count)
+
+    # Return
+    result = len(statements)
+    return result
+
+
 class TestFunctions(unittest.TestCase):
     """Checks all functions and methods."""
 
@@ -174,6 +247,217 @@ class TestFunctions(unittest.TestCase):
         # Cleanup the
         CONFIG.cleanup()
 
+    def test__recent(self):
+        """Testing function _recent."""
+        # Every ingest is a snapshot without an interval
+        self.assertFalse(ingest._recent(0))
+
+        # Nothing has been ingested while the root points to the first event
+        self.assertFalse(ingest._recent(3600))
+
+        # Recent events are used
+        _event = event.create()
+        root.update_row(
+            1, IRoot(idx_event=_event.idx_event, name=_event.name, enabled=1)
+        )
+        self.assertEqual(ingest._recent(3600), _event)
+        self.assertFalse(ingest._recent(0))
+
+    def test__new_macs(self):
+        """Testing function _new_macs."""
+        # The MAC addresses inserted when resetting the database exist
+        rows = _zone_objects().macs
+        self.assertTrue(rows)
+        self.assertEqual(ingest._new_macs(rows), [])
+
+        # New MAC addresses don't
+        row = rows[0]._replace(mac=datalib.mac())
+        self.assertEqual(ingest._new_macs([row]), [row])
+
+    def test__new_ips(self):
+        """Testing function _new_ips."""
+        # The IP addresses inserted when resetting the database exist
+        rows = _zone_objects().ips
+        self.assertTrue(rows)
+        self.assertEqual(ingest._new_ips(rows), [])
+
+        # New IP addresses don't
+        row = rows[0]._replace(address=datalib.ipv4())
+        self.assertEqual(ingest._new_ips([row]), [row])
+
+        # The hostnames of existing IP addresses are updated
+        row = rows[0]._replace(hostname="changed.example.org")
+        self.assertEqual(ingest._new_ips([row]), [])
+        result = ip.findip(self.idx_zone, row.address)
+        self.assertEqual(result[0].hostname, "changed.example.org")
+
+    def test_insert_macips(self):
+        """Testing function insert_macips."""
+        # The pairs are resolved with a fixed number of queries per zone,
+        # not with three queries per pair
+        pairs = self.pairmacips
+        self.assertTrue(len(pairs) > 1)
+        existing = query_zone.macips(self.idx_zone)
+        self.assertTrue(len(existing) > 1)
+
+        # Pairs aren't deleted unless all the devices of the zone are
+        # ingested
+        ingest.insert_macips(pairs[:1])
+        self.assertEqual(set(query_zone.macips(self.idx_zone)), set(existing))
+
+        # A single pair deletes the pairs that weren't found in one query
+        function = partial(ingest.insert_macips, complete={self.idx_zone})
+        single = _queries(function, pairs[:1])
+        self.assertEqual(len(query_zone.macips(self.idx_zone)), 1)
+
+        # Which the other pairs reinsert in one query
+        multiple = _queries(function, pairs)
+        self.assertEqual(single, multiple)
+        self.assertTrue(multiple < len(pairs) * 3)
+        self.assertEqual(set(query_zone.macips(self.idx_zone)), set(existing))
+
+    def test_insert_ipports(self):
+        """Testing function insert_ipports."""
+        # The pairs are resolved with a fixed number of queries per zone,
+        # not with queries for each pair and port
+        pairs = self.pairmacips
+        self.assertTrue(len(pairs) > 1)
+        single = _queries(ingest.insert_ipports, pairs[:1])
+        multiple = _queries(ingest.insert_ipports, pairs)
+        self.assertEqual(single, multiple)
+        self.assertTrue(multiple < len(pairs) * 3)
+
+    def test_process_incremental(self):
+        """Testing function process with incremental ingests."""
+        # Carry the data of the most recent event forward
+        _config = setup.config()
+        _config.metadata.config["server"]["ingest_snapshot_interval"] = 3600
+        _config.metadata.config["server"]["purge_after_ingest"] = False
+        _config.save()
+        config = ConfigServer()
+        filepath = os.path.join(
+            config.cache_directory(), "device-01{}".format(payload.EXTENSION)
+        )
+        data = device.Device(_polled_data()).process()
+
+        # The first ingest creates an event
+        payload.dump(data, filepath)
+        ingest.Ingest(config).process()
+        recent = event.current()
+        self.assertTrue(recent)
+        idx_zone = zone.exists(recent.idx_event, data["misc"]["zone"]).idx_zone
+        macips = query_zone.macips(idx_zone)
+        ipports = query_zone.ipports(idx_zone)
+        self.assertTrue(macips)
+        self.assertTrue(ipports)
+
+        # Add pairs that the next ingest won't find
+        address = datalib.ipv4()
+        ip.insert_row(
+            IIp(
+                idx_zone=idx_zone,
+                address=address,
+                hostname=None,
+                version=4,
+                enabled=1,
+            )
+        )
+        idx_ip = ip.exists(idx_zone, address).idx_ip
+        macip.insert_row(
+            IMacIp(idx_mac=sorted(macips)[0][0], idx_ip=idx_ip, enabled=1)
+        )
+        ipport.insert_row(
+            IIpPort(
+                idx_l1interface=sorted(ipports)[0][0], idx_ip=idx_ip, enabled=1
+            )
+        )
+        self.assertEqual(len(query_zone.macips(idx_zone)), len(macips) + 1)
+        self.assertEqual(len(query_zone.ipports(idx_zone)), len(ipports) + 1)
+
+        # The second ingest uses the same event, keeps the existing pairs and
+        # deletes the ones it didn't find
+        payload.dump(data, filepath)
+        ingest.Ingest(config).process()
+        self.assertEqual(event.current(), recent)
+        self.assertEqual(
+            zone.exists(recent.idx_event, data["misc"]["zone"]).idx_zone,
+            idx_zone,
+        )
+        self.assertEqual(query_zone.macips(idx_zone), macips)
+        self.assertEqual(query_zone.ipports(idx_zone), ipports)
+
+    def test_process_incremental_devices(self):
+        """Testing function process with incremental ingests of a device."""
+        # Carry the data of the most recent event forward
+        _config = setup.config()
+        _config.metadata.config["server"]["ingest_snapshot_interval"] = 3600
+        _config.metadata.config["server"]["purge_after_ingest"] = False
+        _config.save()
+        config = ConfigServer()
+        data = device.Device(_polled_data()).process()
+
+        # The second device has no ARP table
+        other = deepcopy(data)
+        other["misc"]["host"] = "{}-other".format(data["misc"]["host"])
+        other["layer3"].pop("ipNetToMediaTable", None)
+        other["layer3"].pop("ipNetToPhysicalPhysAddress", None)
+
+        # The first ingest has both devices
+        for name, item in [("device-01", data), ("device-02", other)]:
+            payload.dump(
+                item,
+                os.path.join(
+                    config.cache_directory(),
+                    "{}{}".format(name, payload.EXTENSION),
+                ),
+            )
+        ingest.Ingest(config).process()
+        recent = event.current()
+        idx_zone = zone.exists(recent.idx_event, data["misc"]["zone"]).idx_zone
+        macips = query_zone.macips(idx_zone)
+        ipports = query_zone.ipports(idx_zone)
+        self.assertTrue(macips)
+        self.assertTrue(ipports)
+
+        # Ingesting only the second device keeps the pairs of the first
+        payload.dump(
+            other,
+            os.path.join(
+                config.cache_directory(),
+                "device-02{}".format(payload.EXTENSION),
+            ),
+        )
+        ingest.Ingest(config).process()
+        self.assertEqual(event.current(), recent)
+        self.assertEqual(query_zone.macips(idx_zone), macips)
+        self.assertEqual(query_zone.ipports(idx_zone), ipports)
+
+    def test__complete(self):
+        """Testing function _complete."""
+        # Initialize key variables
+        data = device.Device(_polled_data()).process()
+        device_update.device(self.idx_zone, data)
+        other = deepcopy(data)
+        other["misc"]["host"] = "{}-other".format(data["misc"]["host"])
+
+        # Test
+        self.assertEqual(
+            ingest._complete([[self.idx_zone, data, None, None]]),
+            {self.idx_zone},
+        )
+        self.assertEqual(
+            ingest._complete([[self.idx_zone, other, None, None]]), set()
+        )
+        self.assertEqual(
+            ingest._complete(
+                [
+                    [self.idx_zone, other, None, None],
+                    [self.idx_zone, data, None, None],
+                ]
+            ),
+            {self.idx_zone},
+        )
+
     def test_ipport(self):
         """Testing function ipport."""
         # Initialize key variables
@@ -72,6 +72,7 @@ from switchmap.server.db.ingest import ingest
 from switchmap.server.db.table import zone
 from switchmap.server.db.table import oui
 from switchmap.server.db.table import event
+from switchmap.server.db.table import vlan
 from switchmap.server.db import db
 from switchmap.server.db import models
 from switchmap.server.db.models import VlanPort
@@ -82,6 +83,7 @@ from switchmap.server.db.models import Device
 from switchmap.server.db.table import RMacPort
 from switchmap.server.db.table import RVlanPort
 from switchmap.server.db.table import RVlan
+from switchmap.server.db.table import IVlan
 from switchmap.server.db.table import RL1Interface
 from switchmap.server.db.table import RDevice
 from switchmap.server.db.table import IZone
@@ -160,6 +162,28 @@ def _reset_db():
     ingest.insert_arptable(_zone.process(), test=True)
 
 
+def _snapshot(model):
+    """Get the rows of a table.
+
+    Args:
+        model: Table model
+
+    Returns:
+        result: List of rows sorted by primary key
+
+    """
+    # Initialize key variables
+    columns = [_.name for _ in model.__table__.columns]
+
+    # Get the rows
+    rows = db.db_select_row(2035, select(model))
+    result = sorted(
+        (tuple(getattr(row, _) for _ in columns) for row in rows),
+        key=lambda _: _[0],
+    )
+    return result
+
+
 class TestPollUpdateTopologyFunctions(unittest.TestCase):
     """Checks all functions and methods."""
 
@@ -260,6 +284,28 @@ class TestPollUpdateTopologyFunctions(unittest.TestCase):
             )
         self.assertEqual(result[: self.max_loops], expected)
 
+    def test__modified(self):
+        """Testing function _modified."""
+        # Initialize key variables
+        row = IVlan(idx_device=1, vlan=2, name=None, state=0, enabled=1)
+        current = RVlan(
+            idx_vlan=1,
+            idx_device=1,
+            vlan=2,
+            name=None,
+            state=0,
+            enabled=b"\x01",
+            ts_modified=None,
+            ts_created=None,
+        )
+
+        # Test
+        self.assertFalse(testimport._modified(current, row))
+        self.assertTrue(testimport._modified(current._replace(vlan=3), row))
+        self.assertTrue(
+            testimport._modified(current._replace(enabled=b"\x00"), row)
+        )
+
 
 class TestPollUpdateTopologyClasses(unittest.TestCase):
     """Checks all functions and methods."""
@@ -289,7 +335,44 @@ class TestPollUpdateTopologyClasses(unittest.TestCase):
 
     def test_process(self):
         """Testing function process."""
-        pass
+        # Initialize key variables
+        tables = [L1Interface, Vlan, VlanPort, MacPort]
+
+        # Process the device
+        _device = device.Device(_polled_data())
+        data = _device.process()
+        exists = testimport.device(self.idx_zone, data)
+        testimport.Topology(exists, data).process()
+        before = [_snapshot(_) for _ in tables]
+        self.assertTrue(before[0])
+
+        # Processing the same data again carries the rows forward unchanged
+        testimport.Topology(exists, data).process()
+        self.assertEqual([_snapshot(_) for _ in tables], before)
+
+        # Changed VLANs are updated
+        row = vlan.vlans(exists.idx_device)[0]
+        vlan.update_row(
+            row.idx_vlan,
+            IVlan(
+                idx_device=row.idx_device,
+                vlan=row.vlan,
+                name="changed",
+                state=1,
+                enabled=1,
+            ),
+        )
+        testimport.Topology(exists, data).process()
+        result = vlan.idx_exists(row.idx_vlan)
+        self.assertEqual((result.name, result.state), (row.name, row.state))
+
+        # The rows of interfaces no longer found are deleted
+        ifindex = sorted(data["layer1"])[0]
+        del data["layer1"][ifindex]
+        testimport.Topology(exists, data).process()
+        ifindexes = [_.ifindex for _ in _snapshot(L1Interface)]
+        self.assertNotIn(ifindex, ifindexes)
+        self.assertEqual(len(ifindexes), len(data["layer1"]))
 
     def test_l1interface(self):
         """Testing function l1interface."""
@@ -58,6 +58,7 @@ CONFIG.save()
 
 from switchmap.server.db.table import event as testimport
 from switchmap.server.db.table import IEvent
+from switchmap.server.db.table import IRoot
 from switchmap.server.db.table import root
 from switchmap.server.db import models
 
@@ -300,6 +301,32 @@ class TestDbTableEvent(unittest.TestCase):
                 result = testimport.idx_exists(item.idx_event)
                 self.assertTrue(result)
 
+    def test_current(self):
+        """Testing function current."""
+        # Initialize key variables
+        original = root.idx_exists(1)
+
+        # Nothing has been ingested while the root points to the first event
+        root.update_row(1, IRoot(idx_event=1, name=original.name, enabled=1))
+        self.assertFalse(testimport.current())
+
+        # Point the root to a new event
+        _event = testimport.create()
+        root.update_row(
+            1, IRoot(idx_event=_event.idx_event, name=original.name, enabled=1)
+        )
+        self.assertEqual(testimport.current(), _event)
+
+        # Restore the root
+        root.update_row(
+            1,
+            IRoot(
+                idx_event=original.idx_event,
+                name=original.name,
+                enabled=original.enabled,
+            ),
+        )
+
     def test_purge(self):
         """Testing function purge."""
         # Create additional events
@@ -247,6 +247,26 @@ class TestDbTableIpPort(unittest.TestCase):
                 self.assertTrue(result)
                 self.assertEqual(_convert(result), _convert(updated_row))
 
+    def test_delete_row(self):
+        """Testing function delete_row."""
+        # Create a record that does not exist
+        row = _row()
+        result = testimport.exists(row.idx_l1interface, row.idx_ip)
+        self.assertFalse(result)
+
+        # Insert the row
+        testimport.insert_row(row)
+        result = testimport.exists(row.idx_l1interface, row.idx_ip)
+        self.assertTrue(result)
+
+        # Test after deletion of the row
+        testimport.delete_row([result.idx_ipport])
+        result = testimport.exists(row.idx_l1interface, row.idx_ip)
+        self.assertFalse(result)
+
+        # Deleting nothing does nothing
+        testimport.delete_row([])
+
     def test__row(self):
         """Testing function _row."""
         # This function is tested by all the other tests
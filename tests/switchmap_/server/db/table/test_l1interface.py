@@ -269,6 +269,24 @@ class TestDbTableL1interface(unittest.TestCase):
         self.assertTrue(result)
         self.assertEqual(_convert(result), _convert(updated_row))
 
+    def test_delete_row(self):
+        """Testing function delete_row."""
+        # Create record
+        row = _row()
+
+        # Insert the row
+        testimport.insert_row(row)
+        result = testimport.exists(row.idx_device, row.ifindex)
+        self.assertTrue(result)
+
+        # Test after deletion of the row
+        testimport.delete_row([result.idx_l1interface])
+        result = testimport.exists(row.idx_device, row.ifindex)
+        self.assertFalse(result)
+
+        # Deleting nothing does nothing
+        testimport.delete_row([])
+
     def test__row(self):
         """Testing function _row."""
         # This function is tested by all the other tests
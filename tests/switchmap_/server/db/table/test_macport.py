@@ -235,6 +235,29 @@ class TestDbTableMacPort(unittest.TestCase):
         self.assertTrue(result)
         self.assertEqual(_convert(result), _convert(updated_row))
 
+    def test_delete_row(self):
+        """Testing function delete_row."""
+        # Find a row combination that does not exist
+        while True:
+            # Create record
+            row = _row()
+            result = testimport.exists(row.idx_l1interface, row.idx_mac)
+            if bool(result) is False:
+                break
+
+        # Insert the row
+        testimport.insert_row(row)
+        result = testimport.exists(row.idx_l1interface, row.idx_mac)
+        self.assertTrue(result)
+
+        # Test after deletion of the row
+        testimport.delete_row([result.idx_macport])
+        result = testimport.exists(row.idx_l1interface, row.idx_mac)
+        self.assertFalse(result)
+
+        # Deleting nothing does nothing
+        testimport.delete_row([])
+
     def test__row(self):
         """Testing function _row."""
         # This function is tested by all the other tests
@@ -56,6 +56,8 @@ CONFIG.save()
 
 from switchmap.server.db.table import oui as testimport
 from switchmap.server.db.table import IOui
+from switchmap.server.db.models import Oui
+from switchmap.server.db.db import db_insert_all
 from switchmap.server.db import models
 
 from tests.testlib_ import db
@@ -229,6 +231,60 @@ class TestDbTableOui(unittest.TestCase):
         for key, result in enumerate(results):
             self.assertEqual(_convert(result), _convert(inserts[key]))
 
+    def test_lookup(self):
+        """Testing function lookup."""
+        # Create record
+        row = _row()
+        testimport.insert_row(row)
+        exists = testimport.exists(row.oui)
+
+        # Test
+        result = testimport.lookup()
+        self.assertEqual(result[row.oui], exists.idx_oui)
+        self.assertEqual(len(result), len(testimport.ouis()))
+
+        # The values are only read once
+        self.assertIs(testimport.lookup(), result)
+
+        # Inserts and updates invalidate the values
+        testimport.insert_row(_row())
+        self.assertIsNot(testimport.lookup(), result)
+
+    def test_refresh(self):
+        """Testing function refresh."""
+        # Load the values
+        testimport.insert_row(_row())
+        result = testimport.lookup()
+
+        # Nothing changed
+        testimport.refresh()
+        self.assertIs(testimport.lookup(), result)
+
+        # Changes by other processes are detected
+        row = _row()
+        db_insert_all(
+            2043,
+            Oui,
+            [dict(oui=row.oui.encode(), organization=b"", enabled=1)],
+        )
+        self.assertNotIn(row.oui, testimport.lookup())
+        testimport.refresh()
+        self.assertIn(row.oui, testimport.lookup())
+
+    def test_invalidate(self):
+        """Testing function invalidate."""
+        # Test
+        result = testimport.lookup()
+        testimport.invalidate()
+        self.assertIsNot(testimport.lookup(), result)
+
+    def test__version(self):
+        """Testing function _version."""
+        # Test
+        before = testimport._version()
+        testimport.insert_row(_row())
+        self.assertEqual(testimport._version()[0], before[0] + 1)
+
     def test__row(self):
         """Testing function _row."""
         # This function is tested by all the other tests
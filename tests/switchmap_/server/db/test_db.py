@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Test the db module."""
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(
+                    os.path.join(
+                        os.path.abspath(os.path.join(EXEC_DIR, os.pardir)),
+                        os.pardir,
+                    )
+                ),
+                os.pardir,
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = """\
+{0}switchmap-ng{0}tests{0}switchmap_{0}server{0}db""".format(
+    os.sep
+)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+from switchmap.server.db import db as testimport
+from switchmap.server.db.table import oui
+from switchmap.server.db.models import Oui
+from switchmap.server.db import models
+
+from tests.testlib_ import db
+from tests.testlib_ import data
+
+
+class TestDb(unittest.TestCase):
+    """Checks all functions and methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+        # Create database tables
+        models.create_all_tables()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Drop tables
+        database = db.Database()
+        database.drop()
+
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def test_db_insert_all(self):
+        """Testing function db_insert_all."""
+        # Initialize key variables
+        error_code = 2041
+        rows = [_row() for _ in range(testimport.INSERT_CHUNK_SIZE + 5)]
+
+        # Test insertion in more than one chunk
+        result = testimport.db_insert_all(error_code, Oui, rows)
+        self.assertTrue(result)
+        for row in rows:
+            found = oui.exists(row["oui"].decode())
+            self.assertTrue(found)
+            self.assertEqual(found.organization, row["organization"].decode())
+
+        # Test that rows with existing keys update them
+        updates = [
+            dict(
+                oui=row["oui"],
+                organization=data.random_string().encode(),
+                enabled=row["enabled"],
+            )
+            for row in rows[:2]
+        ]
+        self.assertTrue(testimport.db_insert_all(error_code, Oui, updates))
+        for row in updates:
+            found = oui.exists(row["oui"].decode())
+            self.assertEqual(found.organization, row["organization"].decode())
+
+        # Test without rows
+        self.assertTrue(testimport.db_insert_all(error_code, Oui, []))
+
+        # Failures are reported with the error code of the caller
+        with patch.object(testimport.log, "log2exception_die") as die:
+            result = testimport.db_insert_all(error_code, Oui, [dict(bad=True)])
+        self.assertFalse(result)
+        self.assertEqual(die.call_args[0][0], error_code)
+
+
+def _row():
+    """Create a Oui table row.
+
+    Args:
+        None
+
+    Returns:
+        result: Dict of column values
+
+    """
+    # Return
+    result = dict(
+        oui=data.random_string().encode(),
+        organization=data.random_string().encode(),
+        enabled=1,
+    )
+    return result
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
@@ -69,6 +69,15 @@ class Test_ConfigServer(unittest.TestCase):
         result = self.config.api_bind_port()
         self.assertEqual(result, expected)
 
+    def test_base_directory(self):
+        """Testing function base_directory."""
+        # Run test
+        expected = "{0}{1}cache{1}base".format(
+            self.config.system_directory(), os.sep
+        )
+        result = self.config.base_directory()
+        self.assertEqual(result, expected)
+
     def test_cache_directory(self):
         """Testing function cache_directory."""
         # Run test
@@ -90,6 +99,13 @@ class Test_ConfigServer(unittest.TestCase):
         result = self.config.db_name()
         self.assertEqual(result, expected)
 
+    def test_db_insert_chunk_size(self):
+        """Testing function db_insert_chunk_size."""
+        # Run test
+        expected = 1000
+        result = self.config.db_insert_chunk_size()
+        self.assertEqual(result, expected)
+
     def test_db_max_overflow(self):
         """Testing function db_max_overflow."""
         # Run test
@@ -134,6 +150,13 @@ class Test_ConfigServer(unittest.TestCase):
         result = self.config.ingest_interval()
         self.assertEqual(result, expected)
 
+    def test_ingest_snapshot_interval(self):
+        """Testing function ingest_snapshot_interval."""
+        # Run test
+        expected = 3600
+        result = self.config.ingest_snapshot_interval()
+        self.assertEqual(result, expected)
+
     def test_purge_after_ingest(self):
         """Testing function purge_after_ingest."""
         # Run test
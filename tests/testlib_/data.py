@@ -64,6 +64,7 @@ server:
   api_password: z2vucEsOP3s1Rep6LSwe
   api_https: False
   ingest_interval: 98712
+  ingest_snapshot_interval: 3600
   purge_after_ingest: False
   db_host: Mwxu7gnv29AbLGyz
   db_name: JkfSJnhZTh55wJy4
@@ -85,6 +86,25 @@ dashboard:
 poller:
   username: nv2Mwx7gu9AbLGyz
   polling_interval: 21600
+  polling_engine: AsyncIO
+  polling_jitter: 0.2
+  polling_timeout: 120
+  breaker_threshold: 5
+  breaker_backoff: 60
+  polling_concurrency: 250
+  zone_concurrency: 30
+  snmp_max_sessions: 12
+  snmp_context_concurrency: 6
+  snmp_max_repetitions: 40
+  snmp_adaptive_repetitions: True
+  snmp_capabilities_interval: 3600
+  snmp_incremental_cycles: 12
+  server_batch_size: 25
+  server_batch_interval: 5
+  server_pool_size: 20
+  spool_concurrency: 3
+  spool_interval: 30
+  spool_size: 64
   server_address: bwSeAzPmAygg8rcJ
   server_bind_port: 9876
   server_username: null
@@ -92,9 +112,11 @@ poller:
   server_https: False
   zones:
     - zone: SITE-A
+      polling_interval: 300
       hostnames:
         - hostname1
-        - hostname2
+        - hostname: hostname2
+          polling_interval: 60
         - hostname3
     - zone: SITE-B
       hostnames:
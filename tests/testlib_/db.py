@@ -84,6 +84,9 @@ The database under test must be named {}""".format(
             with Session(bind=connection) as session:
                 models.BASE.metadata.drop_all(session.get_bind())
 
+        # The OUIs cached by the process are gone too
+        oui.invalidate()
+
     def create(self):
         """Create database.
 
@@ -0,0 +1,43 @@
+"""Module of SNMP objects required for testing."""
+
+# Application imports
+from switchmap.poller import POLL, SNMP
+from switchmap.poller.snmp import snmp_manager
+from switchmap.poller.snmp import simulator
+
+
+def interact(values):
+    """Create an Interact object that answers from values, not a device.
+
+    Args:
+        values: Dict of [value, snmp_type] lists keyed by OID
+
+    Returns:
+        result: Tuple of the Interact object and the simulator.Agent
+            session answering its queries
+
+    """
+    # Initialize key variables
+    authorization = SNMP(
+        enabled=True,
+        group="public",
+        version=2,
+        secname=None,
+        authprotocol=None,
+        authpassword=None,
+        privprotocol=None,
+        privpassword=None,
+        port=161,
+        community="public",
+    )
+    agent = simulator.Agent(values)
+
+    # Use the agent as the session of the default context
+    device = snmp_manager.Interact(
+        POLL(hostname="localhost", authorization=authorization)
+    )
+    device._sessions[""] = agent
+
+    # Return
+    result = (device, agent)
+    return result